@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import float as Float, int as Int, str as Str
+from os.path import abspath, dirname
+from sys import path as paths
+from time import perf_counter
+from typing import Callable, Dict, List
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from benchmarks.map import payload
+from society.codec import pack, unpack
+from society.typing.map import Map
+
+
+def roundtrip( edges:Int=20000, rounds:Int=5 ) -> Dict[Str,Dict[Str,Float]]:
+
+	"""
+	Measure encoding and decoding Map through Json text against
+	the binary codec, the best of rounds
+
+	:params Int edges
+		The number of edges in the payload
+	:params Int rounds
+		The number of measurement for each method
+
+	:return Dict<Str,Dict<Str,Float>>
+	"""
+
+	instance = Map( payload( edges ) )
+	encoded = { "json": instance.__serialize__().encode( "utf-8" ), "codec": pack( instance ) }
+	methods:Dict[Str,Dict[Str,Callable[[],List]]] = {
+		"json": {
+			"encode": lambda: instance.__serialize__().encode( "utf-8" ),
+			"decode": lambda: Map.fromJson( encoded['json'] )
+		},
+		"codec": {
+			"encode": lambda: pack( instance ),
+			"decode": lambda: unpack( encoded['codec'] )
+		}
+	}
+	results = {}
+	for method, callbacks in methods.items():
+		results[method] = { "bytes": len( encoded[method] ) }
+		for operation, callback in callbacks.items():
+			elapsed = []
+			for _ in range( rounds ):
+				started = perf_counter()
+				callback()
+				elapsed.append( perf_counter() - started )
+			results[method][operation] = min( elapsed )
+	return results
+
+
+if __name__ == "__main__":
+	for method, result in roundtrip().items():
+		print( "roundtrip {:<5} {:>10} bytes encode {:>8.1f} ms decode {:>8.1f} ms".format( method, result['bytes'], result['encode'] * 1e3, result['decode'] * 1e3 ) )
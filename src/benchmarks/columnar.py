@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import float as Float, int as Int, str as Str
+from os.path import abspath, dirname
+from sys import path as paths
+from time import perf_counter
+from typing import Callable, Dict, List
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from benchmarks.map import payload
+from society.typing.columnar import columnar
+from society.typing.map import Map
+from society.typing.query import Query
+
+
+def aggregation( edges:Int=100000 ) -> Dict[Str,Float]:
+
+	"""
+	Measure the sum of member counts of edges, converting rows
+	through __props__ against building the columns in single pass
+
+	:params Int edges
+		The number of edges in the payload
+
+	:return Dict<Str,Float>
+	"""
+
+	nodes = Query( "data.user.edges[*].node" )( Map( payload( edges ) ) )
+	methods:Dict[Str,Callable[[],List]] = {
+		"props": lambda: sum( row['members']['count'] for row in [ node.__props__() for node in nodes ] ),
+		"columnar": lambda: sum( columnar( nodes, [ "id", "members.count" ] )['members.count'] )
+	}
+	results = {}
+	for method, callback in methods.items():
+		started = perf_counter()
+		callback()
+		results[method] = perf_counter() - started
+	return results
+
+
+if __name__ == "__main__":
+	for method, elapsed in aggregation().items():
+		print( "aggregation {:<8} {:>8.1f} ms".format( method, elapsed * 1e3 ) )
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import float as Float, int as Int, str as Str
+from contextlib import redirect_stdout
+from io import StringIO
+from os.path import abspath, dirname, getsize
+from pyzstd import decompress
+from sys import path as paths
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.archive import Archive
+from society.clock import Clock
+from society.logging import Logging
+from society.typing.properties import Properties
+
+
+def archiving( records:Int=200000, threads:Int=8 ) -> Dict[Str,Float]:
+
+	"""
+	Measure the compression of log file into indexed segment and
+	the query of one thread, of error records and of one minute
+	through the index against decompressing and scanning the whole
+	segment
+
+	:params Int records
+		The number of records of log file
+	:params Int threads
+		The number of interleaved threads
+
+	:return Dict<Str,Float>
+		Sizes in bytes, compression ratio and seconds of each query
+	"""
+
+	results = {}
+	with TemporaryDirectory() as directory:
+		marks = []
+		offset = 0
+		with open( f"{directory}/society.log", "wb" ) as fwrite:
+			for i in range( records ):
+				thread = i % threads + 1
+				level = Logging.Error if i % 997 == 0 else Logging.Info
+				time = 1700000000 + i // 50
+				line = "-- [{}] -- {} {} Downloading chunk {} of {} url=\"https://example.com/{}\"\n".format( Logging.Levels[level], Clock.format( Logging.DateTimeFormat, time ), thread, i, records, i * 7919 % 100003 ).encode( "utf-8" )
+				fwrite.write( line )
+				marks.append(( offset, len( line ), time, level, Str( thread ) ))
+				offset += len( line )
+		results['raw'] = offset
+		started = perf_counter()
+		Archive.compress( f"{directory}/society.log", marks, f"{directory}/society.1.log" )
+		results['compress'] = perf_counter() - started
+		segment = f"{directory}/society.1.log"
+		results['segment'] = getsize( f"{segment}.zst" )
+		results['index'] = getsize( f"{segment}.idx" )
+		results['ratio'] = offset / results['segment']
+		started = perf_counter()
+		with open( f"{segment}.zst", "rb" ) as fread:
+			lines = [ line for line in decompress( fread.read() ).decode( "utf-8" ).splitlines() if line.split( " ", 6 )[5] == "3" ]
+		results['scan'] = perf_counter() - started
+		started = perf_counter()
+		matched = "".join( Archive.search( segment, thread="3" ) ).splitlines()
+		results['thread'] = perf_counter() - started
+		assert matched == lines
+		started = perf_counter()
+		list( Archive.search( segment, level=Logging.Error ) )
+		results['errors'] = perf_counter() - started
+		started = perf_counter()
+		list( Archive.search( segment, since=1700000000 + records // 100, until=1700000000 + records // 100 + 60 ) )
+		results['minute'] = perf_counter() - started
+	return results
+
+
+def throughput( calls:Int=20000 ) -> Dict[Str,Float]:
+
+	"""
+	Measure log calls per second by environment, in Json mode, of
+	repeated calls collapsed and of the calls below minimum level,
+	the output is written into memory instead of terminal screen
+
+	:params Int calls
+		The number of log calls for each environment
+
+	:return Dict<Str,Float>
+		Calls per second by environment, json, suppressed and filtered
+	"""
+
+	results = {}
+	environment = Properties.Environment
+	try:
+		for mode in [ "development", "production" ]:
+			Properties.Environment = mode
+			with redirect_stdout( StringIO() ):
+				started = perf_counter()
+				for i in range( calls ):
+					Logging.info( "Downloading chunk {} of {}", i, calls )
+					Logging.info( "Retry request {}", i, thread=1 )
+				elapsed = perf_counter() - started
+			results[mode] = calls * 2 / elapsed
+		Logging.Mode = "json"
+		with redirect_stdout( StringIO() ):
+			started = perf_counter()
+			for i in range( calls ):
+				Logging.info( "Downloading chunk {index} of {calls}", index=i, calls=calls )
+				Logging.info( "Retry request {}", i, thread=1 )
+			results['json'] = calls * 2 / ( perf_counter() - started )
+		Logging.Mode = "text"
+		Logging.Collapsing = { "Downloading chunk {} of {}": 1.0, "Retry request {}": 1.0 }
+		with redirect_stdout( StringIO() ):
+			started = perf_counter()
+			for i in range( calls ):
+				Logging.info( "Downloading chunk {} of {}", i, calls )
+				Logging.info( "Retry request {}", i, thread=1 )
+			results['suppressed'] = calls * 2 / ( perf_counter() - started )
+			Logging.flush()
+		Logging.Collapsing = {}
+		Logging.configure( "error" )
+		started = perf_counter()
+		for i in range( calls ):
+			Logging.debug( "Downloading chunk {} of {}", i, calls )
+			Logging.info( "Retry request {}", i, thread=1 )
+		results['filtered'] = calls * 2 / ( perf_counter() - started )
+	finally:
+		Logging.configure()
+		Logging.Collapsing = {}
+		Properties.Environment = environment
+	return results
+
+
+if __name__ == "__main__":
+	for name, value in archiving().items():
+		print( "archiving  {:<12} {:>10.3f}".format( name, value ) )
+	for mode, rate in throughput().items():
+		print( "throughput {:<12} {:>10.0f} calls/s".format( mode, rate ) )
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import bool as Bool, float as Float, int as Int, str as Str
+from copy import deepcopy
+from io import BytesIO
+from json import dumps as encoder, loads as decoder
+from os.path import abspath, dirname
+from sys import path as paths
+from tempfile import TemporaryFile
+from time import perf_counter
+from tracemalloc import get_traced_memory, start as tracestart, stop as tracestop
+from typing import Any, Callable, Dict, List
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.typing.map import Map
+
+
+def builders( edges:Int=10000 ) -> Dict[Str,Float]:
+
+	"""
+	Measure how many classes and how much memory decoding nested
+	payload into typed Map subclass creates
+
+	:params Int edges
+		The number of edges in the payload
+
+	:return Dict<Str,Float>
+	"""
+
+	class Response( Map ):
+		def __init__( self, collection:Map, operation:Str ) -> None:
+			Map.__init__( self, collection )
+			self.__dict__['__operation__'] = operation
+
+	def walk( value:Any ) -> None:
+		if isinstance( value, Map ):
+			classes.add( type( value ) )
+			for _, item in value:
+				walk( item )
+		elif isinstance( value, list ):
+			for item in value:
+				walk( item )
+
+	classes = set()
+	collection = Map( payload( edges )['data']['user'] )
+	tracestart()
+	started = perf_counter()
+	instance = Response( collection, "user" )
+	elapsed = perf_counter() - started
+	peak = get_traced_memory()[1]
+	tracestop()
+	walk( instance )
+	return { "seconds": elapsed, "peak": peak, "classes": len( classes ) }
+
+def construction( edges:Int=10000, lazy:Bool=False ) -> Dict[Str,Float]:
+
+	"""
+	Measure Map construction time and peak memory for a payload
+	where only a couple of fields are read afterwards
+
+	:params Int edges
+		The number of edges in the payload
+	:params Bool lazy
+		Construct the Map with lazy materialization
+
+	:return Dict<Str,Float>
+	"""
+
+	collection = payload( edges )
+	tracestart()
+	started = perf_counter()
+	instance = Map( collection, lazy=lazy )
+	instance['data']['user']['id']
+	instance['data']['user']['name']
+	elapsed = perf_counter() - started
+	peak = get_traced_memory()[1]
+	tracestop()
+	return { "seconds": elapsed, "peak": peak }
+
+def decoding( edges:Int=100000 ) -> Dict[Str,Dict[Str,Float]]:
+
+	"""
+	Measure decoding Json into Map, through dict tree then Map
+	against Map.fromJson and incremental Map.fromJson over stream
+
+	:params Int edges
+		The number of edges in the payload
+
+	:return Dict<Str,Dict<Str,Float>>
+	"""
+
+	document = encoder( payload( edges ) ).encode( "utf-8" )
+	records = encoder( payload( edges )['data']['user']['edges'] ).encode( "utf-8" )
+	methods:Dict[Str,Callable[[],Any]] = {
+		"loads+Map": lambda: Map( decoder( document ) ),
+		"fromJson": lambda: Map.fromJson( document ),
+		"incremental": lambda: [ None for _ in Map.fromJson( BytesIO( records ), incremental=True ) ]
+	}
+	results = {}
+	for method, callback in methods.items():
+		started = perf_counter()
+		callback()
+		elapsed = perf_counter() - started
+		tracestart()
+		callback()
+		peak = get_traced_memory()[1]
+		tracestop()
+		results[method] = { "seconds": elapsed, "peak": peak }
+	return results
+
+def lookups( sizes:List[Int]=None, rounds:Int=100000 ) -> Dict[Int,Float]:
+
+	"""
+	Measure the average cost of Map lookup by number of keys
+
+	:params List<Int> sizes
+		The number of keys for each Map
+	:params Int rounds
+		The number of lookups for each Map
+
+	:return Dict<Int,Float>
+		Nanoseconds per lookup by number of keys
+	"""
+
+	results = {}
+	for size in sizes if sizes is not None else [ 10, 100, 1000, 10000 ]:
+		instance = Map({ f"keyset{i}": i for i in range( size ) })
+		keysets = [ f"keyset{i}" for i in range( 0, size, max( 1, size // 10 ) ) ]
+		started = perf_counter()
+		for i in range( rounds ):
+			keyset = keysets[i % len( keysets )]
+			instance[keyset]
+			getattr( instance, keyset )
+			keyset in instance
+		results[size] = ( perf_counter() - started ) / ( rounds * 3 ) * 1e9
+	return results
+
+def merging( sizes:List[Int]=None ) -> Dict[Int,Dict[Str,Float]]:
+
+	"""
+	Measure merging two pages of edges where half of the edges are
+	overlap, compared by whole item and by identity of Map type
+
+	:params List<Int> sizes
+		The number of edges for each page
+
+	:return Dict<Int,Dict<Str,Float>>
+	"""
+
+	class Edges( Map ):
+		__identity__ = staticmethod( lambda edge: edge['node']['id'] )
+
+	results = {}
+	for size in sizes if sizes is not None else [ 1000, 10000, 50000 ]:
+		edges = payload( size + size // 2 )['data']['user']['edges']
+		results[size] = {}
+		for method, Type in { "fingerprint": Map, "identity": Edges }.items():
+			instance = Type({ "edges": edges[:size] })
+			started = perf_counter()
+			instance['edges'] = edges[size // 2:]
+			results[size][method] = perf_counter() - started
+	return results
+
+def patching( edges:Int=10000, changes:Int=10 ) -> Dict[Str,Float]:
+
+	"""
+	Measure Map.diff against unchanged and slightly changed payload
+	and the size of patch against the whole Json document
+
+	:params Int edges
+		The number of edges in the payload
+	:params Int changes
+		The number of changed edges
+
+	:return Dict<Str,Float>
+	"""
+
+	class Edges( Map ):
+		__identity__ = staticmethod( lambda edge: edge['node']['id'] if "node" in edge else None )
+
+	instance = Edges( payload( edges ) )
+	changed = payload( edges )
+	for i in range( changes ):
+		changed['data']['user']['edges'][i * ( edges // changes )]['node']['members']['count'] += 1
+	started = perf_counter()
+	unchanged = instance.diff( payload( edges ) )
+	elapsed = perf_counter() - started
+	started = perf_counter()
+	patch = instance.diff( changed )
+	patched = perf_counter() - started
+	started = perf_counter()
+	instance.apply( patch )
+	applied = perf_counter() - started
+	return {
+		"unchanged": elapsed,
+		"changed": patched,
+		"apply": applied,
+		"empty": len( unchanged ) == 0,
+		"patch": len( encoder( patch ) ),
+		"document": len( encoder( changed ) )
+	}
+
+def payload( edges:Int ) -> Dict[Str,Any]:
+
+	"""
+	Return synthetic GraphQL shaped payload
+
+	:params Int edges
+		The number of edges in the payload
+
+	:return Dict<Str,Any>
+	"""
+
+	return {
+		"data": {
+			"user": {
+				"__typename": "User",
+				"id": "100000000000001",
+				"name": "Society",
+				"edges": [
+					{
+						"cursor": f"cursor{i}",
+						"node": {
+							"__typename": "Group",
+							"id": str( 200000000000000 + i ),
+							"name": f"Group {i}",
+							"url": f"https://www.facebook.com/groups/{i}",
+							"members": { "count": i * 7 },
+							"tags": [ "public", "society" ]
+						}
+					}
+					for i in range( edges )
+				]
+			}
+		}
+	}
+
+def records( edges:Int=100000 ) -> Dict[Str,Dict[Str,Float]]:
+
+	"""
+	Measure time and retained memory of constructing Map for each
+	node of the edges, one by one against Map.fromRecords
+
+	:params Int edges
+		The number of edges in the payload
+
+	:return Dict<Str,Dict<Str,Float>>
+	"""
+
+	nodes = [ edge['node'] for edge in payload( edges )['data']['user']['edges'] ]
+	methods:Dict[Str,Callable[[],Any]] = {
+		"Map": lambda: [ Map( node ) for node in nodes ],
+		"fromRecords": lambda: Map.fromRecords( nodes ),
+		"fromRecords+lazy": lambda: Map.fromRecords( nodes, lazy=True )
+	}
+	results = {}
+	for method, callback in methods.items():
+		started = perf_counter()
+		callback()
+		elapsed = perf_counter() - started
+		tracestart()
+		instances = callback()
+		retained = get_traced_memory()[0]
+		tracestop()
+		del instances
+		results[method] = { "seconds": elapsed, "retained": retained }
+	return results
+
+def serialization( megabytes:List[Int]=None ) -> Dict[Int,Dict[Str,Dict[Str,Float]]]:
+
+	"""
+	Measure Map serialization time and peak memory, the previous
+	path (__props__ copy then json.dumps) against the single pass
+	encoder returning string and writing into a file
+
+	:params List<Int> megabytes
+		The approximate size of Json output
+
+	:return Dict<Int,Dict<Str,Dict<Str,Float>>>
+	"""
+
+	results = {}
+	length = len( encoder( payload( 100 ) ) ) / 100
+	for megabyte in megabytes if megabytes is not None else [ 1, 10, 100 ]:
+		instance = Map( payload( int( megabyte * 1024 * 1024 / length ) ) )
+		with TemporaryFile( "wb" ) as fopen:
+			methods:Dict[Str,Callable[[],Any]] = {
+				"props+dumps": lambda: encoder( instance.__props__(), default=str ),
+				"serialize": lambda: instance.__serialize__(),
+				"serialize+file": lambda: instance.__serialize__( fopen )
+			}
+			results[megabyte] = {}
+			for method, callback in methods.items():
+				fopen.seek( 0 )
+				fopen.truncate()
+				started = perf_counter()
+				callback()
+				elapsed = perf_counter() - started
+				fopen.seek( 0 )
+				fopen.truncate()
+				tracestart()
+				callback()
+				peak = get_traced_memory()[1]
+				tracestop()
+				results[megabyte][method] = { "seconds": elapsed, "peak": peak }
+	return results
+
+
+def snapshots( edges:Int=100000 ) -> Dict[Str,Float]:
+
+	"""
+	Measure taking snapshot of Map against deep copy, and the cost
+	of write and access to edges after snapshot
+
+	:params Int edges
+		The number of edges in the payload
+
+	:return Dict<Str,Float>
+	"""
+
+	instance = Map( payload( edges ) )
+	methods:Dict[Str,Callable[[],Any]] = {
+		"deepcopy": lambda: deepcopy( instance.__props__() ),
+		"snapshot": lambda: instance.snapshot(),
+		"write": lambda: instance['data']['user'].__setitem__( "name", "Snapshot" ),
+		"edges": lambda: instance['data']['user']['edges']
+	}
+	results = {}
+	for method, callback in methods.items():
+		started = perf_counter()
+		callback()
+		results[method] = perf_counter() - started
+	return results
+
+
+if __name__ == "__main__":
+	for size, elapsed in lookups().items():
+		print( "lookup keys={:<6} {:>8.1f} ns/op".format( size, elapsed ) )
+	for lazy in [ False, True ]:
+		result = construction( lazy=lazy )
+		print( "construction lazy={:<6} {:>8.1f} ms {:>10} bytes peak".format( str( lazy ), result['seconds'] * 1e3, result['peak'] ) )
+	for size, methods in merging().items():
+		for method, elapsed in methods.items():
+			print( "merging edges={:<6} {:<11} {:>8.1f} ms".format( size, method, elapsed * 1e3 ) )
+	for method, result in decoding().items():
+		print( "decoding {:<11} {:>8.1f} ms {:>10} bytes peak".format( method, result['seconds'] * 1e3, result['peak'] ) )
+	for method, result in records().items():
+		print( "records {:<16} {:>8.1f} ms {:>10} bytes retained".format( method, result['seconds'] * 1e3, result['retained'] ) )
+	result = patching()
+	print( "patching unchanged={:.1f} ms changed={:.1f} ms apply={:.3f} ms {} bytes patch {} bytes document".format( result['unchanged'] * 1e3, result['changed'] * 1e3, result['apply'] * 1e3, result['patch'], result['document'] ) )
+	for method, elapsed in snapshots().items():
+		print( "snapshots {:<8} {:>8.3f} ms".format( method, elapsed * 1e3 ) )
+	result = builders()
+	print( "builders classes={:<6} {:>8.1f} ms {:>10} bytes peak".format( result['classes'], result['seconds'] * 1e3, result['peak'] ) )
+	for megabyte, methods in serialization().items():
+		for method, result in methods.items():
+			print( "serialization size={:<4}MB {:<15} {:>8.1f} ms {:>10} bytes peak".format( megabyte, method, result['seconds'] * 1e3, result['peak'] ) )
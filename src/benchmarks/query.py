@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import float as Float, int as Int, str as Str
+from os.path import abspath, dirname
+from sys import path as paths
+from time import perf_counter
+from typing import Callable, Dict, List
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from benchmarks.map import payload
+from society.typing.map import Map
+from society.typing.query import Query
+
+
+def extraction( edges:Int=20000, payloads:Int=20000 ) -> Dict[Str,Dict[Str,Float]]:
+
+	"""
+	Measure field extraction by chained lookups against compiled
+	Query, over a single large payload and over many small payloads
+
+	:params Int edges
+		The number of edges in the large payload
+	:params Int payloads
+		The number of small payloads
+
+	:return Dict<Str,Dict<Str,Float>>
+	"""
+
+	results = {}
+	single = Map( payload( edges ) )
+	multiple = [ Map( payload( 1 ) ) for _ in range( payloads ) ]
+	counter = Query( "data.user.edges[*].node.members.count" )
+	identity = Query( "data.user.edges[0].node.id" )
+	scenarios:Dict[Str,Dict[Str,Callable[[],List]]] = {
+		"wildcard": {
+			"chain": lambda: [ edge['node']['members']['count'] for edge in single['data']['user']['edges'] ],
+			"query": lambda: counter( single )
+		},
+		"many": {
+			"chain": lambda: [ collection['data']['user']['edges'][0]['node']['id'] for collection in multiple ],
+			"query": lambda: identity.many( multiple )
+		}
+	}
+	for scenario, methods in scenarios.items():
+		results[scenario] = {}
+		for method, callback in methods.items():
+			started = perf_counter()
+			callback()
+			results[scenario][method] = perf_counter() - started
+	return results
+
+
+if __name__ == "__main__":
+	for scenario, methods in extraction().items():
+		for method, elapsed in methods.items():
+			print( "extraction {:<8} {:<5} {:>8.1f} ms".format( scenario, method, elapsed * 1e3 ) )
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import float as Float, int as Int, str as Str
+from os.path import abspath, dirname
+from sys import path as paths
+from time import perf_counter
+from tracemalloc import get_traced_memory, start as tracestart, stop as tracestop
+from typing import Any, Callable, Dict
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from benchmarks.map import payload
+from society.typing.map import Map
+from society.typing.record import Records
+
+
+def parsing( edges:Int=100000 ) -> Dict[Str,Dict[Str,Float]]:
+
+	"""
+	Measure converting payload into Map against generated slotted
+	records, then reading the fields of every node
+
+	:params Int edges
+		The number of edges in the payload
+
+	:return Dict<Str,Dict<Str,Float>>
+	"""
+
+	records = Records.fromSamples([ payload( 10 ) ])
+	collection = payload( edges )
+	methods:Dict[Str,Callable[[],Any]] = {
+		"Map": lambda: Map( collection ),
+		"Records": lambda: records( collection )
+	}
+	results = {}
+	for method, callback in methods.items():
+		started = perf_counter()
+		instance = callback()
+		elapsed = perf_counter() - started
+		nodes = [ edge['node'] for edge in instance['data']['user']['edges'] ]
+		started = perf_counter()
+		for node in nodes:
+			node.id
+			node.name
+			node.members
+		access = perf_counter() - started
+		del instance, nodes
+		tracestart()
+		instance = callback()
+		retained = get_traced_memory()[0]
+		tracestop()
+		del instance
+		results[method] = { "seconds": elapsed, "access": access, "retained": retained }
+	return results
+
+
+if __name__ == "__main__":
+	for method, result in parsing().items():
+		print( "parsing {:<8} {:>8.1f} ms access {:>8.1f} ms {:>10} bytes retained".format( method, result['seconds'] * 1e3, result['access'] * 1e3, result['retained'] ) )
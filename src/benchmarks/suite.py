@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from argparse import ArgumentParser
+from builtins import bool as Bool, float as Float, int as Int, str as Str
+from json import dump, dumps as encoder, load
+from os.path import abspath, dirname, isfile, join
+from platform import machine, platform, python_implementation, python_version
+from sys import exit as systemExit, path as paths, stderr, stdout
+from time import perf_counter
+from tracemalloc import get_traced_memory, start as tracestart, stop as tracestop
+from typing import Any, Callable, Dict, List, Tuple
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from benchmarks.map import payload
+from society.typing.map import Map
+
+
+Baseline:Str = join( dirname( abspath( __file__ ) ), "baseline.json" )
+""" Stored results of the reference environment, CPython 3.11 on Linux x86_64 """
+
+Sizes:Dict[Str,Int] = {
+	"1KB": 1024,
+	"10KB": 10 * 1024,
+	"100KB": 100 * 1024,
+	"1MB": 1024 * 1024,
+	"10MB": 10 * 1024 * 1024,
+	"50MB": 50 * 1024 * 1024
+}
+""" Approximate Json size of the synthetic payload by label """
+
+
+def cases() -> Dict[Str,Tuple[Callable[[Dict[Str,Any]],Any],Callable[[Any],Any]]]:
+
+	"""
+	Return the benchmark cases, the setup of each case is not
+	measured and returns the argument of the measured callback
+
+	:return Dict<Str,Tuple<Callable,Callable>>
+	"""
+
+	def access( instance:Map ) -> None:
+		for edge in instance['data']['user']['edges']:
+			edge['node']['members']['count']
+			edge.node.name
+
+	def contains( instance:Map ) -> None:
+		for edge in instance['data']['user']['edges']:
+			"node" in edge
+			"missing" in edge
+
+	def iterate( value:Any ) -> None:
+		for _, item in value:
+			if isinstance( item, Map ):
+				iterate( item )
+			elif isinstance( item, list ):
+				for element in item:
+					if isinstance( element, Map ):
+						iterate( element )
+
+	def merging( collection:Dict[Str,Any] ) -> Tuple[Map,Dict[Str,Any]]:
+		edges = collection['data']['user']['edges']
+		return ( Map( collection ), { "name": "Update", "edges": edges[len( edges ) // 2:] + edges[:1] } )
+
+	return {
+		"construction": ( lambda collection: collection, lambda collection: Map( collection ) ),
+		"access": ( Map, access ),
+		"contains": ( Map, contains ),
+		"update": ( merging, lambda arguments: arguments[0]['data']['user'].update( arguments[1] ) ),
+		"props": ( Map, lambda instance: instance.__props__() ),
+		"serialize": ( Map, lambda instance: instance.__serialize__() ),
+		"iteration": ( Map, iterate )
+	}
+
+def compare( current:Dict[Str,Any], baseline:Dict[Str,Any], threshold:Float=0.2 ) -> List[Dict[Str,Any]]:
+
+	"""
+	Return the regressions of current results against baseline,
+	the results which are slower or bigger than the threshold
+
+	:params Dict<Str,Any> current
+	:params Dict<Str,Any> baseline
+	:params Float threshold
+		The allowed ratio of regression, e.g 0.2 for 20%
+
+	:return List<Dict<Str,Any>>
+	"""
+
+	regressions = []
+	for case, sizes in current['results'].items():
+		for size, value in sizes.items():
+			previous = baseline.get( "results", {} ).get( case, {} ).get( size )
+			if not previous or value <= previous * ( 1 + threshold ):
+				continue
+			regressions.append({ "case": case, "size": size, "baseline": previous, "current": value, "ratio": value / previous })
+	return regressions
+
+def measure( setup:Callable[[Dict[Str,Any]],Any], callback:Callable[[Any],Any], collection:Dict[Str,Any], repeats:Int=5, budget:Float=1.0 ) -> Float:
+
+	"""
+	Return the best elapsed seconds of the callback, repeated until
+	the number of repeats or the time budget is reached
+
+	:params Callable setup
+	:params Callable callback
+	:params Dict<Str,Any> collection
+	:params Int repeats
+	:params Float budget
+		The seconds after which no more repeat is started
+
+	:return Float
+	"""
+
+	best = None
+	total = 0.0
+	for _ in range( max( 1, repeats ) ):
+		argument = setup( collection )
+		started = perf_counter()
+		callback( argument )
+		elapsed = perf_counter() - started
+		del argument
+		best = elapsed if best is None else min( best, elapsed )
+		total += elapsed
+		if total >= budget:
+			break
+	return best
+
+def memory( collection:Dict[Str,Any] ) -> Int:
+
+	"""
+	Return the retained bytes of Map constructed from collection
+
+	:params Dict<Str,Any> collection
+
+	:return Int
+	"""
+
+	tracestart()
+	instance = Map( collection )
+	retained = get_traced_memory()[0]
+	tracestop()
+	del instance
+	return retained
+
+def run( sizes:List[Str]=None, selected:List[Str]=None, repeats:Int=5, budget:Float=1.0 ) -> Dict[Str,Any]:
+
+	"""
+	Run the benchmark cases over each payload size
+
+	:params List<Str> sizes
+		The labels of Sizes, all when None
+	:params List<Str> selected
+		The names of cases, all when None
+	:params Int repeats
+	:params Float budget
+
+	:return Dict<Str,Any>
+	"""
+
+	length = len( encoder( payload( 100 ) ) ) / 100
+	results = {}
+	for size in sizes if sizes is not None else list( Sizes ):
+		collection = payload( max( 1, int( Sizes[size] / length ) ) )
+		for case, ( setup, callback ) in cases().items():
+			if selected is None or case in selected:
+				results.setdefault( case, {} )[size] = measure( setup, callback, collection, repeats, budget )
+		if selected is None or "memory" in selected:
+			results.setdefault( "memory", {} )[size] = memory( collection )
+	return {
+		"environment": {
+			"implementation": python_implementation(),
+			"machine": machine(),
+			"platform": platform(),
+			"python": python_version()
+		},
+		"units": { "memory": "bytes", "default": "seconds" },
+		"results": results
+	}
+
+
+if __name__ == "__main__":
+	parser = ArgumentParser( description="Benchmark suite of society.typing.map.Map" )
+	parser.add_argument( "--size", action="append", choices=list( Sizes ), help="Payload size, repeatable, all by default" )
+	parser.add_argument( "--case", action="append", choices=[ *cases(), "memory" ], help="Benchmark case, repeatable, all by default" )
+	parser.add_argument( "--repeats", type=int, default=5, help="Maximum repeats of each case, the best is reported" )
+	parser.add_argument( "--budget", type=float, default=1.0, help="Seconds after which no more repeat is started" )
+	parser.add_argument( "--output", help="Write the Json results into file instead of stdout" )
+	parser.add_argument( "--baseline", nargs="?", const=Baseline, help="Compare the results against stored baseline Json, benchmarks/baseline.json by default which is recorded on the reference environment, refresh it with --output benchmarks/baseline.json on that environment" )
+	parser.add_argument( "--threshold", type=float, default=0.2, help="Allowed ratio of regression against baseline" )
+	arguments = parser.parse_args()
+	current = run( arguments.size, arguments.case, arguments.repeats, arguments.budget )
+	if arguments.output:
+		with open( arguments.output, "w", encoding="utf-8" ) as fopen:
+			dump( current, fopen, indent=4 )
+	else:
+		dump( current, stdout, indent=4 )
+		stdout.write( "\n" )
+	if arguments.baseline:
+		if not isfile( arguments.baseline ):
+			systemExit( f"Baseline {arguments.baseline} does not exist, store the results with --output first" )
+		with open( arguments.baseline, "r", encoding="utf-8" ) as fopen:
+			baseline = load( fopen )
+		if baseline.get( "environment" ) != current['environment']:
+			print( "warning baseline is recorded on {}, the results are not comparable across environments".format( encoder( baseline.get( "environment" ) ) ), file=stderr )
+		regressions = compare( current, baseline, arguments.threshold )
+		for regression in regressions:
+			print( "regression {case:<12} {size:<6} {baseline:>14.6g} -> {current:<14.6g} x{ratio:.2f}".format( **regression ), file=stderr )
+		if regressions:
+			systemExit( 1 )
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from array import array
+from builtins import float as Float, int as Int, str as Str
+from os import listdir, path, remove, rename
+from pyzstd import compress as ZstdCompress, decompress as ZstdDecompress
+from sqlite3 import connect
+from typing import Final, final, Iterator, List, Sequence, Tuple, Union
+
+
+Mark = Tuple[Int,Int,Float,Int,Str]
+""" The record of log file, offset, length, time, level and thread """
+
+
+@final
+class Archive:
+	
+	"""
+	Compressed segments of the closed log files, each segment is
+	a sequence of independent zstd frames with a SQLite sidecar
+	index, the index keeps the time range of each level and thread
+	by frame and the packed lines, time, level and thread of the
+	records, so the query decompress only the frames having matched
+	records
+	"""
+	
+	Block:Int = 256 * 1024
+	""" Maximum uncompressed bytes of each frame """
+	
+	Compression:Int = 6
+	""" The zstd compression level """
+	
+	Schema:Final[Str] = """
+		CREATE TABLE blocks ( id INTEGER PRIMARY KEY, offset INTEGER NOT NULL, length INTEGER NOT NULL, size INTEGER NOT NULL, count INTEGER NOT NULL, records BLOB NOT NULL );
+		CREATE TABLE threads ( id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE );
+		CREATE TABLE ranges ( block INTEGER NOT NULL, level INTEGER NOT NULL, thread INTEGER NOT NULL, start INTEGER NOT NULL, stop INTEGER NOT NULL );
+		CREATE INDEX ranges_thread ON ranges ( thread, level );
+	"""
+	""" The sidecar index schema """
+	
+	def __init__( self ) -> None:
+		
+		""" Construct method of class Archive """
+		
+		raise NotImplementedError( "Archive class is not initializable" )
+	
+	@staticmethod
+	def compress( source:Str, marks:Sequence[Mark], target:Str ) -> None:
+		
+		"""
+		Compress the log file into segment target.zst with the
+		sidecar index target.idx, the records are never split
+		across frames, the log file is removed after the segment
+		has been written
+		
+		:params Str source
+			The closed log file
+		:params Sequence<Mark> marks
+			The records of log file ordered by offset
+		:params Str target
+			The segment name without extension
+		
+		:return None
+		"""
+		
+		with open( source, "rb" ) as fread:
+			data = fread.read()
+		blocks = []
+		ranges = []
+		threads = {}
+		offset = 0
+		with open( f"{target}.zst.tmp", "wb" ) as fwrite:
+			index = 0
+			while index < len( marks ):
+				start = marks[index][0]
+				stop = index + 1
+				while stop < len( marks ) and marks[stop][0] + marks[stop][1] - start <= Archive.Block:
+					stop += 1
+				block = len( blocks ) + 1
+				lines = array( "I" )
+				levels = array( "B" )
+				names = array( "I" )
+				times = array( "q" )
+				keysets = {}
+				previous = 0
+				for position, length, time, level, thread in marks[index:stop]:
+					second = int( time )
+					ident = threads.setdefault( thread, len( threads ) + 1 )
+					lines.append( max( 1, data.count( b"\x0a", position, position + length ) ) )
+					levels.append( level )
+					names.append( ident )
+					times.append( second - previous )
+					previous = second
+					lower, upper = keysets.get( ( level, ident ), ( second, second ) )
+					keysets[( level, ident )] = ( min( lower, second ), max( upper, second ) )
+				raw = data[start:marks[stop - 1][0] + marks[stop - 1][1]]
+				frame = ZstdCompress( raw, Archive.Compression )
+				fwrite.write( frame )
+				records = ZstdCompress( lines.tobytes() + times.tobytes() + levels.tobytes() + names.tobytes(), Archive.Compression )
+				blocks.append(( block, offset, len( frame ), len( raw ), len( lines ), records ))
+				ranges.extend( ( block, level, ident, lower, upper ) for ( level, ident ), ( lower, upper ) in keysets.items() )
+				offset += len( frame )
+				index = stop
+		if path.exists( f"{target}.idx.tmp" ):
+			remove( f"{target}.idx.tmp" )
+		connection = connect( f"{target}.idx.tmp" )
+		try:
+			connection.executescript( Archive.Schema )
+			connection.executemany( "INSERT INTO blocks VALUES ( ?, ?, ?, ?, ?, ? )", blocks )
+			connection.executemany( "INSERT INTO threads VALUES ( ?, ? )", ( ( ident, name ) for name, ident in threads.items() ) )
+			connection.executemany( "INSERT INTO ranges VALUES ( ?, ?, ?, ?, ? )", ranges )
+			connection.commit()
+		finally:
+			connection.close()
+		rename( f"{target}.idx.tmp", f"{target}.idx" )
+		rename( f"{target}.zst.tmp", f"{target}.zst" )
+		remove( source )
+	
+	@staticmethod
+	def query( directory:Str, since:Union[Float,None]=None, until:Union[Float,None]=None, level:Int=0, thread:Union[Str,None]=None ) -> Iterator[Str]:
+		
+		"""
+		Return the records of all segments in the directory which
+		matched the time range, minimum level and thread
+		
+		:params Str directory
+		:params Float|None since
+			The minimum timestamp in seconds
+		:params Float|None until
+			The maximum timestamp in seconds
+		:params Int level
+			The minimum logging level
+		:params Str|None thread
+		
+		:return Iterator<Str>
+		"""
+		
+		for segment in Archive.segments( directory ):
+			yield from Archive.search( segment, since, until, level, thread )
+	
+	@staticmethod
+	def search( segment:Str, since:Union[Float,None]=None, until:Union[Float,None]=None, level:Int=0, thread:Union[Str,None]=None ) -> Iterator[Str]:
+		
+		"""
+		Return the records of segment which matched the time range,
+		minimum level and thread, the frames are looked up in the
+		sidecar index and only the matched frames are decompressed,
+		the adjacent matched records are returned as one string
+		
+		:params Str segment
+			The segment name without extension
+		:params Float|None since
+		:params Float|None until
+		:params Int level
+		:params Str|None thread
+		
+		:return Iterator<Str>
+		"""
+		
+		lower = -( 1 << 63 ) if since is None else int( since )
+		upper = ( 1 << 63 ) - 1 if until is None else int( until )
+		connection = connect( f"{segment}.idx" )
+		try:
+			ident = None
+			if thread is not None:
+				row = connection.execute( "SELECT id FROM threads WHERE name = ?", ( Str( thread ), ) ).fetchone()
+				if row is None:
+					return
+				ident = row[0]
+			rows = connection.execute(
+				"SELECT id, offset, length, count, records FROM blocks WHERE id IN ( SELECT block FROM ranges WHERE level >= ? AND stop >= ? AND start <= ?{} ) ORDER BY id".format( "" if ident is None else " AND thread = ?" ),
+				( level, lower, upper ) if ident is None else ( level, lower, upper, ident )
+			).fetchall()
+		finally:
+			connection.close()
+		if not rows:
+			return
+		with open( f"{segment}.zst", "rb" ) as fread:
+			for _, offset, length, count, records in rows:
+				records = ZstdDecompress( records )
+				lines = array( "I", records[:count * 4] )
+				times = array( "q", records[count * 4:count * 12] )
+				levels = records[count * 12:count * 13]
+				names = array( "I", records[count * 13:] )
+				fread.seek( offset )
+				chunks = ZstdDecompress( fread.read( length ) ).split( b"\x0a" )
+				begin = None
+				line = second = 0
+				for record in range( count ):
+					second += times[record]
+					if levels[record] >= level and lower <= second <= upper and ( ident is None or names[record] == ident ):
+						if begin is None:
+							begin = line
+					elif begin is not None:
+						yield b"\x0a".join( chunks[begin:line] ).decode( "utf-8", "replace" ) + "\x0a"
+						begin = None
+					line += lines[record]
+				if begin is not None:
+					yield b"\x0a".join( chunks[begin:line] ).decode( "utf-8", "replace" ) + "\x0a"
+	
+	@staticmethod
+	def segments( directory:Str ) -> List[Str]:
+		
+		"""
+		Return the segment names having sidecar index in directory
+		ordered by day and segment number, the segment names are
+		e.g society - 2024-01-12.1.log
+		
+		:params Str directory
+		
+		:return List<Str>
+		"""
+		
+		if not path.isdir( directory ):
+			return []
+		segments = []
+		for fname in listdir( directory ):
+			if not fname.endswith( ".log.zst" ):
+				continue
+			segment = f"{directory}/{fname[:-4]}"
+			if not path.exists( f"{segment}.idx" ):
+				continue
+			prefix, _, name = fname[:-8].rpartition( " - " )
+			day, _, number = name.partition( "." )
+			segments.append(( day, int( number ) if number.isdigit() else 0, prefix, segment ))
+		return [ segment for *_, segment in sorted( segments ) ]
+	
+	...
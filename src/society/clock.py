@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import float as Float, int as Int, str as Str
+from datetime import datetime
+from time import monotonic, time
+from typing import Dict, final, Tuple, Union
+from zoneinfo import available_timezones, ZoneInfo, ZoneInfoNotFoundError
+
+from society.typing.properties import Properties
+
+
+@final
+class Clock:
+	
+	"""
+	Clock service of Society, the timezone object of the current
+	Properties.TimeZone is cached and the formatted strings are
+	cached for each second, so formatting the current time many
+	times per second costs only a lookup
+	"""
+	
+	Formatted:Dict[Str,Tuple[Int,Str,ZoneInfo]] = {}
+	""" The last formatted second, string and timezone by format """
+	
+	Names:Union[Dict[Str,Str],None] = None
+	""" Timezone names by lower case name """
+	
+	Zone:Union[Tuple[Str,ZoneInfo],None] = None
+	""" The cached timezone name and object """
+	
+	def __init__( self ) -> None:
+		
+		""" Construct method of class Clock """
+		
+		raise NotImplementedError( "Clock class is not initializable" )
+	
+	@staticmethod
+	def elapsed( started:Float ) -> Float:
+		
+		"""
+		Return the seconds elapsed since the monotonic time
+		
+		:params Float started
+			The value of Clock.monotonic
+		
+		:return Float
+		"""
+		
+		return monotonic() - started
+	
+	@staticmethod
+	def format( format:Str, instance:Union[datetime,Float,Int,None]=None ) -> Str:
+		
+		"""
+		Return the formatted datetime in the current timezone, the
+		string of timestamp is cached by second
+		
+		:params Str format
+			Date string format, without sub second directive
+		:params datetime|Float|Int|None instance
+			Datetime, timestamp in seconds or milliseconds, or None
+			for the current time
+		
+		:return Str
+		"""
+		
+		if isinstance( instance, datetime ):
+			return instance.strftime( format )
+		second = int( time() if instance is None else instance )
+		zone = Clock.zone()
+		cached = Clock.Formatted.get( format )
+		if cached is not None and cached[0] == second and cached[2] is zone:
+			return cached[1]
+		try:
+			formatted = datetime.fromtimestamp( second, zone ).strftime( format )
+		except ( OverflowError, OSError, ValueError ):
+			formatted = datetime.fromtimestamp( second // 1000, zone ).strftime( format )
+		Clock.Formatted[format] = ( second, formatted, zone )
+		return formatted
+	
+	@staticmethod
+	def monotonic() -> Float:
+		
+		"""
+		Return the monotonic time for measuring durations
+		
+		:return Float
+		"""
+		
+		return monotonic()
+	
+	@staticmethod
+	def now() -> datetime:
+		
+		"""
+		Return the current datetime in the current timezone
+		
+		:return datetime
+		"""
+		
+		return datetime.now( Clock.zone() )
+	
+	@staticmethod
+	def time() -> Float:
+		
+		"""
+		Return the current timestamp in seconds
+		
+		:return Float
+		"""
+		
+		return time()
+	
+	@staticmethod
+	def zone() -> ZoneInfo:
+		
+		"""
+		Return the timezone of Properties.TimeZone, the timezone is
+		resolved again only when Properties.TimeZone has changed,
+		the name is matched case insensitive e.g Asia/jakarta
+		
+		:return ZoneInfo
+		:raises ZoneInfoNotFoundError
+			When the timezone name does not exist
+		"""
+		
+		cached = Clock.Zone
+		name = Properties.TimeZone
+		if cached is not None and cached[0] == name:
+			return cached[1]
+		try:
+			zone = ZoneInfo( name )
+		except ( ValueError, ZoneInfoNotFoundError ):
+			if Clock.Names is None:
+				Clock.Names = { keyset.lower(): keyset for keyset in available_timezones() }
+			if name.lower() not in Clock.Names:
+				raise ZoneInfoNotFoundError( f"No time zone found with key {name}" )
+			zone = ZoneInfo( Clock.Names[name.lower()] )
+		Clock.Zone = ( name, zone )
+		return zone
+	
+	...
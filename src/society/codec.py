@@ -0,0 +1,702 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import bool as Bool, int as Int, str as Str
+from struct import Struct
+from typing import Any, Callable, Dict, final, Final, IO, Iterator, List, Mapping, Tuple, Type, Union
+
+from society.typing.builtins import Key, Val
+from society.typing.map import blueprint, entries, Map, MapList, Shape
+
+
+Registry:Final[Dict[Str,Type[Map]]] = {}
+""" The typed Map classes registered by reference, see register """
+
+Reserved:Final[List[Str]] = [ "__epoch__", "__frozen__", "__indexes__", "__keysets__", "__lazy__", "__merged__", "__pending__", "__shape__", "__values__", "__versions__" ]
+""" The Map storage attributes which are not encoded as Map attributes """
+
+Tagged:Final[Int] = 0xc1
+""" The marker of typed Map, the byte never used by msgpack format """
+
+Integer:Final[Int] = 0x02
+""" The ext type of integer which does not fit into 64 bit """
+
+Int8:Final[Struct] = Struct( ">b" )
+Int16:Final[Struct] = Struct( ">h" )
+Int32:Final[Struct] = Struct( ">i" )
+Int64:Final[Struct] = Struct( ">q" )
+Uint8:Final[Struct] = Struct( ">B" )
+Uint16:Final[Struct] = Struct( ">H" )
+Uint32:Final[Struct] = Struct( ">I" )
+Uint64:Final[Struct] = Struct( ">Q" )
+Float32:Final[Struct] = Struct( ">f" )
+Float64:Final[Struct] = Struct( ">d" )
+
+
+@final
+class Encoder:
+	
+	"""
+	Msgpack encoder of Map tree, plain values and plain Map are
+	encoded as standard msgpack, typed Map subclass is prefixed
+	by the reserved byte 0xc1 with class reference and attributes
+	"""
+	
+	__slots__ = ( "buffer", "buffering", "classes", "default", "write" )
+	
+	def __init__( self, write:Callable[[bytes],Any]=None, default:Callable[[Any],Any]=None, buffering:Int=65536 ) -> None:
+		
+		"""
+		Construct method of class Encoder
+		
+		:params Callable<Bytes> write
+			Write the encoded chunk when the buffer is full, None
+			for keep all encoded bytes in buffer
+		:params Callable<Any,Any> default
+			Return encodable value for unsupported value
+		:params Int buffering
+			The number of bytes buffered before written
+		
+		:return None
+		"""
+		
+		self.buffer:bytearray = bytearray()
+		self.buffering:Int = buffering
+		self.classes:Dict[Type[Map],Int] = {}
+		self.default:Callable[[Any],Any] = default
+		self.write:Callable[[bytes],Any] = write
+	
+	def encode( self, value:Any ) -> None:
+		
+		"""
+		Encode the value into buffer
+		
+		:params Any value
+		
+		:return None
+		:raises TypeError
+			When the value is not encodable
+		"""
+		
+		buffer = self.buffer
+		kind = type( value )
+		if kind is str:
+			encoded = value.encode( "utf-8" )
+			length = len( encoded )
+			if length < 32:
+				buffer.append( 0xa0 | length )
+			elif length < 0x100:
+				buffer.append( 0xd9 )
+				buffer.append( length )
+			elif length < 0x10000:
+				buffer.append( 0xda )
+				buffer += Uint16.pack( length )
+			else:
+				buffer.append( 0xdb )
+				buffer += Uint32.pack( length )
+			buffer += encoded
+		elif kind is int:
+			if 0 <= value < 0x80:
+				buffer.append( value )
+			elif -0x20 <= value < 0:
+				buffer.append( value & 0xff )
+			elif 0 <= value < 0x100:
+				buffer.append( 0xcc )
+				buffer.append( value )
+			elif 0 <= value < 0x10000:
+				buffer.append( 0xcd )
+				buffer += Uint16.pack( value )
+			elif 0 <= value < 0x100000000:
+				buffer.append( 0xce )
+				buffer += Uint32.pack( value )
+			elif 0 <= value < 0x10000000000000000:
+				buffer.append( 0xcf )
+				buffer += Uint64.pack( value )
+			elif -0x80 <= value < 0:
+				buffer.append( 0xd0 )
+				buffer += Int8.pack( value )
+			elif -0x8000 <= value < 0:
+				buffer.append( 0xd1 )
+				buffer += Int16.pack( value )
+			elif -0x80000000 <= value < 0:
+				buffer.append( 0xd2 )
+				buffer += Int32.pack( value )
+			elif -0x8000000000000000 <= value < 0:
+				buffer.append( 0xd3 )
+				buffer += Int64.pack( value )
+			else:
+				self.extension( Integer, str( value ).encode( "ascii" ) )
+		elif value is None:
+			buffer.append( 0xc0 )
+		elif kind is bool:
+			buffer.append( 0xc3 if value else 0xc2 )
+		elif kind is float:
+			buffer.append( 0xcb )
+			buffer += Float64.pack( value )
+		elif isinstance( value, Map ):
+			if kind is not Map:
+				self.tag( value )
+			self.header( len( value.__dict__['__values__'] ), 0x80, 0xde )
+			for keyset, item in entries( value ):
+				self.encode( keyset )
+				self.encode( item )
+		elif kind is list or kind is tuple or kind is MapList:
+			self.header( len( value ), 0x90, 0xdc )
+			for item in value:
+				self.encode( item )
+		elif kind is dict or isinstance( value, Mapping ):
+			self.header( len( value ), 0x80, 0xde )
+			for keyset, item in value.items():
+				self.encode( keyset )
+				self.encode( item )
+		elif isinstance( value, ( bytes, bytearray, memoryview ) ):
+			length = value.nbytes if isinstance( value, memoryview ) else len( value )
+			if length < 0x100:
+				buffer.append( 0xc4 )
+				buffer.append( length )
+			elif length < 0x10000:
+				buffer.append( 0xc5 )
+				buffer += Uint16.pack( length )
+			else:
+				buffer.append( 0xc6 )
+				buffer += Uint32.pack( length )
+			buffer += value
+		elif isinstance( value, str ):
+			self.encode( str.__str__( value ) )
+		elif isinstance( value, int ):
+			self.encode( int( value ) )
+		elif isinstance( value, float ):
+			self.encode( float( value ) )
+		elif isinstance( value, ( list, tuple ) ):
+			self.encode( list( value ) )
+		elif self.default is not None:
+			self.encode( self.default( value ) )
+		else:
+			raise TypeError( f"Object of type {type( value ).__name__} is not msgpack serializable" )
+		if self.write is not None and len( buffer ) >= self.buffering:
+			self.flush()
+	
+	def extension( self, code:Int, data:bytes ) -> None:
+		
+		"""
+		Encode msgpack ext value
+		
+		:params Int code
+		:params Bytes data
+		
+		:return None
+		"""
+		
+		length = len( data )
+		if length < 0x100:
+			self.buffer.append( 0xc7 )
+			self.buffer.append( length )
+		else:
+			self.buffer.append( 0xc9 )
+			self.buffer += Uint32.pack( length )
+		self.buffer.append( code )
+		self.buffer += data
+	
+	def flush( self ) -> None:
+		
+		""" Write and clear the buffered bytes """
+		
+		if self.buffer:
+			self.write( bytes( self.buffer ) )
+			self.buffer.clear()
+	
+	def header( self, length:Int, fixed:Int, code:Int ) -> None:
+		
+		"""
+		Encode header of array or map
+		
+		:params Int length
+		:params Int fixed
+			The fixarray or fixmap marker
+		:params Int code
+			The array16 or map16 marker
+		
+		:return None
+		"""
+		
+		if length < 16:
+			self.buffer.append( fixed | length )
+		elif length < 0x10000:
+			self.buffer.append( code )
+			self.buffer += Uint16.pack( length )
+		else:
+			self.buffer.append( code +1 )
+			self.buffer += Uint32.pack( length )
+	
+	def tag( self, value:Map[Key,Val] ) -> None:
+		
+		"""
+		Encode the class reference and attributes of typed Map, each
+		class is written once and referred by index afterwards
+		
+		:params Map value
+		
+		:return None
+		"""
+		
+		kind = type( value )
+		self.buffer.append( Tagged )
+		if kind in self.classes:
+			self.encode( self.classes[kind] )
+		else:
+			self.classes[kind] = len( self.classes )
+			self.encode( len( self.classes ) -1 )
+			self.encode( reference( kind ) )
+		attributes = { name: item for name, item in value.__dict__.items() if name not in Reserved }
+		self.encode( attributes )
+	
+
+@final
+class Decoder:
+	
+	"""
+	Msgpack decoder of Map tree over memory buffer or stream, bin
+	values are returned as memoryview slice of memory buffer
+	"""
+	
+	__slots__ = ( "buffer", "chunk", "classes", "fp", "offset", "shapes" )
+	
+	def __init__( self, buffer:Union[bytes,bytearray,memoryview]=b"", fp:IO=None, chunk:Int=65536 ) -> None:
+		
+		"""
+		Construct method of class Decoder
+		
+		:params Bytes|Bytearray|Memoryview buffer
+			The encoded bytes, mmap is accepted as memoryview
+		:params IO fp
+			Readable binary stream, read more bytes when the buffer
+			does not have enough bytes
+		:params Int chunk
+			The number of bytes read at once
+		
+		:return None
+		"""
+		
+		self.buffer:memoryview = memoryview( buffer ).cast( "B" )
+		self.chunk:Int = chunk
+		self.classes:List[Type[Map]] = []
+		self.fp:IO = fp
+		self.offset:Int = 0
+		self.shapes:Dict[Tuple[Key,...],Shape] = {}
+	
+	def construct( self, kind:Type[Map], keysets:List[Key], values:List[Val], attributes:Dict[Str,Any] ) -> Map[Key,Val]:
+		
+		"""
+		Return Map of decoded keys and values without calling the
+		class constructor, the key table is shared by Map shape
+		
+		:params Type<Map> kind
+		:params List<Key> keysets
+		:params List<Val> values
+		:params Dict<Str,Any> attributes
+		
+		:return Map
+		"""
+		
+		identity = tuple( keysets )
+		shape = self.shapes.get( identity )
+		if shape is None and identity not in self.shapes:
+			shape = self.shapes[identity] = Shape.Root.derive( identity ) if len( set( identity ) ) == len( identity ) else None
+		instance = Map.__new__( kind )
+		storage = instance.__dict__
+		storage.update( ( name, item ) for name, item in attributes.items() if name not in Reserved )
+		if shape is not None:
+			storage['__shape__'] = shape
+			storage['__indexes__'] = shape.indexes
+			storage['__keysets__'] = shape.keysets
+			storage['__values__'] = values
+		else:
+			storage['__shape__'] = None
+			storage['__indexes__'] = {}
+			storage['__keysets__'] = []
+			storage['__values__'] = []
+			for keyset, value in zip( keysets, values ):
+				if keyset in storage['__indexes__']:
+					storage['__values__'][storage['__indexes__'][keyset]] = value
+					continue
+				storage['__indexes__'][keyset] = len( storage['__keysets__'] )
+				storage['__keysets__'].append( keyset )
+				storage['__values__'].append( value )
+		storage['__frozen__'] = False
+		storage['__lazy__'] = False
+		storage['__pending__'] = None
+		return instance
+	
+	def decode( self ) -> Any:
+		
+		"""
+		Decode the next value
+		
+		:return Any
+		:raises ValueError
+			When the data is truncated or invalid
+		"""
+		
+		buffer = self.buffer
+		offset = self.offset
+		if offset < len( buffer ):
+			code = buffer[offset]
+			offset += 1
+			self.offset = offset
+			if code < 0x80:
+				return code
+			if 0xa0 <= code < 0xc0 and offset + ( code & 0x1f ) <= len( buffer ):
+				self.offset = offset + ( code & 0x1f )
+				return str( buffer[offset:self.offset], "utf-8" )
+		else:
+			code = self.read( 1 )[0]
+		if code < 0x80:
+			return code
+		if code < 0x90:
+			return self.mapping( code & 0x0f, Map )
+		if code < 0xa0:
+			return MapList([ self.decode() for _ in range( code & 0x0f ) ])
+		if code < 0xc0:
+			return self.text( code & 0x1f )
+		if code >= 0xe0:
+			return code - 0x100
+		if code == 0xc0:
+			return None
+		if code == 0xc2:
+			return False
+		if code == 0xc3:
+			return True
+		if code == 0xcb:
+			return Float64.unpack( self.read( 8 ) )[0]
+		if code == 0xca:
+			return Float32.unpack( self.read( 4 ) )[0]
+		if 0xcc <= code <= 0xd3:
+			return ( Uint8, Uint16, Uint32, Uint64, Int8, Int16, Int32, Int64 )[code - 0xcc].unpack( self.read( ( 1, 2, 4, 8 )[( code - 0xcc ) & 3] ) )[0]
+		if 0xd9 <= code <= 0xdb:
+			return self.text( self.length( code - 0xd9 ) )
+		if 0xc4 <= code <= 0xc6:
+			data = self.read( self.length( code - 0xc4 ) )
+			return data if self.fp is None else bytes( data )
+		if code == 0xdc or code == 0xdd:
+			return MapList([ self.decode() for _ in range( self.length( code - 0xdb ) ) ])
+		if code == 0xde or code == 0xdf:
+			return self.mapping( self.length( code - 0xdd ), Map )
+		if 0xc7 <= code <= 0xc9 or 0xd4 <= code <= 0xd8:
+			length = self.length( code - 0xc7 ) if code <= 0xc9 else 1 << ( code - 0xd4 )
+			extension = self.read( 1 )[0]
+			data = self.read( length )
+			if extension == Integer:
+				return int( bytes( data ).decode( "ascii" ) )
+			raise ValueError( f"Unsupported msgpack ext type {extension}" )
+		if code == Tagged:
+			index = self.decode()
+			if index == len( self.classes ):
+				self.classes.append( resolve( self.decode() ) )
+			elif not 0 <= index < len( self.classes ):
+				raise ValueError( f"Invalid typed Map class index {index}" )
+			attributes = self.decode()
+			code = self.read( 1 )[0]
+			if 0x80 <= code < 0x90:
+				length = code & 0x0f
+			elif code == 0xde or code == 0xdf:
+				length = self.length( code - 0xdd )
+			else:
+				raise ValueError( "Typed Map marker must be followed by map" )
+			return self.mapping( length, self.classes[index], dict( attributes ) )
+		raise ValueError( f"Invalid msgpack marker 0x{code:02x}" )
+	
+	def length( self, size:Int ) -> Int:
+		
+		"""
+		Decode the length of 8, 16 or 32 bit
+		
+		:params Int size
+			The 0 for 8 bit, 1 for 16 bit and 2 for 32 bit
+		
+		:return Int
+		"""
+		
+		return ( Uint8, Uint16, Uint32 )[size].unpack( self.read( 1 << size ) )[0]
+	
+	def mapping( self, length:Int, kind:Type[Map], attributes:Dict[Str,Any]=None ) -> Map[Key,Val]:
+		
+		"""
+		Decode the map items into Map
+		
+		:params Int length
+		:params Type<Map> kind
+		:params Dict<Str,Any> attributes
+		
+		:return Map
+		"""
+		
+		decode = self.decode
+		keysets = []
+		values = []
+		for _ in range( length ):
+			buffer = self.buffer
+			offset = self.offset
+			if offset < len( buffer ) and 0xa0 <= buffer[offset] < 0xc0 and offset + 1 + ( buffer[offset] & 0x1f ) <= len( buffer ):
+				self.offset = offset + 1 + ( buffer[offset] & 0x1f )
+				keysets.append( str( buffer[offset +1:self.offset], "utf-8" ) )
+			else:
+				keysets.append( decode() )
+			values.append( decode() )
+		return self.construct( kind, keysets, values, attributes or {} )
+	
+	def read( self, size:Int ) -> memoryview:
+		
+		"""
+		Return the next bytes, read more bytes from the stream when
+		the buffer does not have enough bytes
+		
+		:params Int size
+		
+		:return Memoryview
+		:raises ValueError
+			When the data is truncated
+		"""
+		
+		offset = self.offset
+		end = offset + size
+		if end > len( self.buffer ):
+			if self.fp is None:
+				raise ValueError( "Truncated msgpack data" )
+			remains = bytes( self.buffer[offset:] )
+			while len( remains ) < size:
+				data = self.fp.read( max( self.chunk, size - len( remains ) ) )
+				if not data:
+					raise ValueError( "Truncated msgpack data" )
+				remains += data
+			self.buffer = memoryview( remains )
+			offset = 0
+			end = size
+		self.offset = end
+		return self.buffer[offset:end]
+	
+	def remaining( self ) -> Bool:
+		
+		"""
+		Return whether there are more bytes to decode
+		
+		:return Bool
+		"""
+		
+		if self.offset < len( self.buffer ):
+			return True
+		if self.fp is None:
+			return False
+		data = self.fp.read( self.chunk )
+		if not data:
+			return False
+		self.buffer = memoryview( bytes( data ) )
+		self.offset = 0
+		return True
+	
+	def text( self, length:Int ) -> Str:
+		
+		"""
+		Decode utf-8 string
+		
+		:params Int length
+		
+		:return Str
+		"""
+		
+		return str( self.read( length ), "utf-8" )
+	
+
+def dump( value:Any, fp:IO, default:Callable[[Any],Any]=None, buffering:Int=65536 ) -> None:
+	
+	"""
+	Encode the value into binary file or stream
+	
+	:params Any value
+	:params IO fp
+		Writable binary file or stream
+	:params Callable<Any,Any> default
+		Return encodable value for unsupported value
+	:params Int buffering
+		The number of bytes buffered before written
+	
+	:return None
+	:raises TypeError
+		When the value is not encodable
+	"""
+	
+	encoder = Encoder( fp.write, default, buffering )
+	encoder.encode( value )
+	encoder.flush()
+
+def iterload( fp:IO, chunk:Int=65536 ) -> Iterator[Any]:
+	
+	"""
+	Yield each value of concatenated encoded values in the stream
+	
+	:params IO fp
+		Readable binary file or stream
+	:params Int chunk
+		The number of bytes read at once
+	
+	:return Iterator<Any>
+	"""
+	
+	decoder = Decoder( fp=fp, chunk=chunk )
+	while decoder.remaining():
+		yield decoder.decode()
+
+def load( fp:IO, chunk:Int=65536 ) -> Any:
+	
+	"""
+	Decode a value from binary file or stream
+	
+	:params IO fp
+		Readable binary file or stream
+	:params Int chunk
+		The number of bytes read at once
+	
+	:return Any
+	"""
+	
+	return Decoder( fp=fp, chunk=chunk ).decode()
+
+def pack( value:Any, default:Callable[[Any],Any]=None ) -> bytes:
+	
+	"""
+	Return the encoded value
+	
+	:params Any value
+	:params Callable<Any,Any> default
+		Return encodable value for unsupported value
+	
+	:return Bytes
+	:raises TypeError
+		When the value is not encodable
+	"""
+	
+	encoder = Encoder( default=default )
+	encoder.encode( value )
+	return bytes( encoder.buffer )
+
+def reference( kind:Type[Map] ) -> Str:
+	
+	"""
+	Return the class reference of typed Map, generated MapBuilder
+	class is referred by its parent class with + prefix
+	
+	:params Type<Map> kind
+	
+	:return Str
+	"""
+	
+	prefix = ""
+	if kind.__name__ == "MapBuilder" and kind.__qualname__.endswith( "<locals>.MapBuilder" ):
+		prefix = "+"
+		kind = kind.__bases__[0]
+	return f"{prefix}{kind.__module__}:{kind.__qualname__}"
+
+def register( kind:Type[Map], name:Str=None ) -> Type[Map]:
+	
+	"""
+	Register typed Map class for decoding, the class is resolved
+	by the reference or by the given name, can be used as class
+	decorator
+	
+	:params Type<Map> kind
+	:params Str name
+		The reference of class, e.g. for renamed or moved class
+	
+	:return Type<Map>
+	:raises TypeError
+		When the class does not extends the Map class
+	"""
+	
+	if not isinstance( kind, type ) or not issubclass( kind, Map ):
+		raise TypeError( "Invalid \"kind\" parameter, value must be Map class, {} passed".format( kind ) )
+	Registry[reference( kind ) if name is None else name] = kind
+	return kind
+
+def resolve( name:Str ) -> Type[Map]:
+	
+	"""
+	Return the class of typed Map reference, only the registered
+	classes and the Map subclasses which are already imported
+	are resolved, the module of reference is never imported
+	
+	:params Str name
+	
+	:return Type<Map>
+	:raises ValueError
+		When the reference is not a known Map class
+	"""
+	
+	if not isinstance( name, str ):
+		raise ValueError( "Invalid typed Map reference, the reference must be a string" )
+	target = name[1:] if name.startswith( "+" ) else name
+	kind = Registry.get( target )
+	if kind is None:
+		for subclass in subclasses( Map ):
+			if reference( subclass ) == target:
+				kind = subclass
+				break
+		else:
+			raise ValueError( f"Unknown typed Map reference {name}, the class must be imported or registered" )
+	return blueprint( kind ) if name.startswith( "+" ) else kind
+
+def subclasses( kind:Type[Map] ) -> Iterator[Type[Map]]:
+	
+	"""
+	Yield the subclasses of class recursively, the generated
+	MapBuilder classes are skipped
+	
+	:params Type<Map> kind
+	
+	:return Iterator<Type<Map>>
+	"""
+	
+	for subclass in kind.__subclasses__():
+		if subclass.__name__ != "MapBuilder":
+			yield subclass
+		yield from subclasses( subclass )
+
+def unpack( buffer:Union[bytes,bytearray,memoryview] ) -> Any:
+	
+	"""
+	Return the decoded value of buffer, bin values are returned as
+	memoryview slice of the buffer without copying
+	
+	:params Bytes|Bytearray|Memoryview buffer
+		The encoded bytes, mmap is accepted as well
+	
+	:return Any
+	:raises ValueError
+		When the data is truncated or invalid
+	"""
+	
+	decoder = Decoder( buffer )
+	value = decoder.decode()
+	if decoder.offset != len( decoder.buffer ):
+		raise ValueError( "Extra data after msgpack value" )
+	return value
+
@@ -25,7 +25,6 @@
 from builtins import bool as Bool, int as Int, str as Str
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from pytz import timezone
 from random import choice
 from re import IGNORECASE, MULTILINE, S
 from re import compile, match, split, sub as substr
@@ -33,9 +32,10 @@ from sys import exit as systemExit
 from time import sleep
 from typing import Any, MutableMapping, MutableSequence, Union
 from urllib.parse import urlparse, parse_qs as queryparse
+from warnings import warn
 
+from society.clock import Clock
 from society.patterns import Username
-from society.typing.properties import Properties
 
 
 def colorize( string:Str, base:Str=None ) -> Str:
@@ -210,6 +210,22 @@ def converter( readable:Str ) -> Int:
 def delays() -> None:
 	sleep( choice([ 1.3, 1.6, 1.9, 2, 2.2, 2.4, 2.6 ]) )
 
+def deprecated( name:Str, function:Str ) -> None:
+
+	"""
+	Warn the caller of function that the keyword argument is
+	deprecated and ignored
+
+	:params Str name
+		The keyword argument name
+	:params Str function
+		The function name
+
+	:return None
+	"""
+
+	warn( f"{name}= of {function} is deprecated and ignored, the index bound by Context is used", DeprecationWarning, stacklevel=3 )
+
 def epochmillis( datestr:Str ) -> Int:
 
 	"""
@@ -285,11 +301,7 @@ def strftime( format:Str, instance:Union[datetime,float,Int] ) -> Str:
 	"""
 
 	if isinstance( instance, ( float, int ) ):
-		zone = timezone( Properties.TimeZone )
-		try:
-			instance = datetime.fromtimestamp( int( instance ), zone )
-		except ValueError:
-			instance = datetime.fromtimestamp( int( instance / 1000 ), zone )
+		return Clock.format( format, instance )
 	if not isinstance( instance, datetime ):
 		raise TypeError( "Invalid \"instance\" parameter, value must be type datetime|Float|Int, {} passed".format( typeof( datetime ) ) )
 	return instance.strftime( format )
@@ -312,8 +324,10 @@ def timestamp( minutes:Int=0, hours:Int=0, days=0, weeks:Int=0, months:Int=0, ye
 		Current timestamp or current timestamp minus time
 	"""
 	
-	zone = timezone( Properties.TimeZone )
-	currtime = datetime.now( zone )
+	if not minutes and not hours and not days and not weeks and not months and not years:
+		current = Clock.time()
+		return int( current * 1000 ) if tm is True else int( current )
+	currtime = Clock.now()
 	relative = relativedelta( minutes=minutes, hours=hours, months=months, years=years, weeks=weeks, days=days )
 	try:
 		current = currtime - relative
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import int as Int, str as Str
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from itertools import count
+from threading import current_thread as CurrentThread
+from typing import Any, Callable, Dict, final, Iterator, Mapping, Union
+
+
+@final
+class Context:
+	
+	"""
+	Log and job context of the current thread or task, carrying
+	the job name, dataset item and index, worker and request id,
+	every log line picks the context up so the call sites do not
+	pass the context by hand
+	"""
+	
+	Requests:Iterator[Int] = count( 1 )
+	""" Request id generator """
+	
+	Variable:ContextVar[Union[Mapping[Str,Any],None]] = ContextVar( "society", default=None )
+	""" The context values of the current thread or task """
+	
+	def __init__( self ) -> None:
+		
+		""" Construct method of class Context """
+		
+		raise NotImplementedError( "Context class is not initializable" )
+	
+	@staticmethod
+	@contextmanager
+	def bind( **fields:Any ) -> Iterator[Mapping[Str,Any]]:
+		
+		"""
+		Bind the fields into the context until the block exits,
+		the fields are merged with the current context
+		
+		:params Any **fields
+			e.g job, item, index, worker, request
+		
+		:return Iterator<Mapping<Str,Any>>
+		"""
+		
+		current = Context.Variable.get()
+		token = Context.Variable.set( { **current, **fields } if current else fields )
+		try:
+			yield Context.Variable.get()
+		finally:
+			Context.Variable.reset( token )
+	
+	@staticmethod
+	def current() -> Mapping[Str,Any]:
+		
+		"""
+		Return the values of the current context
+		
+		:return Mapping<Str,Any>
+		"""
+		
+		return Context.Variable.get() or {}
+	
+	@staticmethod
+	def get( name:Str, default:Any=None ) -> Any:
+		
+		"""
+		Return the value of the current context
+		
+		:params Str name
+		:params Any default
+		
+		:return Any
+		"""
+		
+		current = Context.Variable.get()
+		if current is None:
+			return default
+		return current.get( name, default )
+	
+	@staticmethod
+	def request() -> Int:
+		
+		"""
+		Return new request id
+		
+		:return Int
+		"""
+		
+		return next( Context.Requests )
+	
+	@staticmethod
+	def wrap( callback:Callable[...,Any], **fields:Any ) -> Callable[...,Any]:
+		
+		"""
+		Return the callback which runs in a copy of the current
+		context with the fields and the worker thread name bound,
+		for callbacks executed by other threads
+		
+		:params Callable callback
+		:params Any **fields
+		
+		:return Callable
+		"""
+		
+		context = copy_context()
+		def execute( *args:Any, **kwargs:Any ) -> Any:
+			with Context.bind( **fields, worker=CurrentThread().name ):
+				return callback( *args, **kwargs )
+		def wrapped( *args:Any, **kwargs:Any ) -> Any:
+			return context.copy().run( execute, *args, **kwargs )
+		return wrapped
+	
+	...
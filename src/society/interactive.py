@@ -22,11 +22,68 @@
 # use it at your own risk, and this is Strictly not for SPAM.
 #
 
-from click import group
-from typing import final
+from builtins import float as Float, str as Str
+from click import BadParameter, Choice, group, option
+from datetime import datetime
+from sys import stdout
+from typing import final, Union
+
+from society.archive import Archive
+from society.clock import Clock
+from society.logging import Logging
+from society.storage import Storage
 
 @final
 @group( "Society" )
 class Interfactive: ...
 
 Runner = Interfactive.command
+
+
+def timestamp( value:Union[Str,None] ) -> Union[Float,None]:
+	
+	"""
+	Return the timestamp of option value, the value is timestamp
+	in seconds or ISO datetime in the current timezone
+	
+	:params Str|None value
+	
+	:return Float|None
+	"""
+	
+	if value is None:
+		return None
+	try:
+		return Float( value )
+	except ValueError:
+		pass
+	try:
+		instance = datetime.fromisoformat( value )
+	except ValueError as e:
+		raise BadParameter( f"invalid timestamp or datetime {value}" ) from e
+	if instance.tzinfo is None:
+		instance = instance.replace( tzinfo=Clock.zone() )
+	return instance.timestamp()
+
+
+@Runner( "logs" )
+@option( "--since", default=None, help="Minimum time, timestamp or ISO datetime e.g 2024-01-12 14:31" )
+@option( "--until", default=None, help="Maximum time, timestamp or ISO datetime" )
+@option( "--level", default="debug", type=Choice( list( Logging.Names.values() ), case_sensitive=False ), help="Minimum logging level" )
+@option( "--thread", default=None, help="Thread name or position number" )
+@option( "--directory", default=None, help="Directory of log segments" )
+def logs( since:Union[Str,None], until:Union[Str,None], level:Str, thread:Union[Str,None], directory:Union[Str,None] ) -> None:
+	
+	""" Query the compressed log history """
+	
+	levels = { name: value for value, name in Logging.Names.items() }
+	records = Archive.query(
+		directory=directory or f"{Storage.BASEPATH}/history/logging",
+		since=timestamp( since ),
+		until=timestamp( until ),
+		level=levels[level.lower()],
+		thread=thread
+	)
+	for record in records:
+		stdout.write( record )
+	stdout.flush()
@@ -22,19 +22,50 @@
 # use it at your own risk, and this is Strictly not for SPAM.
 #
 
-from builtins import bool as Bool, int as Int, str as Str
-from inspect import getframeinfo, stack
-from os import get_terminal_size as gts
-from random import randint
-from threading import current_thread as CurrentThread, main_thread as MainThread
-from typing import Any, Final, MutableMapping, Union
+from atexit import register
+from builtins import bool as Bool, float as Float, int as Int, str as Str
+from collections import deque
+from datetime import datetime
+from fcntl import flock, LOCK_EX, LOCK_NB
+from json import dumps as encoder, loads as decoder
+from math import ceil
+from os import get_terminal_size as gts, getpid, listdir, makedirs as mkdir, path, remove
+from pyzstd import ZstdError
+from queue import Empty, SimpleQueue
+from re import compile, Pattern
+from signal import signal, SIGUSR1
+from sqlite3 import Error as SQLiteError
+from sys import _getframe, exit as systemExit
+from threading import current_thread as CurrentThread, Lock, Thread
+from types import FrameType
+from typing import Any, BinaryIO, Deque, Dict, Final, final, IO, List, MutableMapping, Tuple, Union
 
-from society.common import puts, strftime, timestamp
+from society.archive import Archive, Mark
+from society.clock import Clock
+from society.common import puts
 from society.constants import BASEPATH, BASEVENV
+from society.context import Context
+from society.progress import Progress
 from society.storage import Storage
 from society.typing.properties import Properties
 
 
+Ansi:Final[Pattern] = compile( r"\x1b\[[0-9;]*m" )
+""" The ansi color codes of stored messages log """
+
+Closing:Final[object] = object()
+""" A sentinel for stopping the background writer """
+
+Counting:Lock = Lock()
+""" Lock for counting repeated and sampled messages """
+
+Prefix:Final[Pattern] = compile( r"^-- \[(\w)\] -- (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) " )
+""" The level and datetime prefix of stored messages log """
+
+Starting:Lock = Lock()
+""" Lock for starting the background writer once """
+
+
 class Logging:
 	
 	""" Simple Logging utility """
@@ -42,24 +73,48 @@ class Logging:
 	Counter:Int = 1
 	""" Logging counter """
 	
-	Critical:Final[Int] = randint( 10, 99 )
+	Critical:Final[Int] = 50
 	""" Logging Critical Level """
 	
-	Debug:Final[Int] = randint( 20, 99 )
+	Debug:Final[Int] = 10
 	""" Logging Debug Level """
 	
-	Error:Final[Int] = randint( 30, 99 )
+	Error:Final[Int] = 40
 	""" Logging Error Level """
 	
-	Fatal:Final[Int] = randint( 40, 99 )
+	Fatal:Final[Int] = 60
 	""" Logging Fatal Level """
 	
-	Info:Final[Int] = randint( 50, 99 )
+	Info:Final[Int] = 20
 	""" Logging Info Level """
 	
-	Warning:Final[Int] = randint( 60, 99 )
+	Warning:Final[Int] = 30
 	""" Logging Warning Level """
 	
+	Level:Union[Int,None] = None
+	""" Minimum logging level, None for Debug in development and Info otherwise """
+	
+	Modules:MutableMapping[Str,Int] = {}
+	""" Minimum logging level by module name or package prefix """
+	
+	Resolved:MutableMapping[Str,Union[Int,None]] = {}
+	""" Resolved module level override by module name """
+	
+	Repeated:Final[Str] = "{} repeated {} times"
+	""" Logging message of collapsed repeated messages """
+	
+	Collapsing:MutableMapping[Str,Float] = {}
+	""" Seconds of repeated messages collapsed into one by message template, e.g 1.0 """
+	
+	Repeats:MutableMapping[Tuple[Int,Str],List[Any]] = {}
+	""" Window start, number of suppressed, thread, arguments and caller of last suppressed by level and message template """
+	
+	Sampled:MutableMapping[Str,Int] = {}
+	""" Number of calls by sampled message template """
+	
+	Sampling:MutableMapping[Str,Float] = {}
+	""" Rate of written messages by message template e.g 0.1 for one of ten calls """
+	
 	Levels:MutableMapping[Int,Str] = {}
 	""" Logging level aliases """
 	
@@ -70,6 +125,25 @@ class Logging:
 	Levels[Info] = "I"
 	Levels[Warning] = "W"
 	
+	Names:MutableMapping[Int,Str] = {}
+	""" Logging level names """
+	
+	Names[Critical] = "critical"
+	Names[Debug] = "debug"
+	Names[Error] = "error"
+	Names[Fatal] = "fatal"
+	Names[Info] = "info"
+	Names[Warning] = "warning"
+	
+	Events:Deque[Dict[Str,Any]] = deque( maxlen=1024 )
+	""" Ring buffer of the last logging events, maxlen 0 to disable """
+	
+	Mode:Str = "text"
+	""" Logging output mode, text for colored line or json for Json line of event """
+	
+	Output:Union[IO,None] = None
+	""" Output of Json lines, None for standard output """
+	
 	DateTimeFormat:Str = "%Y-%m-%d %H:%M:%S"
 	""" Logging datetime format """
 	
@@ -85,6 +159,52 @@ class Logging:
 	Store:Bool = False
 	""" Allow logging store messages log """
 	
+	Sink:Union["Writer",None] = None
+	""" Background writer of stored messages log """
+	
+	@staticmethod
+	def close() -> None:
+		
+		"""
+		Write suppressed repeated messages and stop the writer of
+		stored messages log, called at exit
+		
+		:return None
+		"""
+		
+		Logging.flush()
+		if Logging.Sink is not None:
+			Logging.Sink.close()
+	
+	@staticmethod
+	def configure( level:Union[Int,Str,None]=None, modules:MutableMapping[Str,Union[Int,Str]]=None ) -> None:
+		
+		"""
+		Configure the minimum logging level and the module overrides
+		
+		:params Int|Str|None level
+			The minimum level or level name e.g info, None for Debug
+			in development and Info otherwise
+		:params MutableMapping<Str,Int|Str> modules
+			The minimum level by module name or package prefix
+			e.g { "society.requests": "warning" }
+		
+		:return None
+		:raises ValueError
+			When the level name is invalid
+		"""
+		
+		def resolve( level:Union[Int,Str] ) -> Int:
+			if isinstance( level, Str ):
+				names = { name: value for value, name in Logging.Names.items() }
+				if level.lower() not in names:
+					raise ValueError( f"Invalid logging level \"{level}\"" )
+				return names[level.lower()]
+			return level
+		Logging.Level = resolve( level ) if level is not None else None
+		Logging.Modules = { module: resolve( value ) for module, value in ( modules or {} ).items() }
+		Logging.Resolved = {}
+	
 	@staticmethod
 	def critical( message:Str, *args:Any, start:Str="", end:Str="\x0a", thread:Union[Int,Str]=0, close:Union[Bool,Int]=False, **kwargs:Any ) -> None:
 		
@@ -135,9 +255,27 @@ class Logging:
 		:return None
 		"""
 		
-		if Properties.Environment == "development":
-			Logging.write( Logging.Debug, message, *args, start=start, end=end, thread=thread, close=close, **kwargs )
-		...
+		Logging.write( Logging.Debug, message, *args, start=start, end=end, thread=thread, close=close, **kwargs )
+	
+	@staticmethod
+	def dump( fp:IO=None ) -> List[Dict[Str,Any]]:
+		
+		"""
+		Return the events of ring buffer, oldest first
+		
+		:params IO fp
+			Also write the events as Json lines into text file object
+		
+		:return List<Dict<Str,Any>>
+		"""
+		
+		events = list( Logging.Events )
+		if fp is not None:
+			for event in events:
+				fp.write( encoder( event, default=str, ensure_ascii=False ) )
+				fp.write( "\x0a" )
+			fp.flush()
+		return events
 	
 	@staticmethod
 	def error( message:Str, *args:Any, start:Str="", end:Str="\x0a", thread:Union[Int,Str]=0, close:Union[Bool,Int]=False, **kwargs:Any ) -> None:
@@ -191,6 +329,22 @@ class Logging:
 		
 		Logging.write( Logging.Fatal, message, *args, start=start, end=end, thread=thread, close=close, **kwargs )
 	
+	@staticmethod
+	def flush() -> None:
+		
+		"""
+		Write the number of suppressed repeated messages which have
+		not been written yet
+		
+		:return None
+		"""
+		
+		with Counting:
+			repeats = [ ( keyset, state ) for keyset, state in Logging.Repeats.items() if state[1] ]
+			Logging.Repeats = {}
+		for ( level, message ), state in repeats:
+			Logging.summary( level, message, state )
+	
 	@staticmethod
 	def info( message:Str, *args:Any, start:Str="", end:Str="\x0a", thread:Union[Int,Str]=0, close:Union[Bool,Int]=False, **kwargs:Any ) -> None:
 		
@@ -217,6 +371,107 @@ class Logging:
 		
 		Logging.write( Logging.Info, message, *args, start=start, end=end, thread=thread, close=close, **kwargs )
 	
+	@staticmethod
+	def listen( signum:Int=None ) -> None:
+		
+		"""
+		Dump the ring buffer into history/logging when the process
+		receives the signal, e.g kill -USR1 <pid>
+		
+		:params Int signum
+			The signal number, SIGUSR1 by default
+		
+		:return None
+		"""
+		
+		def handler( signum:Int, frame:FrameType ) -> None:
+			directory = f"{Storage.BASEPATH}/history/logging"
+			mkdir( directory, exist_ok=True )
+			with open( f"{directory}/society - events {Clock.format( '%Y-%m-%d %H%M%S' )}.jsonl", "w", encoding="utf-8" ) as fopen:
+				Logging.dump( fopen )
+		signal( signum if signum is not None else SIGUSR1, handler )
+	
+	@staticmethod
+	def minimum( default:Int ) -> Int:
+		
+		"""
+		Return the minimum level of the module which calls Logging,
+		the override of the longest matching module name or package
+		prefix, otherwise the default
+		
+		:params Int default
+		
+		:return Int
+		"""
+		
+		frame = _getframe( 1 )
+		while frame.f_back is not None and frame.f_globals.get( "__name__" ) == __name__:
+			frame = frame.f_back
+		module = frame.f_globals.get( "__name__", "" )
+		if module not in Logging.Resolved:
+			override = None
+			matched = -1
+			for prefix, level in Logging.Modules.items():
+				if ( module == prefix or module.startswith( f"{prefix}." ) ) and len( prefix ) > matched:
+					override = level
+					matched = len( prefix )
+			Logging.Resolved[module] = override
+		override = Logging.Resolved[module]
+		return override if override is not None else default
+	
+	@staticmethod
+	def repeated( level:Int, message:Str, args:Tuple[Any,...], kwargs:Dict[Str,Any], thread:Union[Int,Str] ) -> Bool:
+		
+		"""
+		Return whether the message template has been written within
+		the window of Logging.Collapsing and is suppressed, the number
+		of suppressed messages is written with the arguments of the
+		last one when the template is written again after the window
+		
+		:params Int level
+		:params Str message
+			The message template
+		:params Tuple<Any> args
+		:params Dict<Str,Any> kwargs
+		:params Int|Str thread
+		
+		:return Bool
+		"""
+		
+		current = Clock.monotonic()
+		keyset = ( level, message )
+		with Counting:
+			state = Logging.Repeats.get( keyset )
+			if state is not None and current - state[0] < Logging.Collapsing[message]:
+				frame = caller( 3 )
+				state[1] += 1
+				state[2:] = [ thread, args, kwargs, ( frame.f_code.co_filename, frame.f_code.co_name, frame.f_lineno ) ]
+				return True
+			Logging.Repeats[keyset] = [ current, 0, thread, args, kwargs, None ]
+		if state is not None and state[1]:
+			Logging.summary( level, message, state )
+		return False
+	
+	@staticmethod
+	def summary( level:Int, message:Str, state:List[Any] ) -> None:
+		
+		"""
+		Write the number of suppressed repeated messages, formatted
+		with the arguments and reported from the caller of the last
+		suppressed message
+		
+		:params Int level
+		:params Str message
+			The message template
+		:params List<Any> state
+			The state of Logging.Repeats
+		
+		:return None
+		"""
+		
+		_, count, thread, args, kwargs, origin = state
+		Logging.write( level, Logging.Repeated, message.format( *args, **kwargs ) if args or kwargs else message, count, thread=thread, origin=origin )
+	
 	@staticmethod
 	def warning( message:Str, *args, start:Str="", end:Str="\x0a", thread:Union[Int,Str]=0, close:Union[Bool,Int]=False, **kwargs:Any ) -> None:
 		
@@ -244,7 +499,25 @@ class Logging:
 		Logging.write( Logging.Warning, message, *args, start=start, end=end, thread=thread, close=close, **kwargs )
 	
 	@staticmethod
-	def write( level:Int, message:Str, *args:Any, start:Str="", end:Str="\x0a", thread:Union[Int,Str]=0, close:Union[Bool,Int]=False, **kwargs:Any ) -> None:
+	def writer() -> "Writer":
+		
+		"""
+		Return the background writer of stored messages log,
+		the writer is started on the first call
+		
+		:return Writer
+		"""
+		
+		if Logging.Sink is None:
+			with Starting:
+				if Logging.Sink is None:
+					sink = Writer( f"{Storage.BASEPATH}/history/logging" )
+					sink.start()
+					Logging.Sink = sink
+		return Logging.Sink
+	
+	@staticmethod
+	def write( level:Int, message:Str, *args:Any, start:Str="", end:Str="\x0a", thread:Union[Int,Str]=0, close:Union[Bool,Int]=False, origin:Tuple[Str,Str,Int]=None, **kwargs:Any ) -> None:
 		
 		"""
 		Write log into terminal screen.
@@ -263,17 +536,63 @@ class Logging:
 			Current thread position number
 		:params Int close
 			Close the program with exit code
+		:params Tuple<Str,Str,Int> origin
+			The file, function and line reported instead of caller
 		:params Any **kwargs
 			The logging message ke values
 		
 		:return None
 		"""
 		
+		minimum = Logging.Level
+		if minimum is None:
+			minimum = Logging.Debug if Properties.Environment == "development" else Logging.Info
+		if Logging.Modules:
+			minimum = Logging.minimum( minimum )
+		if level < minimum:
+			if close is not False:
+				systemExit( close )
+			return
+		if close is False:
+			if Logging.Sampling and message in Logging.Sampling:
+				with Counting:
+					count = Logging.Sampled.get( message, 0 ) + 1
+					Logging.Sampled[message] = count
+				rate = Logging.Sampling[message]
+				if ceil( count * rate ) == ceil( ( count - 1 ) * rate ):
+					return
+			if Logging.Collapsing and message in Logging.Collapsing and Logging.repeated( level, message, args, kwargs, thread ):
+				return
+		message = message if not args and not kwargs else message.format( *args, **kwargs )
+		scope = Context.Variable.get() or {}
+		if not thread and scope.get( "index" ):
+			thread = scope['index']
+		if Logging.Events.maxlen or Logging.Mode == "json":
+			event = {
+				"level": Logging.Names.get( level, "unknown" ),
+				"ts": Clock.time(),
+				"thread": thread if thread else CurrentThread().name,
+				"job": scope.get( "job" ),
+				"item": scope.get( "item" ),
+				"worker": scope.get( "worker" ),
+				"request": scope.get( "request" ),
+				"message": message,
+				"fields": kwargs
+			}
+			Logging.Events.append( event )
+			if Logging.Mode == "json":
+				outputs = encoder( event, default=str, ensure_ascii=False )
+				if Logging.Store is True:
+					Logging.writer().put( f"{outputs}\n", level, event['ts'], event['thread'] )
+				if Logging.Output is None and Progress.Active is not None:
+					Progress.Active.clear()
+				print( outputs, file=Logging.Output, flush=Logging.Output is not None )
+				if close is not False:
+					systemExit( close )
+				return
 		color = ""
 		status = "U"
-		stacks = stack()
-		currtime = strftime( Logging.DateTimeFormat, timestamp() )
-		threading = CurrentThread() is not MainThread()
+		currtime = Clock.format( Logging.DateTimeFormat )
 		if level in Logging.Levels:
 			status = Logging.Levels[level]
 			match level:
@@ -287,13 +606,8 @@ class Logging:
 				case _:
 					...
 			...
-		position = 0
 		if isinstance( thread, Int ) and thread >= 1 or \
 		   isinstance( thread, Str ) and thread:
-			position = 3 if len( stacks )>= 4 else 2
-			# position = 2 if len( stacks ) >= 3 else 1
-			if threading is True:
-				position = 2 if len( stacks )>= 4 else 1
 			formatter = Logging.MessageFormatThread \
 				if Properties.Environment is not None and \
 				   Properties.Environment == "production" else \
@@ -302,20 +616,24 @@ class Logging:
 				status = "T"
 			...
 		else:
-			position = 2 if len( stacks ) >= 3 else 1
 			formatter = Logging.MessageFormat \
 				if Properties.Environment is not None and \
 				   Properties.Environment == "production" else \
 				Logging.MessageFormatComplex
-		tiframe = getframeinfo( stacks[position][0] )
-		message = message if not args and not kwargs else message.format( *args, **kwargs )
+		filename = function = lineno = ""
+		if "{file}" in formatter or "{func}" in formatter or "{line}" in formatter:
+			if origin is None:
+				tiframe = caller( 2 )
+				origin = ( tiframe.f_code.co_filename, tiframe.f_code.co_name, tiframe.f_lineno )
+			filename, function, lineno = origin
+			filename = filename.replace( f"{BASEPATH}/", "" )
 		messages = message.splitlines()
 		messages[0] = "".join([ color, messages[0], "\x1b[0m" ])
 		outputs = formatter.format(
 			message="\x0a".join( messages ),
-			file=tiframe.filename.replace( f"{BASEPATH}/", "" ),
-			func=tiframe.function,
-			line=tiframe.lineno,
+			file=filename,
+			func=function,
+			line=lineno,
 			datetime=currtime,
 			thread=thread,
 			color=color,
@@ -326,17 +644,341 @@ class Logging:
 			.replace( BASEVENV, "{virtual}" )
 		length = len( outputs.splitlines().pop() )
 		if Logging.PreviousLength > length and start == "\x0d":
-			if Logging.PreviousLength <= gts().columns:
+			try:
+				columns = gts().columns
+			except OSError:
+				columns = 0
+			if Logging.PreviousLength <= columns:
 				outputs += "\x20" * ( Logging.PreviousLength - length )
 			else:
 				start = ""
 		Logging.PreviousLength = length
 		if Logging.Store is True:
 			Logging.Counter += 1
-			fmode = "w" if Logging.Counter >= 10000 else "+a"
-			ftime = currtime.strftime( "%Y-%B-%d" )
-			fname = f"history/logging/society - {ftime}.log"
-			Storage.touch( fname, f"{outputs}\n", fmode )
+			Logging.writer().put( f"{outputs}\n", level, Clock.time(), thread if thread else CurrentThread().name )
+		if Progress.Active is not None:
+			Progress.Active.clear()
 		puts( f"{start}{outputs}", end=end, close=close )
 	
 	...	
+
+# Write suppressed repeated messages and stop the writer at exit.
+register( Logging.close )
+
+
+def caller( depth:Int ) -> FrameType:
+	
+	"""
+	Return the frame of the caller, walking the frames back from
+	the function which calls this function, the outermost frame
+	is returned when the call stack is not deep enough
+	
+	:params Int depth
+		The number of frames to walk back, 0 for the function
+		which calls this function
+	
+	:return FrameType
+	"""
+	
+	frame = _getframe( 1 )
+	while depth > 0 and frame.f_back is not None:
+		frame = frame.f_back
+		depth -= 1
+	return frame
+
+
+@final
+class Writer( Thread ):
+	
+	"""
+	Background writer of messages log, the lines are fed through
+	queue and written in batches, flushed when the buffer is full
+	or the interval has passed, the file is rotated by day and
+	by size, the closed file is compressed into indexed segment
+	"""
+	
+	def __init__( self, directory:Str, prefix:Str="society", size:Int=16 * 1024 * 1024, buffer:Int=64 * 1024, interval:Float=1.0 ) -> None:
+		
+		"""
+		Construct method of class Writer
+		
+		:params Str directory
+			The directory of log files
+		:params Str prefix
+			The prefix of log file names
+		:params Int size
+			Maximum bytes of log file before rotated
+		:params Int buffer
+			Maximum bytes of pending lines before flushed
+		:params Float interval
+			Maximum seconds of pending lines before flushed
+		
+		:return None
+		"""
+		
+		Thread.__init__( self, name="LoggingWriter", daemon=True )
+		self.__buffer__:Int = buffer
+		self.__day__:Union[Str,None] = None
+		self.__directory__:Str = directory
+		self.__exception__:Union[BaseException,None] = None
+		self.__fopen__:Union[BinaryIO,None] = None
+		self.__interval__:Float = interval
+		self.__marks__:List[Mark] = []
+		self.__prefix__:Str = prefix
+		self.__queue__:SimpleQueue = SimpleQueue()
+		self.__size__:Int = size
+	
+	@property
+	def exception( self ) -> Union[BaseException,None]:
+		return self.__exception__
+	
+	def archive( self, source:Str, day:Str, marks:List[Mark] ) -> None:
+		
+		"""
+		Compress the closed log file into the segment of day after
+		the last segment
+		
+		:params Str source
+			The closed log file
+		:params Str day
+		:params List<Mark> marks
+			The records of log file
+		
+		:return None
+		"""
+		
+		if not marks:
+			remove( source )
+			return
+		prefix = f"{self.__prefix__} - {day}."
+		numbers = [ fname[len( prefix ):].split( "." )[0] for fname in listdir( self.__directory__ ) if fname.startswith( prefix ) ]
+		segment = max( ( int( number ) for number in numbers if number.isdigit() ), default=0 ) + 1
+		Archive.compress( source, marks, self.fname( day, segment ) )
+	
+	def close( self, timeout:Float=5.0 ) -> None:
+		
+		"""
+		Flush pending lines and stop the writer
+		
+		:params Float timeout
+			Maximum seconds to wait for pending lines written
+		
+		:return None
+		"""
+		
+		if self.is_alive():
+			self.__queue__.put( Closing )
+			self.join( timeout )
+	
+	def fname( self, day:Str, segment:Int=0 ) -> Str:
+		
+		"""
+		Return the log file name of day and segment
+		
+		:params Str day
+		:params Int segment
+			The number of segment, 0 for active file
+		
+		:return Str
+		"""
+		
+		if segment:
+			return f"{self.__directory__}/{self.__prefix__} - {day}.{segment}.log"
+		return f"{self.__directory__}/{self.__prefix__} - {day}.log"
+	
+	def flush( self, lines:List[Tuple[Str,Int,Float,Str]] ) -> None:
+		
+		"""
+		Write lines into the active log file, rotate the file when
+		the day has changed or the file is full
+		
+		:params List<Tuple<Str,Int,Float,Str>> lines
+			The line, level, time and thread of records
+		
+		:return None
+		"""
+		
+		chunks = [ line.encode( "utf-8" ) for line, *_ in lines ]
+		length = sum( len( chunk ) for chunk in chunks )
+		day = Clock.format( "%Y-%m-%d" )
+		if self.__day__ != day or self.__fopen__ is None or \
+		   self.__fopen__.tell() and self.__fopen__.tell() + length > self.__size__:
+			self.rotate( day )
+		offset = self.__fopen__.tell()
+		for chunk, ( _, level, time, thread ) in zip( chunks, lines ):
+			self.__marks__.append(( offset, len( chunk ), time, level, thread ))
+			offset += len( chunk )
+		self.__fopen__.write( b"".join( chunks ) )
+		self.__fopen__.flush()
+	
+	def marks( self, fname:Str ) -> List[Mark]:
+		
+		"""
+		Return the records of log file left by previous process,
+		the level, time and thread are parsed from the lines, the
+		line without prefix is continuation of previous record
+		
+		:params Str fname
+		
+		:return List<Mark>
+		"""
+		
+		levels = { alias: level for level, alias in Logging.Levels.items() }
+		names = { name: level for level, name in Logging.Names.items() }
+		zone = Clock.zone()
+		marks = []
+		offset = 0
+		with open( fname, "rb" ) as fread:
+			for chunk in fread:
+				line = chunk.decode( "utf-8", "replace" )
+				level = time = thread = None
+				if line.startswith( "{" ):
+					try:
+						event = decoder( line )
+						level = names.get( event['level'], 0 )
+						time = Float( event['ts'] )
+						thread = Str( event['thread'] )
+					except ( KeyError, TypeError, ValueError ):
+						pass
+				else:
+					matched = Prefix.match( Ansi.sub( "", line ) )
+					if matched is not None:
+						level = levels.get( matched.group( 1 ), 0 )
+						time = datetime.strptime( matched.group( 2 ), Logging.DateTimeFormat ).replace( tzinfo=zone ).timestamp()
+						thread = ""
+				if level is None and marks:
+					position, length, *values = marks[-1]
+					marks[-1] = ( position, length + len( chunk ), *values )
+				elif level is None:
+					marks.append(( offset, len( chunk ), 0.0, 0, "" ))
+				else:
+					marks.append(( offset, len( chunk ), time, level, thread ))
+				offset += len( chunk )
+		return marks
+	
+	def put( self, line:Str, level:Int=0, time:Union[Float,None]=None, thread:Union[Int,Str]="" ) -> None:
+		
+		"""
+		Enqueue line to be written, never blocks
+		
+		:params Str line
+		:params Int level
+			The logging level of line
+		:params Float|None time
+			The timestamp of line, None for the current time
+		:params Int|Str thread
+			The thread of line
+		
+		:return None
+		"""
+		
+		self.__queue__.put(( line, level, Clock.time() if time is None else time, Str( thread ) ))
+	
+	def recover( self ) -> None:
+		
+		"""
+		Compress the log files left by previous process into the
+		segments, the records are parsed from the lines, the files
+		locked by running process are skipped
+		
+		:return None
+		"""
+		
+		if not path.isdir( self.__directory__ ):
+			return
+		sources = []
+		for fname in listdir( self.__directory__ ):
+			if " - " not in fname or not fname.endswith( ".log" ):
+				continue
+			parts = fname.split( " - ", 1 )[1][:-4].split( "." )
+			number = int( parts[1] ) if len( parts ) == 2 and parts[1].isdigit() else float( "inf" )
+			sources.append(( parts[0], number, fname ))
+		for day, _, fname in sorted( sources ):
+			source = f"{self.__directory__}/{fname}"
+			with open( source, "rb" ) as fread:
+				try:
+					flock( fread, LOCK_EX | LOCK_NB )
+				except BlockingIOError:
+					continue
+				self.archive( source, day, self.marks( source ) )
+	
+	def rotate( self, day:Str ) -> None:
+		
+		"""
+		Close and compress the active log file, compress the log
+		files left by previous process and open the log file of
+		day, the file is locked while active and the process id
+		is appended into the prefix when the file is locked by
+		another running process
+		
+		:params Str day
+		
+		:return None
+		"""
+		
+		if self.__fopen__ is not None:
+			self.shutdown()
+		self.recover()
+		mkdir( self.__directory__, exist_ok=True )
+		self.__day__ = day
+		self.__fopen__ = open( self.fname( day ), "ab" )
+		try:
+			flock( self.__fopen__, LOCK_EX | LOCK_NB )
+		except BlockingIOError:
+			self.__fopen__.close()
+			self.__prefix__ = f"{self.__prefix__}.{getpid()}"
+			self.__fopen__ = open( self.fname( day ), "ab" )
+			flock( self.__fopen__, LOCK_EX | LOCK_NB )
+	
+	def run( self ) -> None:
+		closing = False
+		lines = []
+		length = 0
+		deadline = Clock.monotonic() + self.__interval__
+		while not closing:
+			try:
+				line = self.__queue__.get( timeout=max( 0.0, deadline - Clock.monotonic() ) )
+				while True:
+					if line is Closing:
+						closing = True
+						break
+					lines.append( line )
+					length += len( line[0] )
+					if length >= self.__buffer__:
+						break
+					line = self.__queue__.get_nowait()
+			except Empty:
+				pass
+			if lines and ( closing or length >= self.__buffer__ or Clock.monotonic() >= deadline ):
+				try:
+					self.flush( lines )
+				except ( OSError, SQLiteError, ZstdError ) as e:
+					self.__exception__ = e
+				lines = []
+				length = 0
+			if Clock.monotonic() >= deadline:
+				deadline = Clock.monotonic() + self.__interval__
+		if self.__fopen__ is not None:
+			try:
+				self.shutdown()
+			except ( OSError, SQLiteError, ZstdError ) as e:
+				self.__exception__ = e
+	
+	def shutdown( self ) -> None:
+		
+		"""
+		Compress the active log file into segment and close, the
+		file is kept locked until the segment has been written
+		
+		:return None
+		"""
+		
+		marks = self.__marks__
+		self.__marks__ = []
+		try:
+			self.archive( self.fname( self.__day__ ), self.__day__, marks )
+		finally:
+			self.__fopen__.close()
+			self.__fopen__ = None
+	
+	...
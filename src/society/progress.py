@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import bool as Bool, float as Float, int as Int, str as Str
+from sys import stdout
+from threading import current_thread as CurrentThread, Event, Lock, Thread
+from typing import Any, Callable, Dict, final, IO, List, Tuple, Union
+
+from society.clock import Clock
+
+
+@final
+class Progress( Thread ):
+	
+	"""
+	Progress renderer of worker threads, the workers only update
+	the counters and the renderer thread redraws the aggregate state
+	and a line per worker at capped frame rate, nothing is drawn
+	when the output is not a terminal
+	"""
+	
+	Active:Union["Progress",None] = None
+	""" The progress which is drawing on terminal """
+	
+	Spinner:Str = "\\|/-"
+	""" Spinner characters of running worker """
+	
+	def __init__( self, name:Str, total:Union[Int,None]=None, fps:Float=10.0, output:IO=None ) -> None:
+		
+		"""
+		Construct method of class Progress
+		
+		:params Str name
+			The name of the job
+		:params Int|None total
+			The number of items, None when unknown
+		:params Float fps
+			Maximum frames per second
+		:params IO output
+			The terminal output, standard output by default
+		
+		:return None
+		"""
+		
+		Thread.__init__( self, name=f"Progress {name}", daemon=True )
+		self.__done__:Int = 0
+		self.__drawing__:Lock = Lock()
+		self.__failed__:Int = 0
+		self.__frame__:Int = 0
+		self.__height__:Int = 0
+		self.__interval__:Float = 1.0 / fps
+		self.__label__:Str = name
+		self.__locking__:Lock = Lock()
+		self.__output__:IO = output if output is not None else stdout
+		self.__started__:Float = Clock.monotonic()
+		self.__stopping__:Event = Event()
+		self.__total__:Union[Int,None] = total
+		self.__workers__:Dict[Str,Tuple[Str,Float]] = {}
+	
+	def __enter__( self ) -> "Progress":
+		if self.interactive and Progress.Active is None:
+			Progress.Active = self
+			self.start()
+		return self
+	
+	def __exit__( self, *args:object ) -> None:
+		self.close()
+	
+	@property
+	def done( self ) -> Int: return self.__done__
+	
+	@property
+	def failed( self ) -> Int: return self.__failed__
+	
+	@property
+	def interactive( self ) -> Bool:
+		try:
+			return self.__output__.isatty()
+		except ( AttributeError, ValueError ):
+			return False
+	
+	@property
+	def running( self ) -> Int: return len( self.__workers__ )
+	
+	def begin( self, label:Str ) -> None:
+		
+		"""
+		Mark the current worker thread as running the item
+		
+		:params Str label
+			The label of the item
+		
+		:return None
+		"""
+		
+		with self.__locking__:
+			self.__workers__[CurrentThread().name] = ( label, Clock.monotonic() )
+	
+	def call( self, label:Str, callback:Callable[...,Any], /, *args:Any, **kwargs:Any ) -> Any:
+		
+		"""
+		Call the callback as item of the current worker thread
+		
+		:params Str label
+			The label of the item
+		:params Callable callback
+		:params Any *args
+		:params Any **kwargs
+		
+		:return Any
+			The callback return value
+		"""
+		
+		self.begin( label )
+		try:
+			returns = callback( *args, **kwargs )
+		except BaseException:
+			self.finish( True )
+			raise
+		self.finish()
+		return returns
+	
+	def clear( self ) -> None:
+		
+		"""
+		Erase the lines of previous frame, the next frame is drawn
+		below the lines written after
+		
+		:return None
+		"""
+		
+		with self.__drawing__:
+			if self.__height__:
+				prefix = f"\x1b[{self.__height__ - 1}F" if self.__height__ > 1 else ""
+				self.__output__.write( f"{prefix}\x0d\x1b[J" )
+				self.__output__.flush()
+				self.__height__ = 0
+	
+	def close( self ) -> None:
+		
+		"""
+		Stop the renderer and draw the final frame
+		
+		:return None
+		"""
+		
+		self.__stopping__.set()
+		if self.is_alive():
+			self.join()
+		if Progress.Active is self:
+			Progress.Active = None
+	
+	def draw( self ) -> None:
+		
+		"""
+		Redraw the lines of previous frame with the current frame
+		
+		:return None
+		"""
+		
+		lines = self.render()
+		with self.__drawing__:
+			self.__frame__ += 1
+			prefix = f"\x1b[{self.__height__ - 1}F" if self.__height__ > 1 else ""
+			self.__output__.write( "".join([ prefix, "\x0d\x1b[J", "\x0a".join( lines ) ]) )
+			self.__output__.flush()
+			self.__height__ = len( lines )
+	
+	def finish( self, failed:Bool=False ) -> None:
+		
+		"""
+		Mark the item of the current worker thread as finished
+		
+		:params Bool failed
+		
+		:return None
+		"""
+		
+		with self.__locking__:
+			self.__workers__.pop( CurrentThread().name, None )
+			if failed:
+				self.__failed__ += 1
+			else:
+				self.__done__ += 1
+	
+	def render( self ) -> List[Str]:
+		
+		"""
+		Return the lines of the current frame
+		
+		:return List<Str>
+		"""
+		
+		with self.__locking__:
+			done = self.__done__
+			failed = self.__failed__
+			workers = sorted( self.__workers__.items() )
+		current = Clock.monotonic()
+		elapsed = current - self.__started__
+		rate = ( done + failed ) / elapsed if elapsed > 0 else 0.0
+		spinner = self.Spinner[self.__frame__ % len( self.Spinner )] if workers else "\x20"
+		summary = f"{spinner} {self.__label__} done={done} running={len( workers )} failed={failed} {rate:.1f}/s"
+		if self.__total__ is not None:
+			remaining = self.__total__ - done - failed
+			summary += f" {done + failed}/{self.__total__}"
+			if rate > 0 and remaining > 0:
+				summary += f" eta={remaining / rate:.0f}s"
+		lines = [ summary ]
+		for worker, ( label, started ) in workers:
+			lines.append( f"\x20\x20{worker} {label} {current - started:.1f}s" )
+		return lines
+	
+	def run( self ) -> None:
+		while not self.__stopping__.wait( self.__interval__ ):
+			self.draw()
+		self.draw()
+		with self.__drawing__:
+			self.__output__.write( "\x0a" )
+			self.__output__.flush()
+			self.__height__ = 0
+	
+	...
@@ -37,7 +37,7 @@ from requests.exceptions import (
 )
 from time import sleep
 from traceback import format_exception
-from typing import Any, MutableMapping, Tuple, Union
+from typing import Any, Final, MutableMapping, Tuple, Union
 from urllib3.exceptions import (
 	ConnectionError as UrllibConnectionError,
 	ConnectTimeoutError as UrllibConnectTimeoutError,
@@ -45,12 +45,19 @@ from urllib3.exceptions import (
 	NewConnectionError as UrllibNewConnectionError
 )
 
-from society.common import typeof
+from society.common import deprecated, typeof
+from society.context import Context
 from society.logging import Logging
 from society.storage import Storage
 
 
-def download( source:Str, mediaType:Str, directory:Str=None, proxies:MutableMapping[Str,Str]=None, stream:Bool=False, thread:Int=0 ) -> Str:
+Retrying:Final[Str] = "Retrying {} Request url=\"{}\" after {}<{}>: {}"
+""" Logging message of resumable request error, repeats are collapsed within 30 seconds """
+
+Logging.Collapsing.setdefault( Retrying, 30.0 )
+
+
+def download( source:Str, mediaType:Str, directory:Str=None, proxies:MutableMapping[Str,Str]=None, stream:Bool=False, thread:Int=None ) -> Str:
 
 	"""
 	Download media content e.g image, video
@@ -66,38 +73,40 @@ def download( source:Str, mediaType:Str, directory:Str=None, proxies:MutableMapp
 	:params Bool stream
 		Allow request stream
 	:params Int thread
-		Current thread position number
+		Deprecated and ignored
 	
 	:return Str
 	"""
 	
-	Logging.info( "Downloading media mime={}", mediaType, thread=thread, start="\x0d" )
+	if thread is not None:
+		deprecated( "thread", "download" )
+	Logging.info( "Downloading media mime={}", mediaType, start="\x0d" )
 	try:
-		response = request( "GET", url=source, proxies=proxies, stream=stream, thread=thread )
+		response = request( "GET", url=source, proxies=proxies, stream=stream )
 		if response.status_code == 200:
-			extename = extension( response, mediaType, "jpg" if mediaType == "image" else "mp4" if mediaType == "video" else "", thread=thread )
+			extename = extension( response, mediaType, "jpg" if mediaType == "image" else "mp4" if mediaType == "video" else "" )
 			pathname = directory if directory is not None else "history/contents"
 			filename = md5( source.encode( "utf-8" ) ).hexdigest()
 			fullname = f"{pathname}/{filename}.{extename}"
 			try:
 				Storage.mkdir( pathname )
 				Storage.touch( fullname, response.content, fmode="wb" )
-				Logging( "Downloaded mime={} saved={}", mediaType, fullname, thread=thread, start="\x0d" )
+				Logging( "Downloaded mime={} saved={}", mediaType, fullname, start="\x0d" )
 				return fullname
 			except OSError as e:
-				Logging.error( "Uncaught OSError: {}", e.strerror, thread=thread, start="\x0d" )
-				Logging.error( "Failed download media mime={}", mediaType, thread=thread, start="\x0d" )
+				Logging.error( "Uncaught OSError: {}", e.strerror, start="\x0d" )
+				Logging.error( "Failed download media mime={}", mediaType, start="\x0d" )
 	except( ExceptionGroup, TypeError ) as e:
 		if isinstance( e, ExceptionGroup ):
-			Logging.error( "Uncaught ExceptionGroup: {}", e.message, thread=thread, start="\x0d" )
+			Logging.error( "Uncaught ExceptionGroup: {}", e.message, start="\x0d" )
 			for group in list( e.exceptions ):
-				Logging.error( "Uncaught ExceptionGroup<{}>: {}", typeof( group ), "\x0a".join( format_exception( group ) ), thread=thread, start="\x0d" )
+				Logging.error( "Uncaught ExceptionGroup<{}>: {}", typeof( group ), "\x0a".join( format_exception( group ) ), start="\x0d" )
 		else:
-			Logging.error( "Uncaught TypeError: {}", e.args, thread=thread, start="\x0d" )
-		Logging.error( "Failed download media mime={}", mediaType, thread=thread, start="\x0d" )
+			Logging.error( "Uncaught TypeError: {}", e.args, start="\x0d" )
+		Logging.error( "Failed download media mime={}", mediaType, start="\x0d" )
 	return None
 
-def extension( response:Response, type:Str="image", default:Str="jpg", thread:Int=0 ) -> Str:
+def extension( response:Response, type:Str="image", default:Str="jpg", thread:Int=None ) -> Str:
 
 	"""
 	Return file extension name by request response.
@@ -108,11 +117,13 @@ def extension( response:Response, type:Str="image", default:Str="jpg", thread:In
 	:params Str default
 		The default file extension name when the response is unknown Content-Type
 	:params Int thread
-		Current thread position number
+		Deprecated and ignored
 	
 	:return Str
 	"""
 	
+	if thread is not None:
+		deprecated( "thread", "extension" )
 	contentType = response.headers['Content-Type']
 	matched = match( r"^(?:(?P<image>image)\/(?P<image_extension>jpg|jpeg|png|webp)|(?P<video>video\/(?P<video_extension>mp4|webm)))$", contentType )
 	if matched is not None:
@@ -121,9 +132,9 @@ def extension( response:Response, type:Str="image", default:Str="jpg", thread:In
 		if group in groups and groups[group]:
 			return groups[group]
 		return default
-	raise ValueError( f"Unsupported media type for Content-Type {contentType}", ( "thread", thread ) )
+	raise ValueError( f"Unsupported media type for Content-Type {contentType}", ( "thread", Context.get( "index", 0 ) ) )
 
-def request( method:Str, url:Str, auth:Union[HTTPBasicAuth,HTTPDigestAuth,HTTPProxyAuth,Tuple[Str,Str]]=None, data:MutableMapping[Str,Any]=None, cookies:MutableMapping[Str,Str]=None, headers:MutableMapping[Str,Str]=None, params:MutableMapping[Str,Str]=None, payload:MutableMapping[Str,Any]=None, proxies:MutableMapping[Str,Str]=None, stream:Bool=False, timeout:Int=None, tries:Int=10, thread:Int=0 ) -> Response:
+def request( method:Str, url:Str, auth:Union[HTTPBasicAuth,HTTPDigestAuth,HTTPProxyAuth,Tuple[Str,Str]]=None, data:MutableMapping[Str,Any]=None, cookies:MutableMapping[Str,Str]=None, headers:MutableMapping[Str,Str]=None, params:MutableMapping[Str,Str]=None, payload:MutableMapping[Str,Any]=None, proxies:MutableMapping[Str,Str]=None, stream:Bool=False, timeout:Int=None, tries:Int=10, thread:Int=None ) -> Response:
 	
 	"""
 	Send HTTP Request
@@ -153,7 +164,7 @@ def request( method:Str, url:Str, auth:Union[HTTPBasicAuth,HTTPDigestAuth,HTTPPr
 	:params Int tries
 		Http request timeout tries
 	:params Int thread
-		Current thread position number
+		Deprecated and ignored
 	
 	:return Response
 	:raises ExceptionGroup
@@ -174,6 +185,8 @@ def request( method:Str, url:Str, auth:Union[HTTPBasicAuth,HTTPDigestAuth,HTTPPr
 			...
 	"""
 	
+	if thread is not None:
+		deprecated( "thread", "request" )
 	counter = 0
 	session = Session()
 	throwned = []
@@ -195,56 +208,58 @@ def request( method:Str, url:Str, auth:Union[HTTPBasicAuth,HTTPDigestAuth,HTTPPr
 	)
 	if tries <= 0:
 		tries = 10
-	while counter <= 10:
-		Logging.info( "Trying {} Request url=\"{}\"", method, url, thread=thread, start="\x0d" )
-		try:
-			response = session.request( 
-				url=url, 
-				data=data, 
-				auth=auth,
-				json=payload, 
-				stream=stream,
-				method=method, 
-				cookies=cookies, 
-				headers=headers, 
-				timeout=timeout,
-				proxies=proxies,
-				params=params 
-			)
+	with Context.bind( request=Context.request() ):
+		while counter <= 10:
+			Logging.info( "Trying {} Request url=\"{}\"", method, url, start="\x0d" )
 			try:
-				encoding = response.headers['Content-Encoding'] \
-					if "Content-Encoding" in response.headers \
-					else None
-				if encoding is not None:
-					content = response._content
-					match encoding:
-						case "br":
-							content = BrotliDecompress( response.content )
-						case "gzip":
-							content = GzipDecompress( response.content )
-						case "zstd":
-							content = ZstdDecompress( response.content )
-						case _:
-							raise UnicodeEncodeError( f"Unsupported encoding {encoding}" )
-					response._content = content
-				...
-			except BadGzipFile:
-				...
-			except BrotliError:
-				...
-			except ZstdError:
-				...
-			return response
-		except BaseException as e:
-			instance = type( e )
-			throwable.append( e )
-			if instance in throwable:
-				Logging.error( "{}<{}>: {}", typeof( e ), counter, e, thread=thread )
-				if isinstance( e, continueable ):
-					counter += 1
-					sleep( 2 )
-					continue
-			if throwned:
-				raise ExceptionGroup( f"An error occurred while sending a {method} request to url=\"{url}\"", throwned ) from e
-			raise TypeError( ( "prev", e ), ( "thread", thread ) ) from e
+				response = session.request( 
+					url=url, 
+					data=data, 
+					auth=auth,
+					json=payload, 
+					stream=stream,
+					method=method, 
+					cookies=cookies, 
+					headers=headers, 
+					timeout=timeout,
+					proxies=proxies,
+					params=params 
+				)
+				try:
+					encoding = response.headers['Content-Encoding'] \
+						if "Content-Encoding" in response.headers \
+						else None
+					if encoding is not None:
+						content = response._content
+						match encoding:
+							case "br":
+								content = BrotliDecompress( response.content )
+							case "gzip":
+								content = GzipDecompress( response.content )
+							case "zstd":
+								content = ZstdDecompress( response.content )
+							case _:
+								raise UnicodeEncodeError( f"Unsupported encoding {encoding}" )
+						response._content = content
+					...
+				except BadGzipFile:
+					...
+				except BrotliError:
+					...
+				except ZstdError:
+					...
+				return response
+			except BaseException as e:
+				instance = type( e )
+				throwable.append( e )
+				if instance in throwable:
+					if isinstance( e, continueable ):
+						Logging.error( Retrying, method, url, typeof( e ), counter, e )
+						counter += 1
+						sleep( 2 )
+						continue
+					Logging.error( "{}<{}>: {}", typeof( e ), counter, e )
+				if throwned:
+					raise ExceptionGroup( f"An error occurred while sending a {method} request to url=\"{url}\"", throwned ) from e
+				raise TypeError( ( "prev", e ), ( "thread", Context.get( "index", 0 ) ) ) from e
 	return None
@@ -31,7 +31,9 @@ from society.typing.immutable import Immutable
 from society.typing.map import Map
 from society.typing.parser import Parser
 from society.typing.properties import Properties
+from society.typing.query import Query
 from society.typing.readonly import Readonly
+from society.typing.record import Record, Records
 from society.typing.result import Result
 from society.typing.schema import Schema
 from society.typing.search import Filter, Tab
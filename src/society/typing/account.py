@@ -25,13 +25,12 @@
 from builtins import bool as Bool, str as Str
 from datetime import datetime, timedelta
 from json import loads as decoder
-from pytz import timezone
 from typing import final
 
+from society.clock import Clock
 from society.typing.authorization import Authorization
 from society.typing.browser import Browser
 from society.typing.builtins import Self
-from society.typing.properties import Properties
 from society.typing.readonly import Readonly
 
 
@@ -40,6 +39,8 @@ class Account( Readonly ):
 	
 	""" Account Typing Implementation """
 	
+	__slots__ = ( "authorization", "browser", "usermail", "username", "password" )
+	
 	def __init__( self, authorization:Authorization, browser:Browser, usermail:Str=None, username:Str=None, password:Str=None ) -> None:
 		
 		"""
@@ -102,7 +103,7 @@ class Account( Readonly ):
 				content = values[values.index( "\x7b" ):]
 				decoded = decoder( content )
 				signout = timedelta( days=3 )
-				currzone = timezone( Properties.TimeZone )
+				currzone = Clock.zone()
 				currtime = datetime.now( currzone )
 				try:
 					presence = datetime.fromtimestamp( decoded['utc3'], currzone )
@@ -32,6 +32,8 @@ class Anonymity( Readonly ):
 	
 	""" Anonymity Typing Implementation """
 	
+	__slots__ = ( "proxies", "torify" )
+	
 	def __init__( self, proxies:Guard[Union[Dict[Str,Str],None]], torify:Guard[Dict[Str,Any]] ) -> None:
 		
 		"""
@@ -40,6 +40,8 @@ class Authorization( Readonly ):
 	
 	""" Authorization Typing Implementation """
 	
+	__slots__ = ( "accessToken", "browser", "machineId", "secret", "sessionKey", "storageKey", "uid", "username", "password" )
+	
 	def __init__( self, username:Str, password:Str, accessToken:Str=None, browser:Str=None, machineId:Str=None, secret:Str=None, sessionKey:Str=None, storageKey:Str=None, uid:Str=None ) -> None:
 		
 		"""
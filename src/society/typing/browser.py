@@ -46,6 +46,8 @@ class Browser( Readonly ):
 	
 	""" Base Browser class """
 	
+	__slots__ = ( "driver", "cookies", "headers", "options", "payload", "session", "storage" )
+	
 	def __init__( self, driver:Str, cookies:Union[List[Dict[Str,Val]],Str], headers:Dict[Str,Str], options:List[Dict[Str,Any]], payload:Dict[Str,Str], session:Dict[Str,Str], storage:Dict[Str,Str] ) -> None:
 		
 		"""
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from array import array
+from builtins import bool as Bool, int as Int, str as Str
+from math import nan
+from sys import intern
+from typing import Any, Dict, final, Final, Iterable, List, Union
+
+from society.typing.builtins import Val
+from society.typing.query import Query
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+
+Exact:Final[Int] = 2 ** 53
+""" Largest integer magnitude stored in float column without losing precision """
+
+
+@final
+class Column:
+	
+	"""
+	Column buffer of query values, numeric values are stored in
+	array.array, strings are interned and the column falls back
+	to list of objects when the values have mixed types
+	"""
+	
+	__slots__ = ( "__buffer__", "__missing__", "__query__", "__typecode__" )
+	
+	def __init__( self, query:Union[Query,Str] ) -> None:
+		
+		"""
+		Construct method of class Column
+		
+		:params Query|Str query
+		
+		:return None
+		"""
+		
+		self.__buffer__:Union[array,List[Val]] = []
+		self.__missing__:Int = 0
+		self.__query__:Query = query if isinstance( query, Query ) else Query( query )
+		self.__typecode__:Union[Str,None] = None
+	
+	def __len__( self ) -> Int:
+		return self.__missing__ + len( self.__buffer__ )
+	
+	def append( self, value:Val ) -> None:
+		
+		"""
+		Append value into column buffer, promote the buffer when the
+		value does not fit into current type of column, integers out
+		of int64 or beyond float precision promote into objects
+		
+		:params Val value
+		
+		:return None
+		"""
+		
+		typecode = self.__typecode__
+		kind = type( value )
+		if typecode == "q":
+			if kind is int:
+				try:
+					self.__buffer__.append( value )
+					return
+				except OverflowError:
+					pass
+			elif kind is float or value is None:
+				if all( -Exact <= item <= Exact for item in self.__buffer__ ):
+					self.__promote__( "d" )
+					self.__buffer__.append( nan if value is None else value )
+					return
+			elif kind is bool:
+				self.__buffer__.append( value )
+				return
+		elif typecode == "d":
+			if kind is float or kind is bool or kind is int and -Exact <= value <= Exact:
+				self.__buffer__.append( value )
+				return
+			if value is None:
+				self.__buffer__.append( nan )
+				return
+		elif typecode == "s":
+			if kind is str:
+				self.__buffer__.append( intern( value ) )
+				return
+			if value is None:
+				self.__buffer__.append( None )
+				return
+		elif typecode is None:
+			if value is None:
+				self.__missing__ += 1
+				return
+			if kind is int or kind is bool:
+				self.__typecode__ = "d" if self.__missing__ else "q"
+				self.__buffer__ = array( self.__typecode__, [ nan ] * self.__missing__ )
+			elif kind is float:
+				self.__typecode__ = "d"
+				self.__buffer__ = array( "d", [ nan ] * self.__missing__ )
+			elif kind is str:
+				self.__typecode__ = "s"
+				self.__buffer__ = [ None ] * self.__missing__
+			else:
+				self.__typecode__ = "o"
+				self.__buffer__ = [ None ] * self.__missing__
+			self.__missing__ = 0
+			self.append( value )
+			return
+		if typecode != "o":
+			self.__promote__( "o" )
+		self.__buffer__.append( value )
+	
+	def __promote__( self, typecode:Str ) -> None:
+		
+		"""
+		Convert the column buffer into wider type
+		
+		:params Str typecode
+			The d for float array, o for list of objects
+		
+		:return None
+		"""
+		
+		if typecode == "d":
+			self.__buffer__ = array( "d", self.__buffer__ )
+		elif self.__typecode__ == "d":
+			self.__buffer__ = [ None if item != item else item for item in self.__buffer__ ]
+		else:
+			self.__buffer__ = list( self.__buffer__ )
+		self.__typecode__ = typecode
+	
+	@property
+	def buffer( self ) -> Union[array,List[Val]]:
+		
+		"""
+		Return the column buffer, array of int64 or float64 for the
+		numeric column, otherwise list of values
+		
+		:return Array|List<Val>
+		"""
+		
+		if self.__missing__:
+			return [ None ] * self.__missing__
+		return self.__buffer__
+	
+	@property
+	def query( self ) -> Query:
+		return self.__query__
+	
+	def toNumpy( self ) -> Any:
+		
+		"""
+		Return the column buffer as NumPy array, the numeric buffer
+		is shared without copying
+		
+		:return numpy.ndarray
+		:raises ModuleNotFoundError
+			When the NumPy is not installed
+		"""
+		
+		if numpy is None:
+			raise ModuleNotFoundError( "NumPy is required for convert column into NumPy array" )
+		buffer = self.buffer
+		if isinstance( buffer, array ):
+			return numpy.frombuffer( buffer, dtype=numpy.int64 if buffer.typecode == "q" else numpy.float64 )
+		return numpy.array( buffer, dtype=object )
+	
+
+def columnar( records:Iterable[Any], paths:Iterable[Union[Query,Str]], ndarray:Bool=False ) -> Dict[Str,Any]:
+	
+	"""
+	Return the column buffers of records in a single pass, the
+	columns are built for each query path, missing values are
+	stored as NaN in the numeric column and None in the others
+	
+	:params Iterable<Map|Dict> records
+	:params Iterable<Query|Str> paths
+		The query of each column, e.g. node.members.count
+	:params Bool ndarray
+		Return NumPy arrays instead of array and list
+	
+	:return Dict<Str,Array|List<Val>|numpy.ndarray>
+	"""
+	
+	columns = [ Column( path ) for path in paths ]
+	queries = [ ( column.append, column.query ) for column in columns ]
+	for record in records:
+		for append, query in queries:
+			append( query( record ) )
+	if ndarray is True:
+		return { column.query.expression: column.toNumpy() for column in columns }
+	return { column.query.expression: column.buffer for column in columns }
+
@@ -34,5 +34,7 @@ class Immutable( Abstract, Generic[Key, Val] ):
 	Base abstract class for immutability
 	"""
 	
+	__slots__ = ()
+	
 	...
 
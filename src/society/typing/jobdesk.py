@@ -44,11 +44,15 @@ class Jobdesk( Readonly ):
 	
 	""" A Jobdesk class implementation """
 	
+	__slots__ = ( "name", "thread", "execute", "keysets", "pattern", "syntax", "message", "dataset", "allowed", "escapes", "requires" )
+	
 	@final
 	class Message( Readonly ):
 		
 		""" A Jobdesk Message class implementation """
 		
+		__slots__ = ( "name", "loading", "success" )
+		
 		def __init__( self, name:Str=None, loading:Str=None, success:Str=None ) -> None:
 			
 			"""
@@ -72,6 +76,8 @@ class Jobdesk( Readonly ):
 		
 		""" A Jobdesk Parameter Requirement class implementation """
 		
+		__slots__ = ( "keyset", "name" )
+		
 		def __init__( self, name:Str, keyset:Str ) -> None:
 			
 			"""
@@ -88,14 +94,14 @@ class Jobdesk( Readonly ):
 		
 		...
 	
-	def __init__( self, name:Str, thread:Thread, execute:Callable[[Args,Kwargs,Int],Any], keysets:Dict[Str,Union[Callable,List[Union[Callable,Type]],Type]], pattern:Union[Pattern[Str],Str], syntax:Str, message:Message, dataset:Str=None, allowed:Bool=None, escapes:List[Str]=None, requires:List[Require]=None ) -> None:
+	def __init__( self, name:Str, thread:Thread, execute:Callable[[Args,Kwargs],Any], keysets:Dict[Str,Union[Callable,List[Union[Callable,Type]],Type]], pattern:Union[Pattern[Str],Str], syntax:Str, message:Message, dataset:Str=None, allowed:Bool=None, escapes:List[Str]=None, requires:List[Require]=None ) -> None:
 		
 		"""
 		Construct method of class Jobdesk
 		
 		:params Str name
 		:params Thread thread
-		:params Callable<<Args,Kwargs,Int>,Any> execute
+		:params Callable<<Args,Kwargs>,Any> execute
 		:params Dict<Str,Callable|List<Callable|Type>Type> keysets
 		:params Pattern<Str>|Str pattern
 		:parans Str syntax
@@ -110,7 +116,7 @@ class Jobdesk( Readonly ):
 		
 		self.name:Str = name
 		self.thread:Thread = thread
-		self.execute:Callable[[Args,Kwargs,Int],Any] = execute
+		self.execute:Callable[[Args,Kwargs],Any] = execute
 		self.keysets:Dict[Str,Union[Callable,List[Union[Callable,Type]],Type]] = keysets
 		if pattern is not None and not isinstance( pattern, Pattern ):
 			pattern = compile( pattern )
@@ -23,65 +23,202 @@
 #
 
 from builtins import bool as Bool, int as Int, str as Str
-from json import dumps as encoder
-from typing import Any, Dict, final, List, MutableMapping, Tuple, Union
+from codecs import getincrementaldecoder
+from copy import deepcopy
+from io import BufferedIOBase, BytesIO, RawIOBase, StringIO
+from json import JSONDecodeError, JSONDecoder, loads
+from json.decoder import WHITESPACE
+from json.encoder import encode_basestring, encode_basestring_ascii
+from operator import is_
+from sys import intern
+from threading import Lock
+from typing import Any, Callable, Dict, final, Final, IO, Iterable, Iterator, ItemsView, KeysView, List, Mapping, MutableMapping, Tuple, Type, Union, ValuesView
+from weakref import ref, WeakKeyDictionary, WeakValueDictionary
 
-from society.common import serializeable, typeof
+from society.common import typeof
 from society.typing.builtins import Key, Val, Self
 from society.typing.immutable import Immutable
 
 
+Builders:WeakKeyDictionary = WeakKeyDictionary()
+""" Generated MapBuilder class by parent type, both weakly referenced """
+
+Materializing:Lock = Lock()
+""" Lock for caching materialized value of lazy Map """
+
+Sharing:Final[Int] = 64
+""" Maximum number of keys of Map sharing the key table """
+
+Unversioned:Final[Tuple[Str,...]] = ( "__epoch__", "__merged__", "__versions__" )
+""" The Map storage attributes which are not kept in the state of snapshot """
+
+
 class Map( MutableMapping[Key,Val] ):
 	
 	""" A python Map utility to transform any dictionary structure into Map """
 	
-	def __init__( self, collection:Union[Self,MutableMapping[Key,Val]]=None ) -> None:
+	__identity__:Union[Callable[[Val],Any],Tuple[Key,...],None] = None
+	""" Identity of Map item when merging list, key names or function, None for whole item """
+	
+	def __init__( self, collection:Union[Self,MutableMapping[Key,Val]]=None, lazy:Bool=False ) -> None:
 
 		"""
 		Construct method of class Map.
 
 		:params Dict<Key, Value>|Map data
-		:params Any parent
+		:params Bool lazy
+			Keep nested dict and list raw until first access, the
+			Map takes ownership of the raw values and they must not
+			be mutated by the caller afterward, the default copies
 
 		:return None
 		"""
 
 		if isinstance( self, Immutable ):
-			self.__dict__['__excepts__'] = [
-				"__index__"
-			]
-		self.__dict__['__index__'] = 0
+			self.__dict__['__excepts__'] = []
+		self.__dict__['__shape__'] = Shape.Root
+		self.__dict__['__indexes__'] = Shape.Root.indexes
+		self.__dict__['__epoch__'] = Epoch.Current
+		self.__dict__['__frozen__'] = False
+		self.__dict__['__lazy__'] = lazy is True
+		self.__dict__['__pending__'] = set() if lazy is True else None
 		self.__dict__['__values__'] = []
-		self.__dict__['__keysets__'] = []
+		self.__dict__['__keysets__'] = Shape.Root.keysets
 		self.update( collection if isinstance( collection, ( dict, Map ) ) else {} )
 	
+	@final
+	def __append__( self, keyset:Key, value:Val ) -> None:
+		
+		"""
+		Append new item, move the Map into the shared key table of
+		the next shape or into its own key table when the Map has
+		too many keys for sharing
+		
+		:params Key keyset
+		:params Val value
+		
+		:return None
+		"""
+		
+		storage = self.__dict__
+		shape = storage['__shape__']
+		if shape is not None:
+			successor = shape.transition( keyset )
+			if successor is not None:
+				storage['__shape__'] = successor
+				storage['__indexes__'] = successor.indexes
+				storage['__keysets__'] = successor.keysets
+				storage['__values__'].append( value )
+				return
+			self.__unshare__()
+		storage['__indexes__'][keyset] = len( storage['__values__'] )
+		storage['__keysets__'].append( keyset )
+		storage['__values__'].append( value )
+	
 	@final
 	def __contains__( self, name:Key ) -> Bool:
 		
 		""" Return whether the Map has or contains attribute|item name """
 		
-		return name in self.__keysets__
+		return name in self.__dict__['__indexes__']
 
+	@final
+	def __copy__( self ) -> Self:
+		
+		"""
+		Return shallow copy of Map, the values are shared with the Map,
+		the snapshot is returned as is
+		
+		:return Map
+		"""
+		
+		if self.__dict__['__frozen__']:
+			return self
+		instance = Map.__new__( type( self ) )
+		storage = instance.__dict__
+		storage.update( ( name, item ) for name, item in self.__dict__.items() if name not in Unversioned )
+		storage['__epoch__'] = Epoch.Current
+		storage['__values__'] = list( storage['__values__'] )
+		if storage['__shape__'] is None:
+			storage['__indexes__'] = dict( storage['__indexes__'] )
+			storage['__keysets__'] = list( storage['__keysets__'] )
+		if storage['__pending__'] is not None:
+			storage['__pending__'] = set( storage['__pending__'] )
+		if "__excepts__" in storage:
+			storage['__excepts__'] = list( storage['__excepts__'] )
+		return instance
+	
+	@final
+	def __deepcopy__( self, memo:Dict[Int,Any] ) -> Self:
+		
+		"""
+		Return deep copy of Map, the shared key table is kept shared,
+		the snapshot is returned as is
+		
+		:params Dict<Int,Any> memo
+		
+		:return Map
+		"""
+		
+		if self.__dict__['__frozen__']:
+			return self
+		instance = Map.__new__( type( self ) )
+		memo[id( self )] = instance
+		storage = instance.__dict__
+		shared = self.__dict__['__shape__'] is not None
+		for name, item in self.__dict__.items():
+			if name in Unversioned:
+				continue
+			if name in ( "__frozen__", "__lazy__", "__shape__" ) or shared and name in ( "__indexes__", "__keysets__" ):
+				storage[name] = item
+			else:
+				storage[name] = deepcopy( item, memo )
+		storage['__epoch__'] = Epoch.Current
+		return instance
+	
 	@final
 	def __delattr__( self, key:Key ) -> None:
 		
 		""" Delete attribute|item from Map """
 		
+		if self.__dict__['__frozen__']:
+			raise TypeError( f"Cannot delete attribute \"{key}\", cannot delete attribute of Map snapshot" )
+		if self.__dict__.get( '__epoch__', 0 ) < Epoch.Current:
+			self.__preserve__()
 		if key in self.__dict__:
-			if key not in [ "__keysets__", "__index__", "__values__" ]:
+			if key not in [ "__epoch__", "__frozen__", "__keysets__", "__indexes__", "__lazy__", "__merged__", "__pending__", "__shape__", "__values__", "__versions__" ]:
 				del self.__dict__[key]
-		elif key in self.__dict__['__keysets__']:
-			del self.__dict__['__keysets__'][key]
+		elif key in self.__dict__['__indexes__']:
+			self.__delitem__( key )
 	
 	@final
 	def __delitem__( self, index:Key ) -> None:
 		
 		""" Delete item|attribute from Map """
 		
-		if index in self.__dict__['__keysets__']:
-			del self.__dict__['__keysets__'][index]
+		if self.__dict__['__frozen__']:
+			raise TypeError( f"Cannot delete item \"{index}\", cannot delete item of Map snapshot" )
+		if self.__dict__.get( '__epoch__', 0 ) < Epoch.Current:
+			self.__preserve__()
+		if index in self.__dict__['__indexes__']:
+			if self.__dict__['__pending__']:
+				self.__dict__['__pending__'].discard( index )
+			shape = self.__dict__['__shape__']
+			if shape is not None and shape.keysets[-1] == index:
+				self.__dict__['__shape__'] = shape.parent
+				self.__dict__['__indexes__'] = shape.parent.indexes
+				self.__dict__['__keysets__'] = shape.parent.keysets
+				self.__dict__['__values__'].pop()
+				return
+			self.__unshare__()
+			indexes = self.__dict__['__indexes__']
+			position = indexes.pop( index )
+			del self.__dict__['__keysets__'][position]
+			del self.__dict__['__values__'][position]
+			for keyset in self.__dict__['__keysets__'][position:]:
+				indexes[keyset] -= 1
 		elif index in self.__dict__:
-			if index not in [ "__keysets__", "__index__", "__parent__" ]:
+			if index not in [ "__epoch__", "__frozen__", "__keysets__", "__indexes__", "__lazy__", "__merged__", "__pending__", "__shape__", "__values__", "__versions__" ]:
 				del self.__dict__[index]
 	
 	@final
@@ -91,8 +228,11 @@ class Map( MutableMapping[Key,Val] ):
 		
 		if name in self.__dict__:
 			return self.__dict__[name]
-		if name in self.__dict__['__keysets__']:
-			return self.__dict__['__values__'][self.__dict__['__keysets__'].index( name )]
+		position = self.__dict__['__indexes__'].get( name )
+		if position is not None:
+			if self.__dict__['__pending__'] and name in self.__dict__['__pending__']:
+				return self.__materialize__( name, position )
+			return self.__dict__['__values__'][position]
 		raise AttributeError( "\"{}\" Map object has no attribute \"{}\"".format( typeof( self ), name ) )
 	
 	@final
@@ -100,74 +240,117 @@ class Map( MutableMapping[Key,Val] ):
 		
 		""" Return item|attribute value """
 		
-		if key in self.__dict__['__keysets__']:
-			return self.__dict__['__values__'][self.__dict__['__keysets__'].index( key )]
+		position = self.__dict__['__indexes__'].get( key )
+		if position is not None:
+			if self.__dict__['__pending__'] and key in self.__dict__['__pending__']:
+				return self.__materialize__( key, position )
+			return self.__dict__['__values__'][position]
 		if key in self.__dict__:
 			return self.__dict__[key]
 		raise KeyError( "\"{}\" Map object has no item \"{}\"".format( typeof( self ), key ) )
 
 	@final
-	@property
-	def __index__( self ) -> Int:
+	def __iter__( self ) -> Iterator[Tuple[Key,Val]]:
 		
-		""" Return current index iteration """
+		""" Return new independent iterator of key value pairs """
 		
-		return self.__dict__['__index__']
-	
+		return iter( MapItems( self ) )
+
 	@final
-	def __iter__( self ) -> Self:
+	def __serialize__( self, fp:IO=None, **kwargs:Any ) -> Union[Str,None]:
 		
-		""" Return current instance """
+		"""
+		Serialize map instance into Json String
 		
-		return self
-
-	@final
-	def __serialize__( self, *args:Any, **kwargs:Any ) -> Str:
+		:params IO fp
+			Write the Json incrementally into text or binary file object
+			instead of returning the Json String
+		:params Any **kwargs
+			The json.dumps options e.g indent, separators, ensure_ascii, sort_keys
 		
-		""" Serialize map instance into Json String """
+		:return Str|None
+		"""
 		
-		def iterator( values:Union[Dict[Key,Val],List[Val]] ) -> Dict[Key,Val]:
-			if isinstance( values, dict ):
-				for keyset in values:
-					value = values[keyset]
-					if isinstance( value, ( dict, list ) ):
-						values[keyset] = iterator( values[keyset] )
-					elif not serializeable( value ):
-						values[keyset] = str( value )
-			elif isinstance( value, list ):
-				for index, value in enumerate( values ):
-					if isinstance( value, ( dict, list ) ):
-						values[index] = iterator( value )
-					elif not serializeable( value ):
-						values[index] = str( value )
-			return values
-		return encoder( iterator( self.__props__() ), *args, **kwargs )
+		if fp is None:
+			chunks = []
+			serialize( self, chunks.append, **kwargs )
+			return "".join( chunks )
+		if isinstance( fp, ( BufferedIOBase, RawIOBase ) ) or "b" in getattr( fp, "mode", "" ):
+			serialize( self, lambda chunk: fp.write( chunk.encode( "utf-8" ) ), **kwargs )
+		else:
+			serialize( self, fp.write, **kwargs )
+		return None
 	
 	@final
 	def __len__( self ) -> Int:
 		
 		""" Return length of map """
 		
-		return len( self.__dict__['__keysets__'] )
+		return len( self.__dict__['__values__'] )
 
 	@final
-	def __next__( self ) -> Tuple[Key,Val]:
+	def __materialize__( self, keyset:Key, position:Int ) -> Val:
+		
+		"""
+		Wrap the raw value of lazy Map, or resolve the child of
+		snapshot as seen by the snapshot, and cache it in place
+		
+		:params Key keyset
+		:params Int position
 		
-		""" Return next item by index """
+		:return Val
+		"""
 		
-		index = self.__dict__['__index__']
+		if not self.__dict__['__frozen__'] and self.__dict__.get( '__epoch__', 0 ) < Epoch.Current:
+			self.__preserve__()
 		values = self.__dict__['__values__']
-		keysets = self.__dict__['__keysets__']
-		length = self.length
-		try:
-			if index < length:
-				self.__index__ += 1
-				keyset = keysets[index]
-				value = values[index]
-				return tuple( (keyset, value) )
-		except IndexError:
-			pass
-		raise StopIteration
+		raw = values[position]
+		value = detach( self, raw )
+		with Materializing:
+			if values[position] is raw:
+				values[position] = value
+				self.__dict__['__pending__'].discard( keyset )
+			else:
+				value = values[position]
+		return value
+	
+	@final
+	def __merge__( self, keyset:Key, original:List[Val], values:List[Val] ) -> None:
+		
+		"""
+		Append the items into original list except the items already
+		exists, Map and dict items are identified by __identity__ of
+		the Map type, when the identity is not set or the item has
+		no identity, the items are compared by whole item fingerprint
+		
+		The identities of original list are cached by the key and
+		reused while the list still holds the same item objects, an
+		item mutated in place keeps the identity of the last merge
+		
+		:params Key keyset
+		:params List<Val> original
+		:params List<Val> values
+		
+		:return None
+		"""
+		
+		identity = self.__identity__
+		merged = self.__dict__.get( '__merged__' )
+		if merged is None:
+			merged = self.__dict__['__merged__'] = {}
+		cached = merged.get( keyset )
+		if cached is not None and cached[0] is original and len( cached[1] ) == len( original ) and all( map( is_, cached[1], original ) ):
+			identities = cached[2]
+		else:
+			identities = set( identify( item, identity ) for item in original )
+		if isinstance( original, MapList ) and original.__epoch__ < Epoch.Current:
+			original.__preserve__()
+		for item in values:
+			fingerprinted = identify( item, identity )
+			if fingerprinted not in identities:
+				identities.add( fingerprinted )
+				list.append( original, item )
+		merged[keyset] = ( original, list( original ), identities )
 	
 	@final
 	def __props__( self ) -> Dict[Key,Val]:
@@ -178,46 +361,93 @@ class Map( MutableMapping[Key,Val] ):
 		:return Dict<Key, Value>
 		"""
 
+		def mapping( value:Union[Dict[Key,Val],Map[Key,Val]] ) -> Dict[Key,Val]:
+			if isinstance( value, Map ):
+				return value.__props__()
+			result = {}
+			for keyset, item in value.items():
+				if isinstance( item, ( dict, Map ) ):
+					result[keyset] = mapping( item )
+				elif isinstance( item, ( list, tuple ) ):
+					result[keyset] = sequence( item )
+				else:
+					result[keyset] = item
+			return result
+		def sequence( value:List[Val] ) -> List[Val]:
+			return [ mapping( item ) if isinstance( item, ( dict, Map ) ) else sequence( item ) if isinstance( item, ( list, tuple ) ) else item for item in value ]
 		result = {}
-		values = self.__dict__['__values__']
-		for index, keyset in enumerate( self.__dict__['__keysets__'] ):
-			if isinstance( values[index], Map ):
-				result[keyset] = values[index].__props__()
-			elif isinstance( values[index], list ):
-				result[keyset] = []
-				for item in values[index]:
-					if isinstance( item, Map ):
-						result[keyset].append( item.__props__() )
-					else:
-						result[keyset].append( item )
+		for keyset, value in entries( self ):
+			if isinstance( value, ( dict, Map ) ):
+				result[keyset] = mapping( value )
+			elif isinstance( value, ( list, tuple ) ):
+				result[keyset] = sequence( value )
 			else:
-				result[keyset] = values[index]
+				result[keyset] = value
 		return result
 	
+	@final
+	def __preserve__( self ) -> None:
+		
+		"""
+		Keep the state of Map for the alive snapshots before the first
+		change after snapshot, the storage is moved into the versions
+		and the Map continues with copied storage, so the snapshot
+		still reads the state even through the references taken
+		before, the versions no longer seen by any snapshot are
+		dropped
+		
+		:return None
+		"""
+		
+		storage = self.__dict__
+		with Materializing:
+			epoch = storage.get( '__epoch__', 0 )
+			if epoch >= Epoch.Current:
+				return
+			versions, visible = retain( storage.get( '__versions__' ), epoch )
+			if visible:
+				versions.append(( Epoch.Current, { name: item for name, item in storage.items() if name not in Unversioned } ))
+				storage['__values__'] = list( storage['__values__'] )
+				if storage['__shape__'] is None:
+					storage['__indexes__'] = dict( storage['__indexes__'] )
+					storage['__keysets__'] = list( storage['__keysets__'] )
+				if storage['__pending__'] is not None:
+					storage['__pending__'] = set( storage['__pending__'] )
+				if "__excepts__" in storage:
+					storage['__excepts__'] = list( storage['__excepts__'] )
+			storage['__versions__'] = versions or None
+			storage['__epoch__'] = Epoch.Current
+	
+	@final
+	def __reduce__( self ) -> Tuple[Callable[[bytes],Self],Tuple[bytes]]:
+		
+		""" Return reduced Map for pickle, encoded by society codec """
+		
+		from society.codec import pack, unpack
+		return ( unpack, ( pack( self ), ) )
+	
 	@final
 	def __set__( self, keyset:Key, values:Union[Self,Union[Key,Val]] ) -> None:
-		if isinstance( values, ( dict, Map ) ):
-			define = typeof( self )
-			if isinstance( values, Map ) and define not in [ "Map", "MapBuilder" ]:
-				values = builder( self, values )
-			else:
-				values = Map( values )
-		if isinstance( values, list ):
-			for i, value in enumerate( values ):
-				if isinstance( value, ( dict, Map ) ):
-					if isinstance( value, Map ) and define not in [ "Map", "MapBuilder" ]:
-						value[i] = builder( self, value )
-					else:
-						value[i] = Map( value )
-		excepts = [ "__index__" ]
-		if isinstance( self, Immutable ):
-			excepts = [ *excepts, *self.__dict__['__excepts__'] ]
-		else:
-			excepts = [ *excepts, *self.__dict__['__keysets__'] ]
-		for eliminate in [ "__excepts__", "__keysets__", "__values__" ]:
-			if eliminate in excepts:
-				del excepts[excepts.index( eliminate )]
+		if self.__dict__['__frozen__']:
+			raise TypeError( f"Cannot set item \"{keyset}\", cannot set item of Map snapshot" )
+		if self.__dict__.get( '__epoch__', 0 ) < Epoch.Current:
+			self.__preserve__()
+		indexes = self.__dict__['__indexes__']
+		pending = self.__dict__['__pending__']
+		if self.__dict__['__lazy__'] and isinstance( values, ( dict, list ) ):
+			if keyset not in indexes and keyset not in self.__dict__:
+				pending.add( keyset )
+				self.__append__( keyset, values )
+				return
+		values = self.__wrap__( values )
+		immutable = isinstance( self, Immutable )
 		if keyset in self.__dict__:
+			excepts = []
+			if immutable:
+				excepts = [ *self.__dict__['__excepts__'] ]
+			for eliminate in [ "__epoch__", "__excepts__", "__frozen__", "__indexes__", "__keysets__", "__lazy__", "__shape__", "__values__", "__versions__" ]:
+				if eliminate in excepts:
+					del excepts[excepts.index( eliminate )]
 			if keyset == "__excepts__":
 				if isinstance( values, list ):
 					for value in values:
@@ -232,28 +462,27 @@ class Map( MutableMapping[Key,Val] ):
 			if keyset not in excepts:
 				raise TypeError( f"Cannot override attribute \"{keyset}\", cannot override attribute that has been set in a class that extends the Immutable class" )
 			self.__dict__[keyset] = values
-		elif keyset in self.__dict__['__keysets__']:
-			if keyset not in excepts:
+		elif keyset in indexes:
+			if immutable and keyset not in self.__dict__['__excepts__']:
 				raise TypeError( f"Cannot override item \"{keyset}\", cannot override item that has been set in a class that extends the Immutable class" )
-			position = self.__dict__['__keysets__'].index( keyset )
+			position = indexes[keyset]
 			original = self.__dict__['__values__'][position]
+			if pending and keyset in pending:
+				original = self.__materialize__( keyset, position )
 			if isinstance( original, Map ) and isinstance( values, ( dict, Map ) ):
 				originalNamedType = typeof( original )
 				differentNamedType = typeof( values )
 				if originalNamedType not in [ "Map", "MapBuilder", differentNamedType ]:
 					self.__dict__['__values__'][position] = values
 				else:
-					for key in values:
-						original[key] = values[key]
+					for key, value in zip( values.__dict__['__keysets__'], values.__dict__['__values__'] ):
+						original[key] = value
 			elif isinstance( original, list ) and isinstance( values, list ):
-				for item in values:
-					if item not in original:
-						original.append( item )
+				self.__merge__( keyset, original, values )
 			else:
 				self.__dict__['__values__'][position] = values
 		else:
-			self.__dict__['__keysets__'].append( keyset )
-			self.__dict__['__values__'].append( values )
+			self.__append__( keyset, values )
 		...
 	
 	@final
@@ -269,20 +498,265 @@ class Map( MutableMapping[Key,Val] ):
 		return self.__serialize__()
 
 	@final
-	def keys( self ) -> List[Key]:
-		return self.__dict__['__keysets__']
+	def __unshare__( self ) -> None:
+		
+		""" Copy the shared key table into own key table of Map """
+		
+		if self.__dict__['__shape__'] is not None:
+			self.__dict__['__indexes__'] = dict( self.__dict__['__indexes__'] )
+			self.__dict__['__keysets__'] = list( self.__dict__['__keysets__'] )
+			self.__dict__['__shape__'] = None
+	
+	@final
+	def __wrap__( self, values:Union[Self,Val] ) -> Val:
+		
+		"""
+		Return the value wrapped as Map when the value is dict, Map
+		or list of dict and Map, otherwise return the value itself,
+		the children of typed Map are built by the MapBuilder of the
+		type so they inherit the __identity__ of the type, the lists
+		become MapList and the nodes of snapshot are copied into
+		mutable Map and MapList
+		
+		:params Map|Val values
+		
+		:return Val
+		"""
+		
+		lazy = self.__dict__['__lazy__']
+		if isinstance( values, ( dict, Map ) ):
+			named = typeof( self )
+			if named == "MapBuilder":
+				return type( self )( values, lazy )
+			if named != "Map":
+				return builder( self, values, lazy )
+			return Map( values, lazy )
+		if isinstance( values, ( list, FrozenList ) ):
+			return MapList( self.__wrap__( value ) if isinstance( value, ( dict, list, tuple, Map ) ) else value for value in values )
+		if isinstance( values, tuple ) and any( isinstance( value, ( dict, list, tuple, Map ) ) for value in values ):
+			return tuple( self.__wrap__( value ) if isinstance( value, ( dict, list, tuple, Map ) ) else value for value in values )
+		return values
+	
+	@final
+	def apply( self, patch:Dict[Key,Dict[Str,Any]] ) -> None:
+		
+		"""
+		Apply the structural patch returned by Map.diff, the items
+		are replaced instead of merged as when the item is set
+		
+		:params Dict<Key,Dict<Str,Any>> patch
+		
+		:return None
+		:raises TypeError
+			When the Map is snapshot
+		:raises ValueError
+			When the patch is invalid
+		"""
+		
+		if self.__dict__['__frozen__']:
+			raise TypeError( "Cannot apply patch, cannot change the Map snapshot" )
+		if self.__dict__.get( '__epoch__', 0 ) < Epoch.Current:
+			self.__preserve__()
+		for keyset, operation in patch.items():
+			if "-" in operation:
+				del self[keyset]
+				continue
+			position = self.__dict__['__indexes__'].get( keyset )
+			if position is None:
+				if "=" not in operation:
+					raise ValueError( f"Invalid patch, item \"{keyset}\" does not exist" )
+				self.__append__( keyset, self.__wrap__( operation['='] ) )
+				continue
+			if ">" in operation:
+				value = self[keyset]
+				if len( operation ) > 1:
+					value = patched( self, value, operation )
+				del self[keyset]
+				self.__append__( keyset, value )
+				continue
+			value = patched( self, self[keyset], operation )
+			if self.__dict__['__pending__']:
+				self.__dict__['__pending__'].discard( keyset )
+			self.__dict__['__values__'][position] = value
+	
+	@final
+	def diff( self, other:Union[Self,Mapping[Key,Val]] ) -> Dict[Key,Dict[Str,Any]]:
+		
+		"""
+		Return the structural patch which changes the Map into the
+		other, empty when nothing changed, the lists of Map items
+		are matched by __identity__ of the Map type or by __typename
+		and id, the patch only holds plain Json values and keeps the
+		key order of the other, the patch of each item is one of
+		
+		{ "=": value } the new value
+		{ "-": True } the item is deleted
+		{ ">": True } the item is moved to the end, can be combined
+			with the change of item
+		{ "{": { key: patch } } the changes of Map
+		{ "[": [ index, { "*": [ start, stop ] }, [ index, patch ], { "=": value } ] }
+			the list of old item index, range of old items, changed
+			old item or new item
+		
+		:params Map|Mapping<Key,Val> other
+		
+		:return Dict<Key,Dict<Str,Any>>
+		"""
+		
+		patch = difference( self, other, self.__identity__ )
+		return patch['{'] if patch is not None else {}
+	
+	@final
+	@classmethod
+	def fromJson( cls, source:Union[bytes,bytearray,Str,IO], *args:Any, incremental:Bool=False, chunk:Int=65536, **kwargs:Any ) -> Union[Self,Val,Iterator[Val]]:
+		
+		"""
+		Decode Json straight into Map nodes, without building dict
+		tree then walking it again, the extra arguments are passed
+		into the class constructor when the class is not Map
+		
+		:params Bytes|Bytearray|Str|IO source
+			The Json document or readable file or stream, e.g.
+			response.content or response.raw with stream request
+		:params Bool incremental
+			Yield top-level records as soon as each one complete,
+			the items when the Json is an array, otherwise each of
+			concatenated or newline delimited Json documents
+		:params Int chunk
+			The number of characters or bytes read at once
+		
+		:return Map|Val|Iterator<Val>
+		:raises JSONDecodeError
+		"""
+		
+		def construct( value:Val ) -> Union[Self,Val]:
+			if cls is not Map and isinstance( value, Map ):
+				return cls( value, *args, **kwargs )
+			return value
+		
+		if incremental is True:
+			if isinstance( source, ( bytes, bytearray, memoryview, str ) ):
+				source = BytesIO( source ) if not isinstance( source, str ) else StringIO( source )
+			return map( construct, decode( source, chunk ) )
+		if not isinstance( source, ( bytes, bytearray, str ) ):
+			source = source.read()
+		return construct( loads( source, object_pairs_hook=assemble ) )
+	
+	@final
+	@classmethod
+	def fromRecords( cls, records:Iterable[Union[Self,Mapping[Key,Val]]], *args:Any, lazy:Bool=False, **kwargs:Any ) -> List[Self]:
+		
+		"""
+		Construct Map for each record at once, the records which have
+		identical keys share one key table and only the values list
+		is created for each Map, the extra arguments are passed into
+		the class constructor when the class is not Map
+		
+		:params Iterable<Map|Mapping<Key,Val>> records
+		:params Bool lazy
+			Keep nested dict and list raw until first access, the
+			Map takes ownership of the raw values and they must not
+			be mutated by the caller afterward, the default copies
+		
+		:return List<Map>
+		"""
+		
+		results = []
+		shape = Shape.Root
+		for record in records:
+			if isinstance( record, Map ):
+				keysets = record.__dict__['__keysets__']
+				values = record.__dict__['__values__']
+			else:
+				keysets = tuple( record )
+				values = [ record[keyset] for keyset in keysets ]
+			if shape is None or shape.keysets != tuple( keysets ):
+				shape = Shape.Root.derive( keysets )
+			if shape is None or isinstance( record, Map ) and record.__dict__['__pending__']:
+				instance = Map( record, lazy )
+			else:
+				instance = Map.__new__( Map )
+				storage = instance.__dict__
+				storage['__shape__'] = shape
+				storage['__indexes__'] = shape.indexes
+				storage['__frozen__'] = False
+				storage['__lazy__'] = lazy is True
+				storage['__pending__'] = set() if lazy is True else None
+				storage['__keysets__'] = shape.keysets
+				if lazy is True:
+					storage['__values__'] = values = list( values )
+					for position, keyset in enumerate( keysets ):
+						if isinstance( values[position], ( dict, list ) ):
+							storage['__pending__'].add( keyset )
+						elif isinstance( values[position], Map ):
+							values[position] = instance.__wrap__( values[position] )
+				else:
+					storage['__values__'] = [ instance.__wrap__( value ) for value in values ]
+			results.append( instance if cls is Map else cls( instance, *args, **kwargs ) )
+		return results
+	
+	@final
+	def items( self ) -> ItemsView[Key,Val]:
+		return MapItems( self )
+	
+	@final
+	def keys( self ) -> KeysView[Key]:
+		return MapKeys( self )
 	
 	@final
 	@property
 	def length( self ) -> Int:
 		return self.__len__()
 	
+	@final
+	def popitem( self ) -> Tuple[Key,Val]:
+		
+		""" Remove and return the last inserted key value pair """
+		
+		if not self.__dict__['__keysets__']:
+			raise KeyError( "\"{}\" Map object is empty".format( typeof( self ) ) )
+		keyset = self.__dict__['__keysets__'][-1]
+		value = self[keyset]
+		del self[keyset]
+		return tuple( (keyset, value) )
+	
+	@final
+	def snapshot( self ) -> Self:
+		
+		"""
+		Return immutable snapshot of the Map, the snapshot shares every
+		node with the Map and nothing is copied until changed, each
+		Map and MapList keeps its state for the alive snapshots before
+		the first change after snapshot, so the Map and any reference
+		taken from it can be changed while the other threads read the
+		snapshot without lock, the children of snapshot are resolved
+		into frozen Map and FrozenList on first access, Map( snapshot )
+		returns mutable copy
+		
+		The plain lists which are not MapList, e.g arrays nested in
+		arrays of decoded Json, are copied on first access instead
+		
+		:return Map
+		"""
+		
+		if self.__dict__['__frozen__']:
+			return self
+		with Materializing:
+			Epoch.Current += 1
+			epoch = Epoch( Epoch.Current )
+			Epoch.Alive[epoch.number] = epoch
+		return freeze( self, epoch )
+	
+	@final
+	def values( self ) -> ValuesView[Val]:
+		return MapValues( self )
+	
 	def update( self, collection:Union[Self,MutableMapping[Key,Val]] ) -> None:
 		if not isinstance( collection, MutableMapping ):
 			raise TypeError( "Invalid \"collection\" parameter, value must be type <Self|MutableMapping<Key,Val>, {} passed".format( typeof( collection ) ) )
 		if isinstance( collection, Map ):
-			for generic in collection:
-				self.__set__( generic[0], generic[1] )
+			for keyset, value in entries( collection ):
+				self.__set__( keyset, value )
 		else:
 			for keyset in collection:
 				self.__set__( keyset, collection[keyset] )
@@ -291,13 +765,375 @@ class Map( MutableMapping[Key,Val] ):
 	...
 
 
-def builder( parent:Map[Key,Val], collection:Union[Map[Key,Val],MutableMapping[Key,Val]] ) -> Map[Key,Val]:
+@final
+class MapItems( ItemsView[Key,Val] ):
+	
+	""" Map items view, read the Map storage without copying """
+	
+	__slots__ = ()
+	
+	def __contains__( self, item:Tuple[Key,Val] ) -> Bool:
+		keyset, value = item
+		if keyset not in self._mapping:
+			return False
+		current = self._mapping[keyset]
+		return current is value or current == value
+	
+	def __iter__( self ) -> Iterator[Tuple[Key,Val]]:
+		return zip( MapKeys( self._mapping ), MapValues( self._mapping ) )
+	
+	def __reversed__( self ) -> Iterator[Tuple[Key,Val]]:
+		return zip( reversed( MapKeys( self._mapping ) ), reversed( MapValues( self._mapping ) ) )
+	
+	...
+
+@final
+class MapKeys( KeysView[Key] ):
+	
+	""" Map keys view, read the Map storage without copying """
+	
+	__slots__ = ()
+	
+	def __contains__( self, keyset:Key ) -> Bool:
+		return keyset in self._mapping.__dict__['__indexes__']
+	
+	def __iter__( self ) -> Iterator[Key]:
+		return iter( self._mapping.__dict__['__keysets__'] )
+	
+	def __reversed__( self ) -> Iterator[Key]:
+		return reversed( self._mapping.__dict__['__keysets__'] )
+	
+	...
+
+@final
+class MapValues( ValuesView[Val] ):
+	
+	""" Map values view, read the Map storage without copying """
+	
+	__slots__ = ()
+	
+	def __iter__( self ) -> Iterator[Val]:
+		mapping = self._mapping
+		if not mapping.__dict__['__pending__']:
+			return iter( mapping.__dict__['__values__'] )
+		return self.__materialize__( range( len( mapping.__dict__['__values__'] ) ) )
+	
+	def __materialize__( self, positions:Iterable[Int] ) -> Iterator[Val]:
+		mapping = self._mapping
+		values = mapping.__dict__['__values__']
+		pending = mapping.__dict__['__pending__']
+		keysets = mapping.__dict__['__keysets__']
+		for position in positions:
+			if pending and keysets[position] in pending:
+				yield mapping.__materialize__( keysets[position], position )
+			else:
+				yield values[position]
+	
+	def __reversed__( self ) -> Iterator[Val]:
+		mapping = self._mapping
+		if not mapping.__dict__['__pending__']:
+			return reversed( mapping.__dict__['__values__'] )
+		return self.__materialize__( reversed( range( len( mapping.__dict__['__values__'] ) ) ) )
+	
+	...
+
+
+@final
+class Shape:
+	
+	"""
+	Shared key table of Maps which have identical keys inserted
+	in identical order, each Map only keeps its own values list,
+	the next shapes are weakly cached by the appended key
+	"""
+	
+	__slots__ = ( "__weakref__", "indexes", "keysets", "parent", "transitions" )
+	
+	Root:Self
+	""" The shape of empty Map """
+	
+	def __init__( self, parent:Self=None, keyset:Key=None ) -> None:
+		
+		"""
+		Construct method of class Shape
+		
+		:params Shape parent
+		:params Key keyset
+			The key appended into the parent shape
+		
+		:return None
+		"""
+		
+		if parent is None:
+			self.indexes:Dict[Key,Int] = {}
+			self.keysets:Tuple[Key,...] = ()
+		else:
+			if isinstance( keyset, str ) and type( keyset ) is str:
+				keyset = intern( keyset )
+			self.indexes = { **parent.indexes, keyset: len( parent.keysets ) }
+			self.keysets = ( *parent.keysets, keyset )
+		self.parent:Union[Self,None] = parent
+		self.transitions:WeakValueDictionary = WeakValueDictionary()
+	
+	def derive( self, keysets:Iterable[Key] ) -> Union[Self,None]:
+		
+		"""
+		Return the shape after appending all keys, or None when the
+		number of keys exceeds the sharing limit
+		
+		:params Iterable<Key> keysets
+		
+		:return Shape|None
+		"""
+		
+		shape = self
+		for keyset in keysets:
+			shape = shape.transition( keyset )
+			if shape is None:
+				break
+		return shape
+	
+	def transition( self, keyset:Key ) -> Union[Self,None]:
+		
+		"""
+		Return the shape after appending the key, or None when the
+		number of keys exceeds the sharing limit
+		
+		:params Key keyset
+		
+		:return Shape|None
+		"""
+		
+		successor = self.transitions.get( keyset )
+		if successor is None:
+			if len( self.keysets ) >= Sharing:
+				return None
+			successor = Shape( self, keyset )
+			self.transitions[keyset] = successor
+		return successor
+	
+
+Shape.Root = Shape()
+
+
+@final
+class Epoch:
+	
+	"""
+	Generation of snapshot, every node of the snapshot holds the
+	epoch so the epoch is alive as long as any node of snapshot
+	"""
+	
+	__slots__ = ( "__weakref__", "number" )
+	
+	Alive:WeakValueDictionary = WeakValueDictionary()
+	""" The epochs of alive snapshots by number """
+	
+	Current:Int = 0
+	""" The number of latest snapshot """
+	
+	def __init__( self, number:Int ) -> None:
+		self.number:Int = number
+	
+
+@final
+class FrozenList( tuple ):
+	
+	""" Frozen list of Map snapshot, thawed into MapList by Map """
+	
+	__slots__ = ()
+	
+
+@final
+class MapList( list ):
+	
+	"""
+	List of Map, the items are kept for the alive snapshots before
+	the first change after snapshot, so the snapshot shares the
+	list until the list is changed
+	"""
+	
+	__slots__ = ( "__epoch__", "__versions__" )
+	
+	def __init__( self, items:Iterable[Val]=() ) -> None:
+		list.__init__( self, items )
+		self.__epoch__:Int = Epoch.Current
+		self.__versions__:Union[List[Tuple[Int,Tuple[Val,...]]],None] = None
+	
+	def __delitem__( self, index:Union[Int,slice] ) -> None:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		list.__delitem__( self, index )
+	
+	def __iadd__( self, items:Iterable[Val] ) -> Self:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		return list.__iadd__( self, items )
+	
+	def __imul__( self, count:Int ) -> Self:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		return list.__imul__( self, count )
+	
+	def __preserve__( self ) -> None:
+		
+		"""
+		Keep the items for the alive snapshots before the first change
+		after snapshot, see Map.__preserve__
+		
+		:return None
+		"""
+		
+		with Materializing:
+			if self.__epoch__ >= Epoch.Current:
+				return
+			versions, visible = retain( self.__versions__, self.__epoch__ )
+			if visible:
+				versions.append(( Epoch.Current, tuple( self ) ))
+			self.__versions__ = versions or None
+			self.__epoch__ = Epoch.Current
+	
+	def __reduce__( self ) -> Tuple[Type[Self],Tuple[List[Val]]]:
+		return ( MapList, ( list( self ), ) )
+	
+	def __setitem__( self, index:Union[Int,slice], value:Val ) -> None:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		list.__setitem__( self, index, value )
+	
+	def append( self, value:Val ) -> None:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		list.append( self, value )
+	
+	def clear( self ) -> None:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		list.clear( self )
+	
+	def extend( self, items:Iterable[Val] ) -> None:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		list.extend( self, items )
+	
+	def insert( self, index:Int, value:Val ) -> None:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		list.insert( self, index, value )
+	
+	def pop( self, index:Int=-1 ) -> Val:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		return list.pop( self, index )
+	
+	def remove( self, value:Val ) -> None:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		list.remove( self, value )
+	
+	def reverse( self ) -> None:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		list.reverse( self )
+	
+	def sort( self, *args:Any, **kwargs:Any ) -> None:
+		if self.__epoch__ < Epoch.Current:
+			self.__preserve__()
+		list.sort( self, *args, **kwargs )
+	
+
+
+@final
+class Unhashable:
+	
+	"""
+	Fingerprint of unhashable value, compared by equality of the
+	value and all share one hash bucket
+	"""
+	
+	__slots__ = ( "value", )
+	
+	def __init__( self, value:Any ) -> None:
+		self.value:Any = value
+	
+	def __eq__( self, other:Any ) -> Bool:
+		return isinstance( other, Unhashable ) and self.value == other.value
+	
+	def __hash__( self ) -> Int:
+		return 0
+	
+
+def assemble( pairs:List[Tuple[Key,Val]] ) -> Map[Key,Val]:
+	
+	"""
+	Return Map of decoded Json object pairs, the values already
+	decoded into Map nodes so the storage is filled directly
+	
+	:params List<Tuple<Key,Val>> pairs
+	
+	:return Map
+	"""
+	
+	instance = Map.__new__( Map )
+	storage = instance.__dict__
+	storage['__shape__'] = Shape.Root
+	storage['__indexes__'] = Shape.Root.indexes
+	storage['__frozen__'] = False
+	storage['__lazy__'] = False
+	storage['__pending__'] = None
+	storage['__values__'] = []
+	storage['__keysets__'] = Shape.Root.keysets
+	for keyset, value in pairs:
+		if type( value ) is list:
+			value = MapList( value )
+		position = storage['__indexes__'].get( keyset )
+		if position is not None:
+			storage['__values__'][position] = value
+		else:
+			instance.__append__( keyset, value )
+	return instance
+
+def blueprint( parent:Type[Map[Key,Val]] ) -> Type[Map[Key,Val]]:
+	
+	"""
+	Return the generated MapBuilder class of parent type, the class
+	is reused as long as the parent type is alive
+	
+	:params Type<Map> parent
+	
+	:return Type<Map>
+	"""
+	
+	reference = Builders.get( parent )
+	MapBuilder = reference() if reference is not None else None
+	if MapBuilder is None:
+		
+		@final
+		class MapBuilder( parent ):
+			
+			"""
+			Children Map builder for avoid unhandled argument 
+			when create new Map for children value
+			"""
+			
+			def __init__( self, collection:Union[Self,MutableMapping[Key,Val]], lazy:Bool=False ) -> None:
+				Map.__init__( self, collection, lazy )
+			
+			...
+			
+		...
+		
+		Builders[parent] = ref( MapBuilder )
+	return MapBuilder
+
+def builder( parent:Map[Key,Val], collection:Union[Map[Key,Val],MutableMapping[Key,Val]], lazy:Bool=False ) -> Map[Key,Val]:
 	
 	"""
 	Map builder for child, 
 	
 	:params Map parent
 	:params Dict<Key, Value> data
+	:params Bool lazy
 	
 	:return Map
 	"""
@@ -306,20 +1142,512 @@ def builder( parent:Map[Key,Val], collection:Union[Map[Key,Val],MutableMapping[K
 		raise TypeError()
 	if not isinstance( parent, type ):
 		parent = type( parent )
+	return blueprint( parent )( collection, lazy )
+
+def decode( fp:IO, chunk:Int=65536 ) -> Iterator[Val]:
 	
-	@final
-	class MapBuilder( parent ):
-		
-		"""
-		Children Map builder for avoid unhandled argument 
-		when create new Map for children value
-		"""
-		
-		def __init__( self, collection:Union[Self,MutableMapping[Key,Val]] ) -> None:
-			Map.__init__( self, collection )
-		
-		...
-		
-	...
+	"""
+	Yield top-level records of Json stream, the items when the
+	stream starts with array, otherwise each Json document, only
+	the unfinished record is kept in the buffer
+	
+	:params IO fp
+		Readable text or binary file or stream
+	:params Int chunk
+		The number of characters or bytes read at once
+	
+	:return Iterator<Val>
+	:raises JSONDecodeError
+	"""
+	
+	decoder = JSONDecoder( object_pairs_hook=assemble )
+	incremental = None
+	buffer = ""
+	offset = 0
+	finished = False
+	size = chunk
+	array = None
+	expect = None
+	
+	def fill() -> None:
+		nonlocal buffer, finished, incremental, offset
+		data = fp.read( size )
+		if incremental is None and isinstance( data, ( bytes, bytearray ) ):
+			incremental = getincrementaldecoder( "utf-8" )()
+		finished = not data
+		buffer = buffer[offset:] + ( incremental.decode( data, finished ) if incremental is not None else data )
+		offset = 0
+	
+	while True:
+		offset = WHITESPACE.match( buffer, offset ).end()
+		if offset >= len( buffer ):
+			if finished:
+				break
+			fill()
+			continue
+		character = buffer[offset]
+		if array is None:
+			array = character == "["
+			if array:
+				expect = "first"
+				offset += 1
+				continue
+		elif array is True:
+			if expect is None:
+				raise JSONDecodeError( "Extra data", buffer, offset )
+			if character == "]" and expect != "item":
+				expect = None
+				offset += 1
+				continue
+			if expect == "comma":
+				if character != ",":
+					raise JSONDecodeError( "Expecting ',' delimiter", buffer, offset )
+				expect = "item"
+				offset += 1
+				continue
+		try:
+			value, end = decoder.raw_decode( buffer, offset )
+		except JSONDecodeError:
+			if finished:
+				raise
+			end = None
+		if end is None or not finished and ( end >= len( buffer ) or buffer[end] in "+-.0123456789Ee" ):
+			fill()
+			size *= 2
+			continue
+		size = chunk
+		offset = end
+		if array is True:
+			expect = "comma"
+		yield value
+	if array is True and expect is not None:
+		raise JSONDecodeError( "Expecting ']'", buffer, offset )
+
+def detach( parent:Map[Key,Val], value:Val ) -> Val:
+	
+	"""
+	Return the raw value of lazy Map wrapped as Map and MapList,
+	or the child of snapshot as seen by the snapshot
+	
+	:params Map parent
+	:params Val value
+	
+	:return Val
+	"""
+	
+	if not parent.__dict__['__frozen__']:
+		return parent.__wrap__( value )
+	if isinstance( value, dict ) or type( value ) is list:
+		value = parent.__wrap__( value )
+	return freeze( value, parent.__dict__['__epoch__'] )
+
+def difference( value:Val, other:Val, identity:Union[Callable[[Val],Any],Tuple[Key,...],None]=None ) -> Union[Dict[Str,Any],None]:
+	
+	"""
+	Return the patch which changes the value into the other, or None
+	when both are equal, see Map.diff for the patch format
+	
+	:params Val value
+	:params Val other
+	:params Callable<Val,Any>|Tuple<Key>|None identity
+		The identity of list items, None for __typename and id
+	
+	:return Dict<Str,Any>|None
+	"""
+	
+	if value is other:
+		return None
+	if isinstance( value, ( dict, Map ) ) and isinstance( other, ( dict, Map ) ):
+		if isinstance( value, Map ) and type( value ).__identity__ is not None:
+			identity = type( value ).__identity__
+		previous = dict( entries( value ) ) if isinstance( value, Map ) else value
+		current = dict( entries( other ) ) if isinstance( other, Map ) else other
+		positions = { keyset: position for position, keyset in enumerate( previous ) }
+		order = list( current )
+		stable = 0
+		latest = -1
+		for keyset in order:
+			if positions.get( keyset, -1 ) <= latest:
+				break
+			latest = positions[keyset]
+			stable += 1
+		changes = {}
+		for keyset in order[:stable]:
+			change = difference( previous[keyset], current[keyset], identity )
+			if change is not None:
+				changes[keyset] = change
+		for keyset in previous:
+			if keyset not in current:
+				changes[keyset] = { "-": True }
+		for keyset in order[stable:]:
+			if keyset not in previous:
+				changes[keyset] = { "=": plain( current[keyset] ) }
+				continue
+			change = difference( previous[keyset], current[keyset], identity )
+			changes[keyset] = { ">": True, **( change or {} ) }
+		return { "{": changes } if changes else None
+	if isinstance( value, ( list, tuple ) ) and isinstance( other, ( list, tuple ) ):
+		if identity is None:
+			identity = keyed
+		changes = []
+		offset = 0
+		for offset in range( min( len( value ), len( other ) ) + 1 ):
+			if offset == len( value ) or offset == len( other ) or identify( value[offset], identity ) != identify( other[offset], identity ):
+				break
+			change = difference( value[offset], other[offset], identity )
+			changes.append( offset if change is None else [ offset, change ] )
+		positions = {}
+		for position in range( offset, len( value ) ):
+			positions.setdefault( identify( value[position], identity ), [] ).append( position )
+		for item in other[offset:]:
+			matched = positions.get( identify( item, identity ) )
+			if not matched:
+				changes.append({ "=": plain( item ) })
+				continue
+			position = matched.pop( 0 )
+			change = difference( value[position], item, identity )
+			changes.append( position if change is None else [ position, change ] )
+		if len( changes ) == len( value ) and all( type( change ) is int and change == position for position, change in enumerate( changes ) ):
+			return None
+		compact = []
+		for change in changes:
+			if type( change ) is int and compact and type( compact[-1] ) is int and compact[-1] + 1 == change:
+				compact[-1] = { "*": [ compact[-1], change + 1 ] }
+			elif type( change ) is int and compact and type( compact[-1] ) is dict and "*" in compact[-1] and compact[-1]['*'][1] == change:
+				compact[-1]['*'][1] = change + 1
+			else:
+				compact.append( change )
+		return { "[": compact }
+	if type( value ) is type( other ) and value == other:
+		return None
+	return { "=": plain( other ) }
+
+def entries( value:Map[Key,Val] ) -> Iterable[Tuple[Key,Val]]:
+	
+	"""
+	Return the key value pairs of Map storage, the children of
+	snapshot are resolved so they are never read from the Map
+	which the snapshot is taken from
+	
+	:params Map value
+	
+	:return Iterable<Tuple<Key,Val>>
+	"""
+	
+	storage = value.__dict__
+	if storage['__frozen__'] and storage['__pending__']:
+		return MapItems( value )
+	return zip( storage['__keysets__'], storage['__values__'] )
+
+def fingerprint( value:Any ) -> Any:
+	
+	"""
+	Return hashable representation of value, equal values have
+	equal fingerprint, Map and dict are compared regardless order
+	
+	:params Any value
+	
+	:return Any
+	"""
+	
+	if isinstance( value, Map ):
+		return frozenset( ( keyset, fingerprint( item ) ) for keyset, item in entries( value ) )
+	if isinstance( value, dict ):
+		return frozenset( ( keyset, fingerprint( item ) ) for keyset, item in value.items() )
+	if isinstance( value, ( list, tuple ) ):
+		return tuple( fingerprint( item ) for item in value )
+	if isinstance( value, ( set, frozenset ) ):
+		return frozenset( fingerprint( item ) for item in value )
+	if isinstance( value, bytearray ):
+		return bytes( value )
+	try:
+		hash( value )
+	except TypeError:
+		return Unhashable( value )
+	return value
+
+def freeze( value:Val, epoch:Epoch ) -> Val:
+	
+	"""
+	Return the value as seen by the snapshot of epoch, the Map is
+	returned as frozen Map holding the state of Map when the
+	snapshot was taken and its children are resolved on first
+	access, the lists become FrozenList, the frozen values are
+	shared
+	
+	:params Val value
+	:params Epoch epoch
+	
+	:return Val
+	"""
+	
+	if isinstance( value, Map ):
+		if value.__dict__['__frozen__']:
+			return value
+		instance = Map.__new__( type( value ) )
+		storage = instance.__dict__
+		with Materializing:
+			state = value.__dict__
+			for number, previous in state.get( '__versions__' ) or ():
+				if number >= epoch.number:
+					state = previous
+					break
+			storage.update( ( name, item ) for name, item in state.items() if name not in Unversioned )
+			storage['__values__'] = list( state['__values__'] )
+		storage['__pending__'] = set( keyset for keyset, item in zip( storage['__keysets__'], storage['__values__'] ) if isinstance( item, ( dict, list, tuple, Map ) ) )
+		storage['__epoch__'] = epoch
+		storage['__frozen__'] = True
+		for name in [ name for name in storage if not name.startswith( "__" ) ]:
+			storage[name] = freeze( storage[name], epoch )
+		return instance
+	if isinstance( value, FrozenList ):
+		return value
+	if isinstance( value, MapList ):
+		with Materializing:
+			items = value
+			for number, previous in value.__versions__ or ():
+				if number >= epoch.number:
+					items = previous
+					break
+			items = tuple( items )
+		return FrozenList( freeze( item, epoch ) if isinstance( item, ( dict, list, tuple, Map ) ) else item for item in items )
+	if isinstance( value, dict ):
+		return freeze( Map( value ), epoch )
+	if isinstance( value, list ):
+		return FrozenList( freeze( item, epoch ) if isinstance( item, ( dict, list, tuple, Map ) ) else item for item in value )
+	if isinstance( value, tuple ) and any( isinstance( item, ( dict, list, tuple, Map ) ) for item in value ):
+		return tuple( freeze( item, epoch ) if isinstance( item, ( dict, list, tuple, Map ) ) else item for item in value )
+	return value
+
+def identify( item:Val, identity:Union[Callable[[Val],Any],Tuple[Key,...],None] ) -> Tuple[Bool,Any]:
+	
+	"""
+	Return the identity of list item, Map and dict items are
+	identified by the key names or function, otherwise by whole
+	item fingerprint
+	
+	:params Val item
+	:params Callable<Val,Any>|Tuple<Key>|None identity
+	
+	:return Tuple<Bool,Any>
+	"""
+	
+	if identity is not None and isinstance( item, ( dict, Map ) ):
+		if callable( identity ):
+			keyset = identity( item )
+		elif all( name in item for name in identity ):
+			keyset = tuple( item[name] for name in identity )
+		else:
+			keyset = None
+		if keyset is not None:
+			return ( True, fingerprint( keyset ) )
+	return ( False, fingerprint( item ) )
+
+def keyed( item:Union[Dict[Key,Val],Map[Key,Val]] ) -> Union[Tuple[Val,Val],None]:
+	
+	"""
+	Return the default identity of list item, __typename and id
+	or None when the item has no id
+	
+	:params Dict<Key,Val>|Map item
+	
+	:return Tuple<Val,Val>|None
+	"""
+	
+	if "id" not in item:
+		return None
+	return ( item.get( "__typename" ), item['id'] )
+
+def patched( parent:Map[Key,Val], value:Val, operation:Dict[Str,Any] ) -> Val:
+	
+	"""
+	Return the value after applying the patch operation, Map value
+	is changed in place and list value is rebuilt
+	
+	:params Map parent
+	:params Val value
+	:params Dict<Str,Any> operation
+	
+	:return Val
+	:raises ValueError
+		When the patch is invalid
+	"""
+	
+	if "=" in operation:
+		return parent.__wrap__( operation['='] )
+	if "{" in operation and isinstance( value, Map ):
+		value.apply( operation['{'] )
+		return value
+	if "[" in operation and isinstance( value, ( list, tuple ) ):
+		items = []
+		for change in operation['[']:
+			if type( change ) is int:
+				items.append( value[change] )
+			elif isinstance( change, ( list, tuple ) ):
+				items.append( patched( parent, value[change[0]], change[1] ) )
+			elif "*" in change:
+				items.extend( value[change['*'][0]:change['*'][1]] )
+			else:
+				items.append( parent.__wrap__( change['='] ) )
+		return items
+	raise ValueError( f"Invalid patch operation {list( operation )} for value of type {type( value ).__name__}" )
 
-	return MapBuilder( collection )
+def plain( value:Val ) -> Val:
+	
+	"""
+	Return the value converted into plain dict and list, the Map
+	nodes of the value are never shared
+	
+	:params Val value
+	
+	:return Val
+	"""
+	
+	if isinstance( value, Map ):
+		return value.__props__()
+	if isinstance( value, dict ):
+		return { keyset: plain( item ) for keyset, item in value.items() }
+	if isinstance( value, ( list, tuple ) ):
+		return [ plain( item ) for item in value ]
+	return value
+
+def retain( versions:Union[List[Tuple[Int,Any]],None], epoch:Int ) -> Tuple[List[Tuple[Int,Any]],Bool]:
+	
+	"""
+	Return the versions which are still seen by the alive snapshots
+	and whether any alive snapshot sees the state installed at the
+	epoch, the caller must hold the Materializing lock
+	
+	:params List<Tuple<Int,Any>>|None versions
+		The number of latest snapshot seeing each state and the state
+	:params Int epoch
+		The number of latest snapshot when the state was installed
+	
+	:return Tuple<List<Tuple<Int,Any>>,Bool>
+	"""
+	
+	numbers = list( Epoch.Alive.keys() )
+	if not numbers:
+		return [], False
+	floor = min( numbers )
+	return [ version for version in versions or () if version[0] >= floor ], max( numbers ) > epoch
+
+def serialize( value:Any, write:Callable[[Str],Any], indent:Union[Int,Str]=None, separators:Tuple[Str,Str]=None, ensure_ascii:Bool=True, sort_keys:Bool=False, allow_nan:Bool=True, buffering:Int=4096 ) -> None:
+	
+	"""
+	Encode Map, dict and list tree into Json in single pass
+	
+	The tree is walked directly, the Map storage is read without
+	copying and lazy children are not materialized, every value
+	that can not be represented in Json is written as string.
+	
+	:params Any value
+	:params Callable<<Str>,Any> write
+		The chunk writer, called every time the buffer is full
+	:params Int|Str indent
+	:params Tuple<Str,Str> separators
+	:params Bool ensure_ascii
+	:params Bool sort_keys
+	:params Bool allow_nan
+	:params Int buffering
+		The number of chunks buffered before written
+	
+	:return None
+	:raises ValueError
+		When the float value is out of range and allow_nan is False
+	"""
+	
+	if isinstance( indent, Int ):
+		indent = "\x20" * indent
+	if separators is not None:
+		itemSeparator, keySeparator = separators
+	else:
+		itemSeparator, keySeparator = ( ", " if indent is None else ",", ": " )
+	string = encode_basestring_ascii if ensure_ascii else encode_basestring
+	chunks = []
+	
+	def scalar( value:Any ) -> Str:
+		if isinstance( value, Str ):
+			return string( value )
+		if value is None:
+			return "null"
+		if value is True:
+			return "true"
+		if value is False:
+			return "false"
+		if isinstance( value, Int ):
+			return Int.__repr__( value )
+		if isinstance( value, float ):
+			if value != value:
+				literal = "NaN"
+			elif value == float( "inf" ):
+				literal = "Infinity"
+			elif value == float( "-inf" ):
+				literal = "-Infinity"
+			else:
+				return float.__repr__( value )
+			if not allow_nan:
+				raise ValueError( "Out of range float values are not JSON compliant: {}".format( literal ) )
+			return literal
+		return string( str( value ) )
+	
+	def keyname( keyset:Any ) -> Str:
+		if isinstance( keyset, Str ):
+			return string( keyset )
+		if keyset is None or isinstance( keyset, ( Bool, Int, float ) ):
+			return "".join([ "\"", scalar( keyset ).strip( "\"" ), "\"" ])
+		return string( str( keyset ) )
+	
+	def walk( value:Any, level:Int ) -> None:
+		if isinstance( value, Map ):
+			mapping = True
+			items = entries( value )
+			length = len( value.__dict__['__values__'] )
+		elif isinstance( value, Mapping ):
+			mapping = True
+			items = value.items()
+			length = len( value )
+		else:
+			mapping = False
+			items = value
+			length = len( value )
+		if length == 0:
+			chunks.append( "{}" if mapping else "[]" )
+			return
+		if mapping and sort_keys:
+			items = sorted( items, key=lambda item: item[0] )
+		chunks.append( "{" if mapping else "[" )
+		separator = itemSeparator
+		if indent is not None:
+			level += 1
+			separator = "".join([ itemSeparator, "\x0a", indent * level ])
+			chunks.append( "".join([ "\x0a", indent * level ]) )
+		first = True
+		for item in items:
+			if first is True:
+				first = False
+			else:
+				chunks.append( separator )
+			if mapping:
+				chunks.append( keyname( item[0] ) )
+				chunks.append( keySeparator )
+				item = item[1]
+			if isinstance( item, ( Str, Int, float ) ) or item is None:
+				chunks.append( scalar( item ) )
+			elif isinstance( item, ( dict, list, tuple ) ) or isinstance( item, Mapping ):
+				walk( item, level )
+			else:
+				chunks.append( scalar( item ) )
+			if len( chunks ) >= buffering:
+				write( "".join( chunks ) )
+				chunks.clear()
+		if indent is not None:
+			chunks.append( "".join([ "\x0a", indent * ( level -1 ) ]) )
+		chunks.append( "}" if mapping else "]" )
+	
+	if isinstance( value, ( dict, list, tuple ) ) or isinstance( value, Mapping ):
+		walk( value, 0 )
+	else:
+		chunks.append( scalar( value ) )
+	if chunks:
+		write( "".join( chunks ) )
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from ast import literal_eval
+from builtins import int as Int, str as Str
+from re import compile, Pattern
+from typing import Any, final, Final, Iterable, List, Tuple, Union
+
+from society.typing.builtins import Key, Val
+from society.typing.map import Map
+
+
+Token:Pattern[compile] = compile( r"(?P<dot>\.)?(?:(?P<name>[^\.\[\]]+)|\[\s*(?:(?P<wildcard>\*)|(?P<index>\-?[0-9]+)|(?P<quoted>\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*'))\s*\])" )
+""" A Pattern for capture a step of the query expression """
+
+Missing:Final[object] = object()
+""" A sentinel for the path that does not exist """
+
+Wildcard:Final[object] = object()
+""" A step for iterate all items of list or values of Map """
+
+
+@final
+class Query:
+	
+	"""
+	Compiled path query over Map and dict payloads, e.g.
+	data.user.edges[*].node.id, the expression is parsed once
+	and the query can be reused for any number of payloads
+	"""
+	
+	__slots__ = ( "__expression__", "__segments__", "__steps__" )
+	
+	def __init__( self, expression:Str ) -> None:
+		
+		"""
+		Construct method of class Query
+		
+		:params Str expression
+			The name of keys separated by dot, [N] for index,
+			[*] or * for all items, ["name"] for quoted key
+		
+		:return None
+		:raises ValueError
+			When the expression is invalid
+		"""
+		
+		steps = []
+		offset = 0
+		while offset < len( expression ):
+			matched = Token.match( expression, offset )
+			if matched is None or ( matched.group( "dot" ) is not None ) is not ( offset > 0 and matched.group( "name" ) is not None ):
+				raise ValueError( f"Invalid query expression \"{expression}\" at position {offset}" )
+			if matched.group( "name" ) is not None:
+				name = matched.group( "name" )
+				steps.append( Wildcard if name == "*" else name )
+			elif matched.group( "wildcard" ) is not None:
+				steps.append( Wildcard )
+			elif matched.group( "index" ) is not None:
+				steps.append( int( matched.group( "index" ) ) )
+			else:
+				steps.append( literal_eval( matched.group( "quoted" ) ) )
+			offset = matched.end()
+		if not steps:
+			raise ValueError( f"Invalid query expression \"{expression}\", the expression is empty" )
+		segments = [[]]
+		for keyset in steps:
+			if keyset is Wildcard:
+				segments.append( [] )
+			else:
+				segments[-1].append( keyset )
+		self.__expression__ = expression
+		self.__segments__:Tuple[Tuple[Key,...],...] = tuple( tuple( segment ) for segment in segments )
+		self.__steps__:Tuple[Key,...] = tuple( steps )
+	
+	def __call__( self, collection:Any, default:Val=None ) -> Union[Val,List[Val]]:
+		
+		"""
+		Return the value of query from the collection, when the
+		query has wildcard, return list of values of all matched
+		items and missing items are skipped
+		
+		:params Map|Dict|List collection
+		:params Val default
+			Value returned when the path does not exist
+		
+		:return Val|List<Val>
+		"""
+		
+		segments = self.__segments__
+		if len( segments ) == 1:
+			return resolve( collection, segments[0], default )
+		values = [ collection ]
+		for segment in segments[:-1]:
+			expanded = []
+			for value in values:
+				value = resolve( value, segment, Missing )
+				if value is not Missing:
+					expanded.extend( iterate( value ) )
+			values = expanded
+		segment = segments[-1]
+		if not segment:
+			return values
+		results = []
+		for value in values:
+			value = resolve( value, segment, Missing )
+			if value is not Missing:
+				results.append( value )
+		return results
+	
+	def __repr__( self ) -> Str:
+		return f"Query({self.__expression__!r})"
+	
+	@property
+	def expression( self ) -> Str:
+		return self.__expression__
+	
+	def many( self, collections:Iterable[Any], default:Val=None ) -> List[Union[Val,List[Val]]]:
+		
+		"""
+		Return the values of query for each collection
+		
+		:params Iterable<Map|Dict|List> collections
+		:params Val default
+			Value returned when the path does not exist
+		
+		:return List<Val|List<Val>>
+		"""
+		
+		segments = self.__segments__
+		if len( segments ) == 1:
+			segment = segments[0]
+			return [ resolve( collection, segment, default ) for collection in collections ]
+		return [ self( collection, default ) for collection in collections ]
+	
+	@property
+	def steps( self ) -> Tuple[Key,...]:
+		return self.__steps__
+	
+
+def iterate( value:Any ) -> Iterable[Val]:
+	
+	"""
+	Return the items of list or values of Map and dict, or empty
+	tuple for any other value
+	
+	:params Any value
+	
+	:return Iterable<Val>
+	"""
+	
+	kind = type( value )
+	if kind is list or kind is tuple:
+		return value
+	if kind is dict or isinstance( value, ( dict, Map ) ):
+		return value.values()
+	if isinstance( value, ( list, tuple ) ):
+		return value
+	return ()
+
+def resolve( value:Any, segment:Tuple[Key,...], default:Val=None ) -> Val:
+	
+	"""
+	Return the value of keys in segment, the Map storage is read
+	directly without going through Map.__getitem__
+	
+	:params Any value
+	:params Tuple<Key> segment
+	:params Val default
+		Value returned when the path does not exist
+	
+	:return Val
+	"""
+	
+	try:
+		for keyset in segment:
+			kind = type( value )
+			if kind is dict or kind is list:
+				value = value[keyset]
+			elif kind is Map or isinstance( value, Map ):
+				storage = value.__dict__
+				position = storage['__indexes__'][keyset]
+				pending = storage['__pending__']
+				if pending and keyset in pending:
+					value = value.__materialize__( keyset, position )
+				else:
+					value = storage['__values__'][position]
+			elif isinstance( value, ( dict, list, tuple ) ) and ( type( keyset ) is int or isinstance( value, dict ) ):
+				value = value[keyset]
+			else:
+				return default
+	except ( IndexError, KeyError, TypeError ):
+		return default
+	return value
+
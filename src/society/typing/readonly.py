@@ -22,9 +22,11 @@
 # use it at your own risk, and this is Strictly not for SPAM.
 #
 
-from typing import final
+from builtins import bool as Bool, int as Int, str as Str
+from types import MemberDescriptorType
+from typing import Any, Dict, final, FrozenSet, Tuple
 
-from society.typing.builtins import Key, Val
+from society.typing.builtins import Key, Self, Val
 from society.typing.immutable import Immutable
 from society.typing.map import Map
 
@@ -35,45 +37,66 @@ class Readonly( Immutable ):
 	Class representation for handling the immutable property.
 	This means the class will not or should not override any values it has set.
 	But if the attribute has not been set then the attribute will be allowed to be set.
+	
+	Subclasses declare their attributes in __slots__ so instances carry no __dict__,
+	and attribute names allowed to be overridden in the class attribute __excepts__.
 	"""
 	
+	__slots__ = ( "__assigned__", )
+	
+	__excepts__:FrozenSet[Str] = frozenset()
+	""" Attribute names allowed to be overridden """
+	
+	__mapping__:Bool = False
+	""" Whether the class also extends the Map class """
+	
+	__members__:Dict[Str,Tuple[Int,MemberDescriptorType]] = {}
+	""" Assigned flag and slot descriptor of the class by attribute name """
+	
+	def __new__( cls, *args:Any, **kwargs:Any ) -> Self:
+		instance = object.__new__( cls )
+		Assigned.__set__( instance, 0 )
+		return instance
+	
+	def __init_subclass__( cls, **kwargs:Any ) -> None:
+		super().__init_subclass__( **kwargs )
+		names = [
+			name
+				for parent in reversed( cls.__mro__ )
+				for name, member in vars( parent ).items()
+				if isinstance( member, MemberDescriptorType ) and name != "__assigned__"
+		]
+		cls.__mapping__ = issubclass( cls, Map )
+		cls.__members__ = { name: ( 1 << flag, getattr( cls, name ) ) for flag, name in enumerate( names ) }
+	
 	@final
 	def __setattr__( self, name:Key, value:Val ) -> None:
-		if isinstance( self, Map ):
+		member = self.__members__.get( name )
+		if member is not None:
+			assigned = self.__assigned__
+			if assigned & member[0] and name not in self.__excepts__:
+				raise TypeError( f"Cannot override attribute \"{name}\", cannot override attribute that has been set in a class that extends the Readonly class" )
+			member[1].__set__( self, value )
+			Assigned.__set__( self, assigned | member[0] )
+		elif self.__mapping__:
 			Map.__setattr__( self, name, value )
+		elif name == "__excepts__":
+			raise TypeError( f"Cannot set attribute \"{name}\", the attribute must be declared in a class that extends the Readonly class" )
 		else:
-			excepts = []
-			if "__excepts__" in self.__dict__:
-				if isinstance( self.__dict__['__excepts__'], list ):
-					for keyword in self.__dict__['__excepts__']:
-						if keyword in excepts:
-							continue
-						if not isinstance( keyword, str ):
-							excepts = []
-							break
-						excepts.append( keyword )
-			if name == "__excepts__":
-				if isinstance( value, list ):
-					allows = True
-					for keyword in value:
-						if keyword in excepts: continue
-						if not isinstance( keyword, str ):
-							allows = False; break
-					if allows:
-						self.__dict__['__excepts__'] = [ *excepts, *value ]
-						return
-			if name in self.__dict__:
-				if name not in excepts:
-					raise TypeError( f"Cannot override attribute \"{name}\", cannot override attribute that has been set in a class that extends the Readonly class" )
-			self.__dict__[name] = value
-		...
+			if name in getattr( self, "__dict__", () ) and name not in self.__excepts__:
+				raise TypeError( f"Cannot override attribute \"{name}\", cannot override attribute that has been set in a class that extends the Readonly class" )
+			object.__setattr__( self, name, value )
 	
 	@final
 	def __setitem__( self, key:Key, value:Val ) -> None:
-		if isinstance( self, Map ):
+		if self.__mapping__:
 			Map.__setitem__( self, key, value )
 		else:
 			raise TypeError( "\"{}\" Map does not support item assignment".format( type( self ).__name__ ) )
 		...
 
 	...
+
+
+Assigned:MemberDescriptorType = Readonly.__dict__['__assigned__']
+""" Slot descriptor of assigned attribute flags """
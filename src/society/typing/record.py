@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from builtins import bool as Bool, float as Float, int as Int, str as Str
+from glob import iglob
+from json import load
+from keyword import iskeyword
+from os.path import isdir, join
+from typing import Any, Callable, Dict, final, Iterable, Iterator, List, Set, Tuple, Type, Union
+
+from society.typing.builtins import Key, Self, Val
+from society.typing.map import Map
+
+
+Annotations:Dict[Str,Str] = {
+	"bool": "Bool",
+	"float": "Float",
+	"int": "Int",
+	"mapping": "Val",
+	"null": "None",
+	"sequence": "List[Val]",
+	"str": "Str"
+}
+""" Annotation of generated record field by the observed kind """
+
+
+class Record:
+	
+	"""
+	Base of generated slotted record, the known fields of the
+	__typename are stored in slots and the unknown fields are
+	kept in Map under __extra__, each generated class defines
+	the classmethod fromDict( values, build ) constructing the
+	record of the payload dict, where build convert the nested
+	value into record or Map
+	"""
+	
+	__slots__ = ( "__extra__", )
+	
+	__fields__:Set[Key] = frozenset()
+	""" Known field names including __typename """
+	
+	__typename__:Str = ""
+	""" The __typename of the record """
+	
+	def __contains__( self, name:Key ) -> Bool:
+		try:
+			self[name]
+		except KeyError:
+			return False
+		return True
+	
+	def __getattr__( self, name:Key ) -> Val:
+		
+		""" Return unknown field value from the Map fallback """
+		
+		if name != "__extra__" and self.__extra__ is not None and name in self.__extra__:
+			return self.__extra__[name]
+		raise AttributeError( "\"{}\" Record object has no attribute \"{}\"".format( type( self ).__name__, name ) )
+	
+	def __getitem__( self, name:Key ) -> Val:
+		
+		""" Return field value from the slots or the Map fallback """
+		
+		if name == "__typename":
+			return self.__typename__
+		if name in self.__fields__:
+			try:
+				return getattr( self, name )
+			except AttributeError:
+				pass
+		elif self.__extra__ is not None and name in self.__extra__:
+			return self.__extra__[name]
+		raise KeyError( "\"{}\" Record object has no item \"{}\"".format( type( self ).__name__, name ) )
+	
+	def __iter__( self ) -> Iterator[Tuple[Key,Val]]:
+		
+		""" Return iterator of key value pairs """
+		
+		yield ( "__typename", self.__typename__ )
+		for name in self.__slots__:
+			try:
+				yield ( name, getattr( self, name ) )
+			except AttributeError:
+				pass
+		if self.__extra__ is not None:
+			yield from self.__extra__
+	
+	def __props__( self ) -> Dict[Key,Val]:
+		
+		"""
+		Return Dictionary of Record
+		
+		:return Dict<Key,Val>
+		"""
+		
+		def convert( value:Val ) -> Val:
+			if isinstance( value, ( Map, Record ) ):
+				return { name: convert( item ) for name, item in value }
+			if isinstance( value, ( list, tuple ) ):
+				return [ convert( item ) for item in value ]
+			return value
+		return { name: convert( value ) for name, value in self }
+	
+	def __repr__( self ) -> Str:
+		return "{}({})".format( type( self ).__name__, ", ".join( f"{name}={value!r}" for name, value in self if name != "__typename" ) )
+	
+	...
+
+@final
+class Records:
+	
+	"""
+	Typed record classes generated by __typename from observed
+	payload shapes, convert payload dict into slotted records and
+	dict without known __typename into Map
+	"""
+	
+	__slots__ = ( "__schema__", "__source__", "__types__" )
+	
+	def __init__( self, schema:Dict[Str,Dict[Key,Set[Str]]] ) -> None:
+		
+		"""
+		Construct method of class Records
+		
+		:params Dict<Str,Dict<Key,Set<Str>>> schema
+			Observed kinds of field by __typename, see infer
+		
+		:return None
+		"""
+		
+		self.__schema__:Dict[Str,Dict[Key,Set[Str]]] = schema
+		self.__source__:Str = source( schema )
+		self.__types__:Dict[Str,Type[Record]] = generate( self.__source__ )
+	
+	def __call__( self, value:Val ) -> Val:
+		
+		"""
+		Return the value converted into records
+		
+		:params Val value
+		
+		:return Val
+		"""
+		
+		types = self.__types__
+		def build( value:Val ) -> Val:
+			if isinstance( value, dict ):
+				Type = types.get( value.get( "__typename" ) )
+				if Type is not None:
+					return Type.fromDict( value, build )
+				return Map( inner( value ) )
+			if isinstance( value, list ):
+				return [ build( item ) for item in value ]
+			return value
+		def inner( value:Val ) -> Val:
+			if isinstance( value, dict ):
+				Type = types.get( value.get( "__typename" ) )
+				if Type is not None:
+					return Type.fromDict( value, build )
+				return { keyset: inner( item ) for keyset, item in value.items() }
+			if isinstance( value, list ):
+				return [ inner( item ) for item in value ]
+			return value
+		return build( value )
+	
+	@property
+	def schema( self ) -> Dict[Str,Dict[Key,Set[Str]]]: return self.__schema__
+	
+	@property
+	def source( self ) -> Str: return self.__source__
+	
+	@property
+	def types( self ) -> Dict[Str,Type[Record]]: return dict( self.__types__ )
+	
+	@classmethod
+	def fromResources( cls, *directories:Str, pattern:Str="**/*.json" ) -> Self:
+		
+		"""
+		Return the records inferred from stored Json responses
+		
+		:params Str *directories
+			e.g resources/example, resources/contents
+		:params Str pattern
+			The glob pattern of the response files
+		
+		:return Records
+		"""
+		
+		return cls( infer( samples( *directories, pattern=pattern ) ) )
+	
+	@classmethod
+	def fromSamples( cls, payloads:Iterable[Val] ) -> Self:
+		
+		"""
+		Return the records inferred from payloads
+		
+		:params Iterable<Val> payloads
+		
+		:return Records
+		"""
+		
+		return cls( infer( payloads ) )
+	
+	...
+
+
+def fields( names:Iterable[Key] ) -> List[Key]:
+	
+	"""
+	Return the field names that can be stored in slots, other
+	names including the generated fromDict are kept in Map
+	fallback
+	
+	:params Iterable<Key> names
+	
+	:return List<Key>
+	"""
+	
+	return [
+		name
+			for name in names
+			if isinstance( name, str ) and name.isidentifier() and not iskeyword( name ) and not name.startswith( "_" ) and name != "fromDict" and not hasattr( Record, name )
+	]
+
+def generate( code:Str ) -> Dict[Str,Type[Record]]:
+	
+	"""
+	Execute the generated source and return the record classes
+	
+	:params Str code
+	
+	:return Dict<Str,Type<Record>>
+	"""
+	
+	namespace = { "__name__": __name__ }
+	exec( code, namespace )
+	return { Type.__typename__: Type for Type in namespace.values() if isinstance( Type, type ) and issubclass( Type, Record ) and Type is not Record }
+
+def infer( payloads:Iterable[Val] ) -> Dict[Str,Dict[Key,Set[Str]]]:
+	
+	"""
+	Return observed kinds of each field by __typename, fields are
+	kept in the order they are first seen
+	
+	:params Iterable<Val> payloads
+	
+	:return Dict<Str,Dict<Key,Set<Str>>>
+	"""
+	
+	schema = {}
+	def walk( value:Val ) -> None:
+		if isinstance( value, ( dict, Map ) ):
+			items = value.items()
+			typename = value.get( "__typename" )
+			if isinstance( typename, str ):
+				shape = schema.setdefault( typename, {} )
+				for keyset, item in items:
+					if keyset != "__typename":
+						shape.setdefault( keyset, set() ).add( kind( item ) )
+			for _, item in items:
+				walk( item )
+		elif isinstance( value, ( list, tuple ) ):
+			for item in value:
+				walk( item )
+	for payload in payloads:
+		walk( payload )
+	return schema
+
+def kind( value:Val ) -> Str:
+	
+	"""
+	Return the kind name of observed value
+	
+	:params Val value
+	
+	:return Str
+	"""
+	
+	if value is None:
+		return "null"
+	if isinstance( value, ( dict, Map ) ):
+		return "mapping"
+	if isinstance( value, ( list, tuple ) ):
+		return "sequence"
+	if isinstance( value, bool ):
+		return "bool"
+	if isinstance( value, int ):
+		return "int"
+	if isinstance( value, float ):
+		return "float"
+	return "str"
+
+def samples( *directories:Str, pattern:Str="**/*.json" ) -> Iterator[Val]:
+	
+	"""
+	Return iterator of stored Json responses, the unreadable files
+	are skipped
+	
+	:params Str *directories
+	:params Str pattern
+	
+	:return Iterator<Val>
+	"""
+	
+	for directory in directories:
+		if not isdir( directory ):
+			continue
+		for filename in sorted( iglob( join( directory, pattern ), recursive=True ) ):
+			try:
+				with open( filename, "r", encoding="utf-8" ) as fopen:
+					yield load( fopen )
+			except ( OSError, ValueError ):
+				continue
+
+def source( schema:Dict[Str,Dict[Key,Set[Str]]] ) -> Str:
+	
+	"""
+	Return Python source of slotted record classes with the
+	precompiled constructor for each __typename
+	
+	:params Dict<Str,Dict<Key,Set<Str>>> schema
+	
+	:return Str
+	"""
+	
+	lines = [
+		"from builtins import bool as Bool, float as Float, int as Int, str as Str",
+		"from typing import List, Union",
+		"",
+		"from society.typing.builtins import Val",
+		"from society.typing.map import Map",
+		"from society.typing.record import Record",
+		"",
+		"new = object.__new__",
+		""
+	]
+	names = set()
+	for typename in sorted( schema ):
+		name = "".join( character if character.isalnum() or character == "_" else "_" for character in typename )
+		if not name or not name[0].isalpha() or iskeyword( name ) or name in names:
+			name = f"Record{len( names )}"
+		names.add( name )
+		shape = schema[typename]
+		slots = fields( shape )
+		lines += [
+			"",
+			f"class {name}( Record ):",
+			"\t",
+			f"\t\"\"\" Generated record of {typename} \"\"\"",
+			"\t",
+			f"\t__slots__ = {tuple( slots )!r}",
+			f"\t__fields__ = frozenset({tuple( sorted([ '__typename', *slots ]) )!r})",
+			f"\t__typename__ = {typename!r}",
+			"\t"
+		]
+		for slot in slots:
+			kinds = sorted( Annotations[observed] for observed in shape[slot] )
+			lines.append( "\t{}:{}".format( slot, kinds[0] if len( kinds ) == 1 else "Union[{}]".format( ",".join( kinds ) ) ) )
+		lines += [
+			"\t",
+			"\t@classmethod",
+			"\tdef fromDict( cls, values, build ):",
+			"\t\tself = new( cls )"
+		]
+		for slot in slots:
+			nested = shape[slot] & { "mapping", "sequence" }
+			lines += [
+				f"\t\tif {slot!r} in values:",
+				f"\t\t\tself.{slot} = build( values[{slot!r}] )" if nested else f"\t\t\tself.{slot} = values[{slot!r}]"
+			]
+		lines += [
+			"\t\tif values.keys() <= cls.__fields__:",
+			"\t\t\tself.__extra__ = None",
+			"\t\telse:",
+			"\t\t\tself.__extra__ = build({ keyset: item for keyset, item in values.items() if keyset not in cls.__fields__ })",
+			"\t\treturn self",
+			""
+		]
+	return "\n".join( lines )
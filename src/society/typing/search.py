@@ -34,6 +34,8 @@ class Filter( Readonly ):
 	
 	""" Search Filter Typing Implementation """
 	
+	__slots__ = ( "name", "args" )
+	
 	def __init__( self, name:Str, args:Any=None ) -> None:
 		
 		"""
@@ -63,6 +65,8 @@ class Tab( Readonly ):
 	
 	""" Search Tab Typing Implementation """
 	
+	__slots__ = ( "name", "filters" )
+	
 	ANY:Str = "GLOBAL_SEARCH"
 	GROUP:Str = "GROUPS_TAB"
 	PAGE:Str = "PAGES_TAB"
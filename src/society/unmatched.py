@@ -27,7 +27,7 @@ from inspect import getframeinfo, stack
 from json import dumps as encoder
 from typing import Any, Dict, final, List, Union
 
-from society.common import strftime, timestamp
+from society.common import deprecated, strftime, timestamp
 from society.logging import Logging
 from society.storage import Storage
 
@@ -38,7 +38,7 @@ class Unmatched:
 	""" An Unmatched Class Implementation for dumping every unmatched graphql contents """
 	
 	@staticmethod
-	def dumping( metadata:Dict[Str,Any], contents:Union[Dict[Str,Any],List[Dict[Str,Any]],Str], thread:Int=0 ) -> None:
+	def dumping( metadata:Dict[Str,Any], contents:Union[Dict[Str,Any],List[Dict[Str,Any]],Str], thread:Int=None ) -> None:
 		
 		"""
 		Dumping unmatched contents
@@ -50,11 +50,13 @@ class Unmatched:
 		:params Dict<Str,Any>|List<Dict<Str,Any>>|Str contents
 			Unmatched graphql contents
 		:params Int thread
-			Current thread position number
+			Deprecated and ignored
 		
 		:return None
 		"""
 		
+		if thread is not None:
+			deprecated( "thread", "Unmatched.dumping" )
 		currtime = timestamp()
 		pathname = strftime( "%d.%m-%Y %H:%M", currtime )
 		traceback = getframeinfo( stack()[1][0] )
@@ -85,7 +87,7 @@ class Unmatched:
 		while Storage.d( directory ) is True:
 			directory = f"{realname}/{counter}"
 			counter += 1
-		Logging.warning( "Found unmatched contents on {}:{}", filename, inlineno, thread=thread, start="\x0d" )
+		Logging.warning( "Found unmatched contents on {}:{}", filename, inlineno, start="\x0d" )
 		Storage.mkdir( directory )
 		if isinstance( contents, ( dict, list ) ):
 			Storage.touch( f"{directory}/unmatched-contents-{pathname}.json", encoder( contents, indent=4 ) )
@@ -23,14 +23,16 @@
 #
 
 from builtins import int as Int, str as Str
-from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, TimeoutError
+from concurrent.futures import as_completed, CancelledError, Future, ThreadPoolExecutor, TimeoutError
 from json import loads as decoder, JSONDecodeError
 from time import sleep
 from traceback import format_exc, format_exception
-from typing import Any, Callable, Dict, Iterable, List, Literal, MutableMapping, MutableSequence, TypeVar as Var
+from typing import Any, Callable, Dict, Final, Iterable, List, Literal, MutableMapping, MutableSequence, TypeVar as Var
 
 from society.common import snakeCase, typeof
+from society.context import Context
 from society.logging import Logging
+from society.progress import Progress
 from society.typing.builtins import Val
 from society.typing.jobdesk import Jobdesk
 from society.typing.result import Result
@@ -43,6 +45,11 @@ Args = Var( "Args" )
 Kwargs = Var( "Kwargs" )
 """ Key Arguments """
 
+Starting:Final[Str] = "Starting thread worker T<{}> for {}"
+""" Logging message of submitted thread worker, one of ten is written """
+
+Logging.Sampling.setdefault( Starting, 0.1 )
+
 
 def Executor( jobdesks:MutableSequence[Jobdesk], sleepy:Int=1, worker:Int=2, workerDelays:Int=10, **kwargs:Any ) -> Iterable[Result[Literal['operation'],Val]]:
 	
@@ -143,66 +150,66 @@ def Executor( jobdesks:MutableSequence[Jobdesk], sleepy:Int=1, worker:Int=2, wor
 			except ValueError as e:
 				Logging.error( "Uncaught ValueError: {}", "\x0a".join( format_exception( e ) ) )
 				Logging.error( "Invalid \"{}\" value, value type must be type {}", jobdeskKeyset, jobdeskTyping.__name__.title(), close=1 )
-		jobdeskThread = jobdesk.thread
-		jobdeskExecute = jobdesk.execute
-		if jobdeskThread is None:
-			results = jobdeskExecute( **jobdeskParams )
-		elif jobdeskThread is ThreadExecutor:
-			jobdeskThreadName = "Executing {execute}"
-			if not jobdesk.dataset:
-				Logging.error( "Cannot executute {}, unknown target dataset", jobdeskExecute, close=1 )
-			jobdeskDatasetName = jobdesk.dataset
-			jobdeskDatasetValue = jobdeskParams[jobdeskDatasetName]
-			if isinstance( jobdeskDatasetValue, int ):
-				jobdeskDatasetValue = list( i for i in range( jobdeskDatasetValue ) )
-			elif isinstance( jobdesk, str ):
-				jobdeskDatasetValue = [jobdeskDatasetValue]
-			if jobdeskDatasetName not in jobdeskParams or not jobdeskParams[jobdeskDatasetName] or not isinstance( jobdeskParams[jobdeskDatasetName], Iterable ):
-				Logging.error( "Cannot execute {}, dataset target does not iterable", jobdeskExecute, close=1 )
-			if isinstance( jobdesk.message, Jobdesk.Message ):
-				if jobdesk.message.name:
-					jobdeskThreadName = jobdesk.message.name
-			jobdeskFormats = { "execute": jobdeskExecute, **jobdeskParams }
-			del jobdeskParams[jobdeskDatasetName]
-			executes = ThreadExecutor(
-				name=jobdeskThreadName.format( **jobdeskFormats ),
-				callback=jobdeskExecute,
-				dataset=jobdeskDatasetValue,
-				sleepy=sleepy,
-				worker=worker,
-				workerDelays=workerDelays,
-				**jobdeskParams
-			)
-			results = list( execute for execute in executes )
-		elif jobdeskThread is ThreadRunner:
-			jobdeskLoading = "Executing {execute}"
-			jobdeskSuccess = None
-			if isinstance( jobdesk.message, Jobdesk.Message ):
-				if jobdesk.message.loading:
-					jobdeskLoading = jobdesk.message.loading
-				if jobdesk.message.success:
-					jobdeskSuccess = jobdesk.message.success
-			jobdeskThread = ThreadRunner(
-				target=jobdeskExecute,
-				success=jobdeskSuccess,
-				loading=jobdeskLoading.format(
-					execute=jobdeskExecute,
+		with Context.bind( job=jobdeskName ):
+			jobdeskThread = jobdesk.thread
+			jobdeskExecute = jobdesk.execute
+			if jobdeskThread is None:
+				results = jobdeskExecute( **jobdeskParams )
+			elif jobdeskThread is ThreadExecutor:
+				jobdeskThreadName = "Executing {execute}"
+				if not jobdesk.dataset:
+					Logging.error( "Cannot executute {}, unknown target dataset", jobdeskExecute, close=1 )
+				jobdeskDatasetName = jobdesk.dataset
+				jobdeskDatasetValue = jobdeskParams[jobdeskDatasetName]
+				if isinstance( jobdeskDatasetValue, int ):
+					jobdeskDatasetValue = list( i for i in range( jobdeskDatasetValue ) )
+				elif isinstance( jobdesk, str ):
+					jobdeskDatasetValue = [jobdeskDatasetValue]
+				if jobdeskDatasetName not in jobdeskParams or not jobdeskParams[jobdeskDatasetName] or not isinstance( jobdeskParams[jobdeskDatasetName], Iterable ):
+					Logging.error( "Cannot execute {}, dataset target does not iterable", jobdeskExecute, close=1 )
+				if isinstance( jobdesk.message, Jobdesk.Message ):
+					if jobdesk.message.name:
+						jobdeskThreadName = jobdesk.message.name
+				jobdeskFormats = { "execute": jobdeskExecute, **jobdeskParams }
+				del jobdeskParams[jobdeskDatasetName]
+				executes = ThreadExecutor(
+					name=jobdeskThreadName.format( **jobdeskFormats ),
+					callback=jobdeskExecute,
+					dataset=jobdeskDatasetValue,
+					sleepy=sleepy,
+					worker=worker,
+					workerDelays=workerDelays,
 					**jobdeskParams
-				),
-				thread=1,
-				**jobdeskParams
-			)
-			if jobdeskThread.exception is not None:
-				exception = jobdeskThread.exception
-				Logging.error( "{}: {}", typeof( exception ), "\x0d".join( format_exception( exception ) ), close=1 )
-			results = jobdeskThread.returns
-		else:
-			Logging.error( "Unhandled executor runner {}", jobdeskThread, close=1 )
+				)
+				results = list( execute for execute in executes )
+			elif jobdeskThread is ThreadRunner:
+				jobdeskLoading = "Executing {execute}"
+				jobdeskSuccess = None
+				if isinstance( jobdesk.message, Jobdesk.Message ):
+					if jobdesk.message.loading:
+						jobdeskLoading = jobdesk.message.loading
+					if jobdesk.message.success:
+						jobdeskSuccess = jobdesk.message.success
+				jobdeskThread = ThreadRunner(
+					target=jobdeskExecute,
+					success=jobdeskSuccess,
+					loading=jobdeskLoading.format(
+						execute=jobdeskExecute,
+						**jobdeskParams
+					),
+					**jobdeskParams
+				)
+				if jobdeskThread.exception is not None:
+					exception = jobdeskThread.exception
+					Logging.error( "{}: {}", typeof( exception ), "\x0d".join( format_exception( exception ) ), close=1 )
+				results = jobdeskThread.returns
+			else:
+				Logging.error( "Unhandled executor runner {}", jobdeskThread, close=1 )
 		if results is not None:
 			yield Result( operation=jobdeskName, values=results )
 	...
 
-def ThreadExecutor( name:Str, callback:Callable[[Any,Args,Kwargs,Int],Any], dataset:Iterable[Any], sleepy:Int=1, worker:Int=2, workerDelays:Int=10, *args:Any, **kwargs:Any ) -> Iterable[Any]:
+def ThreadExecutor( name:Str, callback:Callable[[Any,Args,Kwargs],Any], dataset:Iterable[Any], sleepy:Int=1, worker:Int=2, workerDelays:Int=10, *args:Any, **kwargs:Any ) -> Iterable[Any]:
 	
 	"""
 	Short ThreadPoolExecutor
@@ -221,80 +228,53 @@ def ThreadExecutor( name:Str, callback:Callable[[Any,Args,Kwargs,Int],Any], data
 	
 	results:MutableSequence[Any] = []
 	futures:list[Future] = []
-	with ThreadPoolExecutor( thread_name_prefix=name, max_workers=worker ) as executor:
-		Logging.info( "Building ThreadPoolExecutor with {} workers for {}", worker, name, start="\x0d", thread="T" )
+	positions:Dict[Future,Int] = {}
+	progress = Progress( name, len( dataset ) if hasattr( dataset, "__len__" ) else None )
+	with ThreadPoolExecutor( thread_name_prefix=name, max_workers=worker ) as executor, progress:
+		Logging.info( "Building ThreadPoolExecutor with {} workers for {}", worker, name, start="\x0d" )
 		try:
-			for count, data in enumerate( dataset ):
-				Logging.info( "Starting thread for {}", name, start="\x0d", thread=count+1 )
-				futures.append( executor.submit( callback, data, *args, thread=count+1, **kwargs ) )
-				sleep( workerDelays if ( count +1 ) % worker == 0 else sleepy )
-			while futures and all( future.done() for future in [ *futures ] ) is False:
-				for count, future in enumerate([ *futures ]):
-					if future.running():
-						loading = f"Future thread worker T<{count+1}> is running..."
-						length = len( loading )
-						position = -1
-						for i in "\\|/-" * 16:
-							if position >= length:
-								position = -1
-							position += 1
-							messages = loading
-							if position >= 1:
-								messageChar = loading[position-1:position]
-								messageChar = messageChar.lower() \
-									if messageChar.isupper() \
-									else messageChar.upper()
-								messagePrefix = loading[0:position-1]
-								messagePrefix = loading[:position-1]
-								messageSuffix = loading[position:]
-								messages = "".join([
-									messagePrefix, 
-									messageChar, 
-									messageSuffix
-								])
-							Logging.info( "{}", messages, end="\x20", start="\x0d", thread=i )
-							sleep( 0.1 )
-						try:
-							throwned = future.exception( 0.4 )
-							if isinstance( throwned, BaseException ):
-								Logging.error( "Future thread worker {} is raised {}: {}", count+1, typeof( throwned ), "\x0a".join( format_exception( throwned ) ), thread=count+1, start="\x0d" )
-								Logging.error( "Future thread worker {} is deleted from futures", count+1, thread=count+1, start="\x0d" )
-								del futures[count]
-						except CancelledError:
-							...
-						except TimeoutError:
-							...
-						finally:
-							...
-						...
+			for position, data in enumerate( dataset, 1 ):
+				Logging.info( Starting, position, name, start="\x0d" )
+				future = executor.submit( Context.wrap( progress.call, job=Context.get( "job", name ), item=data, index=position ), f"T<{position}>", callback, data, *args, **kwargs )
+				positions[future] = position
+				futures.append( future )
+				sleep( workerDelays if position % worker == 0 else sleepy )
+			for future in as_completed([ *futures ]):
+				try:
+					throwned = future.exception()
+					if isinstance( throwned, BaseException ):
+						Logging.error( "Future thread worker T<{}> is raised {}: {}", positions[future], typeof( throwned ), "\x0a".join( format_exception( throwned ) ), start="\x0d" )
+						Logging.error( "Future thread worker T<{}> is deleted from futures", positions[future], start="\x0d" )
+						futures.remove( future )
+				except CancelledError:
 					...
-				...
-			...
+			progress.close()
 		except BaseException as e:
+			progress.close()
 			if isinstance( e, KeyboardInterrupt ):
-				Logging.error( "ThreadPoolExecutor has been shuting down", start="\x0a", thread="T" )
+				Logging.error( "ThreadPoolExecutor has been shuting down", start="\x0a" )
 				executor.shutdown()
 			else:
-				Logging.error( "{}: {}", typeof( e ), "\x0a".join( format_exception( e ) ), start="\x0d", thread="T" )
+				Logging.error( "{}: {}", typeof( e ), "\x0a".join( format_exception( e ) ), start="\x0d" )
 			...
 		...
-		Logging.warning( "ThreadPoolExecutor enumerating futures", start="\x0d", thread="T" )
-		for i, future in enumerate( futures ):
+		Logging.warning( "ThreadPoolExecutor enumerating futures", start="\x0d" )
+		for future in futures:
 			if future.cancelled() is True:
-				Logging.warning( "Future thread worker T<{}> is cancelled", i+1, start="\x0d", thread=i+1 )
+				Logging.warning( "Future thread worker T<{}> is cancelled", positions[future], start="\x0d" )
 				continue
 			try:
 				yield future.result( 1 )
 				results.append( future )
 			except CancelledError:
-				Logging.warning( "Future thread worker T<{}> is cancelled", i+1, start="\x0d", thread=i+1 )
+				Logging.warning( "Future thread worker T<{}> is cancelled", positions[future], start="\x0d" )
 			except TimeoutError:
-				Logging.warning( "Future thread worker T<{}> is timeout", i+1, start="\x0d", thread=i+1 )
+				Logging.warning( "Future thread worker T<{}> is timeout", positions[future], start="\x0d" )
 			except BaseException as e:
-				Logging.error( "{}: {}", typeof( e ), "\x0a".join( format_exception( e ) ), start="\x0d", thread=i+1 )
+				Logging.error( "{}: {}", typeof( e ), "\x0a".join( format_exception( e ) ), start="\x0d" )
 			...
-		Logging.info( "A total of {} worker threads have been completed", len( results ), start="\x0d", thread="T" )
-		Logging.info( "ThreadPoolExecutor for {} stoped", name, start="\x0d", thread="T" )
+		Logging.info( "A total of {} worker threads have been completed", len( results ), start="\x0d" )
+		Logging.info( "ThreadPoolExecutor for {} stoped", name, start="\x0d" )
 	results = None
 	futures = None
 
@@ -315,30 +295,11 @@ def ThreadRunner( loading:Str, success:Str=None, group=None, target:Callable[[Ar
 	"""
 	
 	try:
-		thread = Threading( group=group, target=target, name=name, args=args, kwargs=kwargs )
-		thread.start()
-		while thread.is_alive():
-			length = len( loading )
-			position = -1
-			for i in "\\|/-" * 16:
-				if position >= length:
-					position = -1
-				position += 1
-				messages = loading
-				if position >= 1:
-					messageChar = loading[position-1:position]
-					messageChar = messageChar.lower() \
-						if messageChar.isupper() \
-						else messageChar.upper()
-					messagePrefix = loading[0:position-1]
-					messageSuffix = loading[position:]
-					messages = "".join([
-						messagePrefix, 
-						messageChar, 
-						messageSuffix
-					])
-				Logging.info( "{}", messages, end="\x20", start="\x0d", thread=i )
-				sleep( 0.1 )
+		with Progress( loading, 1 ) as progress:
+			thread = Threading( group=group, target=Context.wrap( progress.call, index=1 ), name=name, args=( loading, target, *args ), kwargs=kwargs )
+			thread.start()
+			while thread.is_alive():
+				thread.join( 0.1 )
 		Logging.info( "{}", success if success is not None else loading, end="\x0a", start="\x0d" )
 		return thread
 	except BaseException as e:
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from json import dumps
+from os import listdir
+from os.path import abspath, dirname, exists
+from sys import path as paths
+from tempfile import TemporaryDirectory
+from unittest import main, TestCase
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.archive import Archive
+from society.logging import Logging, Writer
+
+
+class TestArchive( TestCase ):
+	
+	def setUp( self ) -> None:
+		self.temporary = TemporaryDirectory()
+		self.directory = self.temporary.name
+		self.block = Archive.Block
+	
+	def tearDown( self ) -> None:
+		Archive.Block = self.block
+		self.temporary.cleanup()
+	
+	def compress( self, records:list, name:str="society - 2024-01-12.1.log" ) -> str:
+		source = f"{self.directory}/{name}"
+		marks = []
+		offset = 0
+		with open( source, "wb" ) as fwrite:
+			for line, time, level, thread in records:
+				chunk = line.encode( "utf-8" )
+				fwrite.write( chunk )
+				marks.append(( offset, len( chunk ), time, level, thread ))
+				offset += len( chunk )
+		Archive.compress( source, marks, source )
+		return source
+	
+	def records( self ) -> list:
+		return [
+			( "first info\n", 100.0, Logging.Info, "1" ),
+			( "second error\ntraceback\n", 200.0, Logging.Error, "2" ),
+			( "third debug\n", 300.0, Logging.Debug, "1" ),
+			( "fourth warning\n", 400.0, Logging.Warning, "2" )
+		]
+	
+	def testCompressRemovesSource( self ) -> None:
+		segment = self.compress( self.records() )
+		self.assertFalse( exists( segment ) )
+		self.assertTrue( exists( f"{segment}.zst" ) )
+		self.assertTrue( exists( f"{segment}.idx" ) )
+	
+	def testQueryAll( self ) -> None:
+		self.compress( self.records() )
+		self.assertEqual( "".join( Archive.query( self.directory ) ), "".join( line for line, *_ in self.records() ) )
+	
+	def testQueryLevel( self ) -> None:
+		self.compress( self.records() )
+		self.assertEqual( list( Archive.query( self.directory, level=Logging.Warning ) ), [ "second error\ntraceback\n", "fourth warning\n" ] )
+	
+	def testQueryThread( self ) -> None:
+		self.compress( self.records() )
+		self.assertEqual( list( Archive.query( self.directory, thread="1" ) ), [ "first info\n", "third debug\n" ] )
+		self.assertEqual( list( Archive.query( self.directory, thread="3" ) ), [] )
+	
+	def testQueryTimeRange( self ) -> None:
+		self.compress( self.records() )
+		self.assertEqual( list( Archive.query( self.directory, since=150, until=350 ) ), [ "second error\ntraceback\nthird debug\n" ] )
+		self.assertEqual( list( Archive.query( self.directory, since=500 ) ), [] )
+	
+	def testRecordsNotSplitAcrossFrames( self ) -> None:
+		Archive.Block = 16
+		self.compress( self.records() )
+		self.assertEqual( "".join( Archive.query( self.directory ) ), "".join( line for line, *_ in self.records() ) )
+		self.assertEqual( list( Archive.query( self.directory, level=Logging.Error ) ), [ "second error\ntraceback\n" ] )
+	
+	def testSegmentsOrder( self ) -> None:
+		for name in ( "society - 2024-01-13.1.log", "society - 2024-01-12.10.log", "society - 2024-01-12.2.log" ):
+			self.compress( self.records(), name )
+		open( f"{self.directory}/society - 2024-01-14.1.log.zst", "wb" ).close()
+		names = [ segment.rsplit( "/", 1 )[1] for segment in Archive.segments( self.directory ) ]
+		self.assertEqual( names, [ "society - 2024-01-12.2.log", "society - 2024-01-12.10.log", "society - 2024-01-13.1.log" ] )
+		self.assertEqual( Archive.segments( f"{self.directory}/missing" ), [] )
+	
+
+class TestWriter( TestCase ):
+	
+	def setUp( self ) -> None:
+		self.temporary = TemporaryDirectory()
+		self.directory = self.temporary.name
+	
+	def tearDown( self ) -> None:
+		self.temporary.cleanup()
+	
+	def testCloseArchives( self ) -> None:
+		writer = Writer( self.directory, interval=0.01 )
+		writer.start()
+		writer.put( "started\n", Logging.Info, 100.0, 1 )
+		writer.put( "failed\n", Logging.Error, 200.0, 2 )
+		writer.close()
+		self.assertIsNone( writer.exception )
+		self.assertFalse( [ fname for fname in listdir( self.directory ) if fname.endswith( ".log" ) ] )
+		self.assertEqual( list( Archive.query( self.directory ) ), [ "started\nfailed\n" ] )
+		self.assertEqual( list( Archive.query( self.directory, thread="2" ) ), [ "failed\n" ] )
+	
+	def testRecover( self ) -> None:
+		with open( f"{self.directory}/society - 2024-01-12.log", "w" ) as fwrite:
+			fwrite.write( dumps({ "level": "info", "ts": 100.0, "thread": "1", "message": "left" }) + "\n" )
+			fwrite.write( dumps({ "level": "error", "ts": 200.0, "thread": "2", "message": "crashed" }) + "\n" )
+			fwrite.write( "continuation\n" )
+		Writer( self.directory ).recover()
+		self.assertEqual( [ segment.rsplit( "/", 1 )[1] for segment in Archive.segments( self.directory ) ], [ "society - 2024-01-12.1.log" ] )
+		records = list( Archive.query( self.directory, level=Logging.Error ) )
+		self.assertEqual( len( records ), 1 )
+		self.assertTrue( records[0].startswith( "{" ) and "crashed" in records[0] and records[0].endswith( "continuation\n" ) )
+	
+
+if __name__ == "__main__":
+	main()
+	
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from copy import copy, deepcopy
+from datetime import datetime
+from io import BytesIO
+from os.path import abspath, dirname
+from pickle import dumps, loads
+from sys import path as paths
+from unittest import main, TestCase
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.codec import dump, Encoder, iterload, load, pack, register, Tagged, unpack
+from society.typing.map import Map
+
+
+class Profile( Map ):
+	...
+	
+
+class Renamed( Map ):
+	...
+	
+
+class TestCodec( TestCase ):
+	
+	def testPlainValues( self ) -> None:
+		for value in [ None, True, False, 0, 127, -32, -33, 255, 2 ** 16, -2 ** 31, 2 ** 64 - 1, -2 ** 63, 2 ** 70, -2 ** 70, 1.5, "", "x" * 40, "é" * 70000, [], [ 1, [ 2 ] ], {} ]:
+			self.assertEqual( unpack( pack( value ) ), value )
+		self.assertEqual( bytes( unpack( pack( b"\x00\x01" ) ) ), b"\x00\x01" )
+		self.assertEqual( unpack( pack( ( 1, 2 ) ) ), [ 1, 2 ] )
+	
+	def testMap( self ) -> None:
+		value = Map({ "a": 1, "b": { "c": [ { "d": None } ] } })
+		decoded = unpack( pack( value ) )
+		self.assertIsInstance( decoded, Map )
+		self.assertIsInstance( decoded.b.c[0], Map )
+		self.assertEqual( decoded.__props__(), value.__props__() )
+	
+	def testTypedMap( self ) -> None:
+		value = Profile({ "name": "a", "child": Map({ "id": 1 }) })
+		decoded = unpack( pack([ value, value ]) )
+		self.assertIsInstance( decoded[0], Profile )
+		self.assertIsInstance( decoded[1], Profile )
+		self.assertEqual( decoded[0].__props__(), value.__props__() )
+		self.assertEqual( type( decoded[0].child ).__name__, "MapBuilder" )
+		self.assertEqual( deepcopy( value ).__props__(), value.__props__() )
+	
+	def testCopy( self ) -> None:
+		value = Profile({ "name": "a", "child": { "id": 1 }, "created": datetime( 2024, 1, 12 ) })
+		shallow = copy( value )
+		self.assertIsInstance( shallow, Profile )
+		self.assertIs( shallow.child, value.child )
+		shallow.name = "b"
+		self.assertEqual( value.name, "a" )
+		deep = deepcopy( value )
+		self.assertIsInstance( deep, Profile )
+		self.assertIsNot( deep.child, value.child )
+		deep.child.id = 2
+		self.assertEqual( value.child.id, 1 )
+		self.assertEqual( deep.created, value.created )
+		snapshot = value.snapshot()
+		self.assertIs( copy( snapshot ), snapshot )
+		self.assertIs( deepcopy( snapshot ), snapshot )
+	
+	def testPickle( self ) -> None:
+		value = Profile({ "name": "a", "child": { "id": 1 } })
+		decoded = loads( dumps( value ) )
+		self.assertIsInstance( decoded, Profile )
+		self.assertEqual( decoded.__props__(), value.__props__() )
+	
+	def tagged( self, name:str ) -> bytes:
+		encoder = Encoder()
+		encoder.buffer.append( Tagged )
+		encoder.encode( 0 )
+		encoder.encode( name )
+		encoder.encode( {} )
+		encoder.encode({ "a": 1 })
+		return bytes( encoder.buffer )
+	
+	def testUnknownReference( self ) -> None:
+		for name in [ "os:system", "subprocess:Popen", "society.codec:Encoder", "tests.missing:Profile", 1 ]:
+			with self.assertRaises( ValueError ):
+				unpack( self.tagged( name ) )
+	
+	def testRegister( self ) -> None:
+		with self.assertRaises( ValueError ):
+			unpack( self.tagged( "legacy:Renamed" ) )
+		register( Renamed, "legacy:Renamed" )
+		decoded = unpack( self.tagged( "legacy:Renamed" ) )
+		self.assertIsInstance( decoded, Renamed )
+		self.assertEqual( decoded.a, 1 )
+		self.assertIsInstance( unpack( self.tagged( "+legacy:Renamed" ) ), Renamed )
+		with self.assertRaises( TypeError ):
+			register( dict )
+	
+	def testStream( self ) -> None:
+		stream = BytesIO()
+		for value in [ 1, Map({ "a": [ 1, 2 ] }), "x" ]:
+			dump( value, stream )
+		stream.seek( 0 )
+		values = list( iterload( stream, chunk=3 ) )
+		self.assertEqual( values[0], 1 )
+		self.assertEqual( values[1].__props__(), { "a": [ 1, 2 ] } )
+		self.assertEqual( values[2], "x" )
+		stream.seek( 0 )
+		self.assertEqual( load( stream ), 1 )
+	
+	def testTruncated( self ) -> None:
+		encoded = pack({ "a": "x" * 100 })
+		with self.assertRaises( ValueError ):
+			unpack( encoded[:-1] )
+		with self.assertRaises( ValueError ):
+			unpack( encoded + b"\x00" )
+	
+
+if __name__ == "__main__":
+	main()
+	
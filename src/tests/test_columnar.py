@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from array import array
+from os.path import abspath, dirname
+from sys import path as paths
+from unittest import main, TestCase
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.typing.columnar import Column, columnar
+from society.typing.map import Map
+
+
+class TestColumn( TestCase ):
+	
+	def column( self, *values ) -> Column:
+		column = Column( "value" )
+		for value in values:
+			column.append( value )
+		return column
+	
+	def testInteger( self ) -> None:
+		column = self.column( 1, 2, True )
+		self.assertIsInstance( column.buffer, array )
+		self.assertEqual( column.buffer.typecode, "q" )
+		self.assertEqual( list( column.buffer ), [ 1, 2, 1 ] )
+	
+	def testFloatPromotion( self ) -> None:
+		column = self.column( 1, 2.5, None )
+		self.assertEqual( column.buffer.typecode, "d" )
+		self.assertEqual( column.buffer[:2].tolist(), [ 1.0, 2.5 ] )
+		self.assertNotEqual( column.buffer[2], column.buffer[2] )
+	
+	def testLargeIntegerKeepsPrecision( self ) -> None:
+		large = 2 ** 63 + 1
+		for values in [ ( 1, large ), ( None, large ), ( 1.5, large ), ( large, 1.5 ), ( 2 ** 53 + 1, None ) ]:
+			column = self.column( *values )
+			self.assertEqual( column.buffer, list( values ) )
+	
+	def testMixed( self ) -> None:
+		self.assertEqual( self.column( "a", None, "b" ).buffer, [ "a", None, "b" ] )
+		self.assertEqual( self.column( 1, "a" ).buffer, [ 1, "a" ] )
+		self.assertEqual( self.column( None, None ).buffer, [ None, None ] )
+	
+	def testColumnar( self ) -> None:
+		records = [ Map({ "node": { "count": 1, "name": "a" } }), { "node": { "count": 2 } } ]
+		columns = columnar( records, [ "node.count", "node.name" ] )
+		self.assertEqual( list( columns['node.count'] ), [ 1, 2 ] )
+		self.assertEqual( columns['node.name'], [ "a", None ] )
+	
+
+if __name__ == "__main__":
+	main()
+	
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from io import BytesIO, StringIO
+from json import dumps, JSONDecodeError
+from os.path import abspath, dirname
+from sys import path as paths
+from unittest import main, TestCase
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.typing.map import Map
+
+
+Records:list = [
+	{ "id": 1, "name": "éè 😀", "tags": [ "a", "b" ], "node": { "count": 1.5e3 } },
+	{ "id": -20, "name": "", "tags": [], "node": None },
+	{ "id": 3, "name": "x" * 100, "tags": [ { "a": [ 1, 2 ] } ], "node": { "count": 0 } }
+]
+
+
+class Document( Map ):
+	...
+	
+
+class TestFromJson( TestCase ):
+	
+	def testDecode( self ) -> None:
+		source = dumps({ "data": Records })
+		for value in [ source, source.encode( "utf-8" ), bytearray( source.encode( "utf-8" ) ), StringIO( source ), BytesIO( source.encode( "utf-8" ) ) ]:
+			decoded = Map.fromJson( value )
+			self.assertIsInstance( decoded, Map )
+			self.assertIsInstance( decoded.data[0], Map )
+			self.assertIsInstance( decoded.data[2].tags[0], Map )
+			self.assertEqual( decoded.__props__(), { "data": Records } )
+	
+	def testSubclass( self ) -> None:
+		decoded = Document.fromJson( "{\"a\":{\"b\":1}}" )
+		self.assertIsInstance( decoded, Document )
+		self.assertEqual( decoded.a.b, 1 )
+		self.assertEqual( Document.fromJson( "[1,2]" ), [ 1, 2 ] )
+	
+	def testIncrementalArray( self ) -> None:
+		source = dumps( Records, ensure_ascii=False ).encode( "utf-8" )
+		for chunk in [ 1, 3, 7, 65536 ]:
+			decoded = list( Map.fromJson( BytesIO( source ), incremental=True, chunk=chunk ) )
+			self.assertEqual( [ record.__props__() for record in decoded ], Records )
+	
+	def testIncrementalDocuments( self ) -> None:
+		source = "\n".join( dumps( record ) for record in Records ) + "\n12 3.5e1 \"x\""
+		for chunk in [ 1, 2, 65536 ]:
+			decoded = list( Map.fromJson( StringIO( source ), incremental=True, chunk=chunk ) )
+			self.assertEqual( [ record.__props__() for record in decoded[:3] ], Records )
+			self.assertEqual( decoded[3:], [ 12, 35.0, "x" ] )
+	
+	def testIncrementalEmpty( self ) -> None:
+		self.assertEqual( list( Map.fromJson( b"", incremental=True ) ), [] )
+		self.assertEqual( list( Map.fromJson( b" [ ] ", incremental=True ) ), [] )
+	
+	def testIncrementalInvalid( self ) -> None:
+		for source in [ b"[1,2", b"[1 2]", b"[1,]", b"[1] 2", b"{\"a\":" ]:
+			with self.assertRaises( JSONDecodeError ):
+				list( Map.fromJson( source, incremental=True, chunk=2 ) )
+	
+
+if __name__ == "__main__":
+	main()
+	
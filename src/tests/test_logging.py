@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from io import StringIO
+from json import loads
+from os.path import abspath, dirname
+from sys import path as paths
+from unittest import main, TestCase
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.logging import Logging
+from society.utilities import Starting, ThreadExecutor
+
+
+class TestLogging( TestCase ):
+	
+	def setUp( self ) -> None:
+		self.collapsing = dict( Logging.Collapsing )
+		self.sampling = dict( Logging.Sampling )
+		self.output = StringIO()
+		Logging.configure( "debug" )
+		Logging.Mode = "json"
+		Logging.Output = self.output
+	
+	def tearDown( self ) -> None:
+		Logging.flush()
+		Logging.configure()
+		Logging.Collapsing = self.collapsing
+		Logging.Sampling = self.sampling
+		Logging.Sampled = {}
+		Logging.Mode = "text"
+		Logging.Output = None
+	
+	def messages( self ) -> list:
+		return [ loads( line )['message'] for line in self.output.getvalue().splitlines() ]
+	
+	def testNotCollapsedByDefault( self ) -> None:
+		for index in range( 3 ):
+			Logging.info( "Starting thread for {}", index )
+		self.assertEqual( self.messages(), [ "Starting thread for 0", "Starting thread for 1", "Starting thread for 2" ] )
+	
+	def testCollapsed( self ) -> None:
+		Logging.Collapsing = { "Retry request {}": 60.0 }
+		for index in range( 4 ):
+			Logging.info( "Retry request {}", index )
+			Logging.info( "Starting thread for {}", index )
+		Logging.flush()
+		messages = self.messages()
+		self.assertEqual( messages[0], "Retry request 0" )
+		self.assertEqual( messages[-1], "Retry request 3 repeated 3 times" )
+		self.assertEqual( len( messages ), 6 )
+	
+	def testCollapsedWindow( self ) -> None:
+		Logging.Collapsing = { "Retry request {}": 0.0 }
+		for index in range( 3 ):
+			Logging.info( "Retry request {}", index )
+		self.assertEqual( self.messages(), [ "Retry request 0", "Retry request 1", "Retry request 2" ] )
+	
+	def testSampled( self ) -> None:
+		Logging.Sampling = { "Chunk {}": 0.5 }
+		for index in range( 4 ):
+			Logging.info( "Chunk {}", index )
+		self.assertEqual( len( self.messages() ), 2 )
+	
+	def testExecutorSampled( self ) -> None:
+		self.assertIn( Starting, Logging.Sampling )
+		results = list( ThreadExecutor( "sample", lambda data: data * 2, list( range( 20 ) ), 0, 4, 0 ) )
+		self.assertEqual( sorted( results ), [ data * 2 for data in range( 20 ) ] )
+		starting = [ message for message in self.messages() if message.startswith( "Starting thread worker" ) ]
+		self.assertEqual( starting, [ "Starting thread worker T<1> for sample", "Starting thread worker T<11> for sample" ] )
+	
+	def testExecutorPosition( self ) -> None:
+		def callback( data:int ) -> int:
+			if data == 1:
+				raise ValueError( data )
+			return data
+		results = list( ThreadExecutor( "sample", callback, list( range( 4 ) ), 0, 4, 0 ) )
+		self.assertEqual( sorted( results ), [ 0, 2, 3 ] )
+		self.assertIn( "Future thread worker T<2> is deleted from futures", self.messages() )
+	
+
+if __name__ == "__main__":
+	main()
+	
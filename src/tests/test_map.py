@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from gc import collect
+from os.path import abspath, dirname
+from sys import path as paths
+from unittest import main, TestCase
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.typing.map import Map
+
+
+class Identified( Map ):
+	__identity__ = ( "id", )
+	
+
+class TestMerge( TestCase ):
+	
+	def testDeduplicateEqualItems( self ) -> None:
+		value = Map({ "nodes": [ { "a": 1 }, [ 1, 2 ], "x" ] })
+		value.nodes = [ { "a": 1 }, [ 1, 2 ], "x", "y" ]
+		self.assertEqual( value.__props__()['nodes'], [ { "a": 1 }, [ 1, 2 ], "x", "y" ] )
+	
+	def testDeduplicateUnhashableScalars( self ) -> None:
+		value = Map({ "nodes": [ { 1, 2 }, bytearray( b"x" ) ] })
+		value.nodes = [ { 2, 1 }, bytearray( b"x" ), bytearray( b"y" ) ]
+		self.assertEqual( value.__props__()['nodes'], [ { 1, 2 }, bytearray( b"x" ), bytearray( b"y" ) ] )
+	
+	def testIdentityKey( self ) -> None:
+		value = Identified({ "nodes": [ { "id": 1, "name": "a" } ] })
+		value.nodes = [ { "id": 1, "name": "b" }, { "id": 2 } ]
+		self.assertEqual( [ item['id'] for item in value.nodes ], [ 1, 2 ] )
+		self.assertEqual( value.nodes[0]['name'], "a" )
+	
+	def testNestedIdentityKey( self ) -> None:
+		for lazy in [ False, True ]:
+			value = Identified({ "data": { "user": { "edges": [ { "id": 1, "name": "a" } ] } } }, lazy=lazy )
+			value.data.user.edges = [ { "id": 1, "name": "b" }, { "id": 2 } ]
+			self.assertEqual( [ item['id'] for item in value.data.user.edges ], [ 1, 2 ] )
+			self.assertEqual( value.data.user.edges[0]['name'], "a" )
+			self.assertEqual( value.data.__identity__, ( "id", ) )
+	
+	def testIdentityCacheFollowsList( self ) -> None:
+		value = Identified({ "nodes": [ { "id": 1 } ] })
+		value.nodes = [ { "id": 2 } ]
+		value.nodes.append({ "id": 3 })
+		value.nodes = [ { "id": 3 }, { "id": 4 } ]
+		self.assertEqual( [ item['id'] for item in value.nodes ], [ 1, 2, 3, 4 ] )
+		del value['nodes'][0]
+		value.nodes = [ { "id": 1 } ]
+		self.assertEqual( [ item['id'] for item in value.nodes ], [ 2, 3, 4, 1 ] )
+	
+class TestSnapshot( TestCase ):
+	
+	def payload( self ) -> dict:
+		return { "user": { "name": "a" }, "edges": [ { "id": 1 }, [ 1, { "id": 2 } ] ], "pair": ( 1, { "id": 3 } ) }
+	
+	def testHeldReference( self ) -> None:
+		for lazy in [ False, True ]:
+			value = Map( self.payload(), lazy=lazy )
+			held = value.user
+			edges = value.edges
+			snapshot = value.snapshot()
+			held.name = "b"
+			edges.append({ "id": 4 })
+			edges[0]['id'] = 5
+			self.assertEqual( snapshot.user.name, "a" )
+			self.assertEqual( snapshot.__props__(), { **self.payload(), "pair": [ 1, { "id": 3 } ] } )
+			self.assertIs( value.user, held )
+			self.assertEqual( value.user.name, "b" )
+			self.assertEqual( len( value.edges ), 3 )
+			self.assertEqual( value.edges[0]['id'], 5 )
+	
+	def testFrozen( self ) -> None:
+		snapshot = Map( self.payload(), lazy=True ).snapshot()
+		with self.assertRaises( TypeError ):
+			snapshot.user.name = "b"
+		with self.assertRaises( TypeError ):
+			snapshot.edges[1][1]['id'] = 0
+		with self.assertRaises( AttributeError ):
+			snapshot.edges.append( 0 )
+		self.assertIs( snapshot.snapshot(), snapshot )
+	
+	def testThaw( self ) -> None:
+		snapshot = Map( self.payload() ).snapshot()
+		value = Map( snapshot )
+		value.edges[0]['id'] = 2
+		value.edges[1].append( 3 )
+		value.edges[1][1]['id'] = 0
+		value.pair[1]['id'] = 0
+		value.user.name = "b"
+		self.assertIsInstance( value.edges, list )
+		self.assertIsInstance( value.edges[1], list )
+		self.assertEqual( value.__props__(), { "user": { "name": "b" }, "edges": [ { "id": 2 }, [ 1, { "id": 0 }, 3 ] ], "pair": [ 1, { "id": 0 } ] } )
+		self.assertEqual( snapshot.__props__(), { **self.payload(), "pair": [ 1, { "id": 3 } ] } )
+	
+	def testAssignSnapshot( self ) -> None:
+		snapshot = Map( self.payload() ).snapshot()
+		value = Map()
+		value.copy = snapshot.user
+		value.edges = snapshot.edges
+		value.copy.name = "b"
+		value.edges[0]['id'] = 0
+		self.assertEqual( snapshot.user.name, "a" )
+		self.assertEqual( snapshot.edges[0]['id'], 1 )
+	
+	def testSharedUntilChanged( self ) -> None:
+		value = Map( self.payload() )
+		values = value.__dict__['__values__']
+		user = value.user.__dict__['__values__']
+		snapshot = value.snapshot()
+		self.assertIs( value.__dict__['__values__'], values )
+		value.user.name = "b"
+		self.assertIs( value.__dict__['__values__'], values )
+		self.assertIsNot( value.user.__dict__['__values__'], user )
+		self.assertEqual( snapshot.user.name, "a" )
+	
+	def testVersions( self ) -> None:
+		value = Map( self.payload() )
+		edges = value.edges
+		first = value.snapshot()
+		edges.append( 4 )
+		edges[0]['id'] = 5
+		second = value.snapshot()
+		edges[1].append( 3 )
+		value.user.name = "b"
+		self.assertEqual( first.__props__(), { **self.payload(), "pair": [ 1, { "id": 3 } ] } )
+		self.assertEqual( second.__props__()['edges'], [ { "id": 5 }, [ 1, { "id": 2 } ], 4 ] )
+		self.assertEqual( str( second ), "{\"user\": {\"name\": \"a\"}, \"edges\": [{\"id\": 5}, [1, {\"id\": 2}], 4], \"pair\": [1, {\"id\": 3}]}" )
+		self.assertEqual( value.__props__()['edges'], [ { "id": 5 }, [ 1, { "id": 2 }, 3 ], 4 ] )
+	
+	def testVersionsDropped( self ) -> None:
+		value = Map( self.payload() )
+		snapshot = value.snapshot()
+		value.user.name = "b"
+		self.assertIsNotNone( value.user.__dict__['__versions__'] )
+		del snapshot
+		collect()
+		value.snapshot()
+		collect()
+		value.user.name = "c"
+		self.assertIsNone( value.user.__dict__['__versions__'] )
+	
+	def testDecodedLists( self ) -> None:
+		value = Map.fromJson( '{"edges": [1, 2], "user": {"names": ["a"]}}' )
+		edges = value.edges
+		snapshot = value.snapshot()
+		edges.append( 3 )
+		value.user.names.append( "b" )
+		self.assertEqual( snapshot.__props__(), { "edges": [ 1, 2 ], "user": { "names": [ "a" ] } } )
+	
+
+if __name__ == "__main__":
+	main()
+	
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from json import dumps, loads
+from os.path import abspath, dirname
+from sys import path as paths
+from unittest import main, TestCase
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.typing.map import Map
+
+
+Before:dict = {
+	"id": 1,
+	"name": "a",
+	"user": { "name": "a", "tags": [ "x", "y" ] },
+	"edges": [
+		{ "__typename": "User", "id": "1", "name": "a" },
+		{ "__typename": "User", "id": "2", "name": "b" },
+		{ "__typename": "User", "id": "3", "name": "c" }
+	],
+	"removed": True
+}
+
+Cases:list = [
+	Before,
+	{ **Before, "name": "b", "added": { "x": [ 1 ] } },
+	{ "added": 1, **{ keyset: value for keyset, value in Before.items() if keyset != "removed" } },
+	{ "user": { "tags": [ "y", "x", "z" ], "name": "a" }, "id": 1, "name": "a", "edges": [], "removed": False },
+	{ **Before, "edges": [ Before['edges'][2], { "__typename": "User", "id": "4" }, { **Before['edges'][0], "name": "z" } ] },
+	{ **Before, "user": [ 1, 2 ], "edges": { "id": 1 } },
+	{ "removed": True, "name": "a", "id": 1 },
+	{}
+]
+
+
+class TestPatch( TestCase ):
+	
+	def testRoundTrip( self ) -> None:
+		for lazy in [ False, True ]:
+			for other in Cases:
+				value = Map( Before, lazy=lazy )
+				patch = value.diff( Map( other ) )
+				value.apply( loads( dumps( patch ) ) )
+				self.assertEqual( value.__serialize__(), Map( other ).__serialize__() )
+				self.assertEqual( list( value.keys() ), list( other ) )
+	
+	def testPlainValues( self ) -> None:
+		other = Map({ **Before, "user": Map({ "name": "b" }), "edges": [ *Before['edges'], Map({ "id": "5" }) ] })
+		patch = Map( Before ).diff( other )
+		dumps( patch )
+		self.assertIs( type( patch['user']['{']['name']['='] ), str )
+		self.assertIs( type( patch['edges']['['][-1]['='] ), dict )
+		value = Map( Before )
+		value.apply( patch )
+		value.edges[-1]['id'] = "6"
+		self.assertEqual( other.edges[-1]['id'], "5" )
+	
+	def testUnchanged( self ) -> None:
+		self.assertEqual( Map( Before ).diff( Map( Before ) ), {} )
+		self.assertEqual( Map( Before ).diff( Before ), {} )
+	
+	def testMoveOnly( self ) -> None:
+		other = { "name": "a", **Before }
+		patch = Map( Before ).diff( other )
+		self.assertEqual( set( patch ), { "id", "user", "edges", "removed" } )
+		self.assertTrue( all( operation == { ">": True } for operation in patch.values() ) )
+	
+	def testInvalid( self ) -> None:
+		with self.assertRaises( ValueError ):
+			Map( Before ).apply({ "missing": { "{": {} } })
+		with self.assertRaises( TypeError ):
+			Map( Before ).snapshot().apply({ "id": { "=": 2 } })
+	
+
+if __name__ == "__main__":
+	main()
+	
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from os.path import abspath, dirname
+from sys import path as paths
+from unittest import main, TestCase
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.typing.map import Map
+from society.typing.query import Query
+
+
+Payload:dict = {
+	"data": {
+		"user": {
+			"edges": [
+				{ "node": { "id": "1", "name": "a" } },
+				{ "node": { "id": "2" } },
+				{ "cursor": "x" }
+			],
+			"key.name": True
+		}
+	}
+}
+
+
+class TestQuery( TestCase ):
+	
+	def testParse( self ) -> None:
+		query = Query( "data.user.edges[*].node[\"id\"]" )
+		self.assertEqual( len( query.steps ), 6 )
+		self.assertEqual( query.steps[-1], "id" )
+		self.assertEqual( Query( "edges[-1]" ).steps, ( "edges", -1 ) )
+	
+	def testInvalidExpression( self ) -> None:
+		for expression in [ "", ".data", "data..user", "data[", "data[x]" ]:
+			with self.assertRaises( ValueError ):
+				Query( expression )
+	
+	def testPath( self ) -> None:
+		for collection in [ Payload, Map( Payload ), Map( Payload, lazy=True ) ]:
+			self.assertEqual( Query( "data.user.edges[0].node.name" )( collection ), "a" )
+			self.assertEqual( Query( "data.user.edges[-1].cursor" )( collection ), "x" )
+			self.assertEqual( Query( "data.user[\"key.name\"]" )( collection ), True )
+	
+	def testMissing( self ) -> None:
+		self.assertIsNone( Query( "data.user.edges[9].node" )( Payload ) )
+		self.assertEqual( Query( "data.user.id" )( Payload, default=0 ), 0 )
+		self.assertEqual( Query( "data.user.edges.node" )( Payload, default=0 ), 0 )
+	
+	def testWildcard( self ) -> None:
+		for collection in [ Payload, Map( Payload ), Map( Payload, lazy=True ) ]:
+			self.assertEqual( Query( "data.user.edges[*].node.id" )( collection ), [ "1", "2" ] )
+			self.assertEqual( Query( "data.user.edges.*.cursor" )( collection ), [ "x" ] )
+			self.assertEqual( len( Query( "data.user.edges[*]" )( collection ) ), 3 )
+	
+	def testMany( self ) -> None:
+		query = Query( "data.user.edges[1].node.id" )
+		self.assertEqual( query.many([ Payload, {}, Map( Payload ) ]), [ "2", None, "2" ] )
+	
+
+if __name__ == "__main__":
+	main()
+	
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+#
+# @author Ari Setiawan
+# @create 12.01-2024 14:31
+# @github https://github.com/hxAri/Society
+#
+# Society Copyright (c) 2024 - Ari Setiawan <hxari@proton.me>
+# Society Licence under GNU General Public Licence v3
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Society Program is not affiliated with or endorsed, endorsed at all by
+# Facebook or any other party, if you use the main account to use this
+# tool we as Coders and Developers are not responsible for anything,
+# use it at your own risk, and this is Strictly not for SPAM.
+#
+
+from os.path import abspath, dirname
+from sys import path as paths
+from unittest import main, TestCase
+
+paths.insert( 0, dirname( dirname( abspath( __file__ ) ) ) )
+
+from society.typing.map import Map
+from society.typing.record import generate, infer, Record, Records, source
+
+
+Samples:list = [
+	{
+		"data": {
+			"user": {
+				"__typename": "XDTUserDict",
+				"id": "1",
+				"count": 1,
+				"fromDict": "collide",
+				"__props__": "dunder",
+				"full-name": "a b",
+				"edges": [ { "__typename": "XDTMediaDict", "pk": 1, "owner": { "id": "1" } } ]
+			}
+		}
+	},
+	{ "__typename": "XDTUserDict", "id": "2", "count": 1.5, "other": None }
+]
+
+
+class TestRecords( TestCase ):
+	
+	def testInfer( self ) -> None:
+		schema = infer( Samples )
+		self.assertEqual( set( schema ), { "XDTUserDict", "XDTMediaDict" } )
+		self.assertEqual( schema['XDTUserDict']['count'], { "int", "float" } )
+		self.assertEqual( list( schema['XDTUserDict'] )[:2], [ "id", "count" ] )
+	
+	def testGenerate( self ) -> None:
+		types = generate( source( infer( Samples ) ) )
+		user = types['XDTUserDict']
+		self.assertTrue( issubclass( user, Record ) )
+		self.assertNotIn( "fromDict", user.__slots__ )
+		self.assertNotIn( "__props__", user.__slots__ )
+		self.assertNotIn( "full-name", user.__slots__ )
+		self.assertIn( "count", user.__slots__ )
+	
+	def testConvert( self ) -> None:
+		records = Records.fromSamples( Samples )
+		value = records( Samples[0] )
+		self.assertIsInstance( value, Map )
+		user = value.data.user
+		self.assertEqual( type( user ).__name__, "XDTUserDict" )
+		self.assertEqual( user.id, "1" )
+		self.assertEqual( user['full-name'], "a b" )
+		self.assertEqual( user.edges[0].owner.id, "1" )
+		self.assertEqual( type( user.edges[0] ).__name__, "XDTMediaDict" )
+		self.assertEqual( user.__props__(), Samples[0]['data']['user'] )
+	
+	def testCollidingFields( self ) -> None:
+		user = Records.fromSamples( Samples )( Samples[0] ).data.user
+		self.assertEqual( user['fromDict'], "collide" )
+		self.assertEqual( user['__props__'], "dunder" )
+		self.assertIn( "fromDict", user )
+		self.assertIn( "__props__", user )
+		self.assertNotIn( "__repr__", user )
+		self.assertNotIn( "missing", user )
+		with self.assertRaises( KeyError ):
+			user['fields']
+	
+	def testMissingField( self ) -> None:
+		records = Records.fromSamples( Samples )
+		user = records( Samples[1] )
+		self.assertEqual( user['__typename'], "XDTUserDict" )
+		self.assertNotIn( "edges", user )
+		self.assertIsNone( user['other'] )
+		with self.assertRaises( KeyError ):
+			user['edges']
+	
+
+if __name__ == "__main__":
+	main()
+	